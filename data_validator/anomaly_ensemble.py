@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.ensemble import IsolationForest
+from sklearn.neighbors import LocalOutlierFactor
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import OneClassSVM
+from typing import Dict, List, Optional, Tuple
+
+
+# Detectors the ensemble can run, by their name in statistical_rules.yaml
+ENSEMBLE_DETECTORS = ('isolation_forest', 'local_outlier_factor', 'one_class_svm')
+
+
+def feature_matrix(df: pd.DataFrame, fields: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Numeric feature matrix of the rows with a value for every field.
+
+    Returns:
+        Tuple of (matrix of shape rows x fields, positions of those rows in df)
+    """
+    matrix = np.column_stack([
+        pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=float) for field in fields
+    ])
+    rows = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+    return matrix[rows], rows
+
+
+class NoveltyLOF:
+    """
+    Local Outlier Factor fitted once on historical rows (novelty mode).
+
+    The scaler, the reference points and their neighbor index (KD-tree or
+    ball tree) are built at fit time and pickle with the object, so scoring
+    a batch only runs k-nearest-neighbor queries against history.
+    """
+
+    def __init__(self, fields: List[str], n_neighbors: int = 20, contamination: float = 0.1,
+                 algorithm: str = 'auto', n_jobs: Optional[int] = None):
+        self.fields = list(fields)
+        self.n_neighbors = n_neighbors
+        self.contamination = contamination
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
+        self.scaler: Optional[StandardScaler] = None
+        self.model: Optional[LocalOutlierFactor] = None
+
+    def fit(self, matrix: np.ndarray) -> 'NoveltyLOF':
+        """Fit the scaler and LOF on the historical feature matrix"""
+        self.scaler = StandardScaler().fit(matrix)
+        self.model = LocalOutlierFactor(
+            n_neighbors=min(self.n_neighbors, len(matrix) - 1),
+            contamination=self.contamination,
+            algorithm=self.algorithm,
+            novelty=True,
+            n_jobs=self.n_jobs
+        ).fit(self.scaler.transform(matrix))
+        return self
+
+    def outliers(self, matrix: np.ndarray) -> np.ndarray:
+        """Mask of the rows that are outliers relative to history"""
+        return self.model.predict(self.scaler.transform(matrix)) == -1
+
+
+class AnomalyEnsemble:
+    """
+    Several outlier detectors voting on one shared feature matrix.
+
+    The matrix is standardized once and handed to every detector; the
+    detectors run concurrently in a thread pool (scikit-learn releases the
+    GIL in its heavy loops), and a row is an outlier when at least
+    `voting_threshold` of them flag it.
+    """
+
+    def __init__(self, methods: List[str], contamination: float = 0.1,
+                 voting_threshold: int = 2, max_workers: Optional[int] = None,
+                 n_neighbors: int = 20):
+        unknown = [method for method in methods if method not in ENSEMBLE_DETECTORS]
+        if unknown:
+            raise ValueError(f"Unknown ensemble methods: {unknown}")
+        self.methods = list(methods)
+        self.contamination = contamination
+        self.voting_threshold = voting_threshold
+        self.max_workers = max_workers
+        self.n_neighbors = n_neighbors
+
+    def _detect(self, method: str, features: np.ndarray) -> np.ndarray:
+        """Fit one detector on the features and return its outlier mask"""
+        if method == 'isolation_forest':
+            detector = IsolationForest(contamination=self.contamination, random_state=42)
+        elif method == 'local_outlier_factor':
+            detector = LocalOutlierFactor(n_neighbors=min(self.n_neighbors, len(features) - 1),
+                                          contamination=self.contamination)
+        else:
+            detector = OneClassSVM(nu=self.contamination, gamma='scale')
+        return detector.fit_predict(features) == -1
+
+    def vote(self, matrix: np.ndarray,
+             fitted: Optional[Dict[str, NoveltyLOF]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run every detector on the standardized matrix.
+
+        Args:
+            matrix: Feature matrix without missing values (rows x fields)
+            fitted: Detectors already fitted on history, by method; these
+                score the raw matrix instead of being fitted on the batch
+
+        Returns:
+            Tuple of (outlier votes per row, outlier masks per method x row)
+        """
+        fitted = fitted or {}
+        features = StandardScaler().fit_transform(matrix)
+
+        def detect(method: str) -> np.ndarray:
+            if method in fitted:
+                return fitted[method].outliers(matrix)
+            return self._detect(method, features)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            masks = list(pool.map(detect, self.methods))
+        flags = np.vstack(masks) if masks else np.zeros((0, len(matrix)), dtype=bool)
+        return flags.sum(axis=0), flags
@@ -0,0 +1,623 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+from scipy import stats
+
+from categorical_index import CategoricalIndex
+from schema_inference import ColumnSchema, infer_schema
+from frequency_sketch import CountMinSketch, SpaceSaving, SketchedCategories, sketch_dimensions
+
+
+# Probability levels of the quantile grid stored per numeric field
+QUANTILE_GRID = np.linspace(0.0, 1.0, 101)
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch.
+
+    Values are kept in levels of compactors; level h holds items that each
+    stand for 2**h original values. When a level overflows its capacity it is
+    sorted and every other item is promoted to the next level, so memory
+    stays around 3*k items regardless of how many values were added.
+    Quantiles are exact until the first compaction.
+    """
+
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        # Alternating the promotion offset keeps compaction deterministic and unbiased
+        self._compactions = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add an array of values (NaNs are ignored)"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Merge another sketch into this one"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compactions += other._compactions
+        self._compress()
+        return self
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a level; lower levels get geometrically less room"""
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        """Compact every level that exceeds its capacity"""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved
+                kept = items[len(items) - len(items) % 2:]
+                offset = self._compactions % 2
+                self._compactions += 1
+
+                self.levels[level] = kept
+                self.levels[level + 1] = np.concatenate([
+                    self.levels[level + 1], items[:len(items) - len(kept)][offset::2]
+                ])
+            level += 1
+
+    def quantiles(self, qs) -> np.ndarray:
+        """
+        Estimate quantiles.
+
+        Args:
+            qs: Quantile level or array of levels in [0, 1]
+
+        Returns:
+            Array of estimated quantiles (NaN if the sketch is empty)
+        """
+        qs = np.asarray(qs, dtype=float)
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+        if len(self.levels) == 1:
+            # Nothing compacted yet: same linear interpolation as pandas
+            return np.quantile(self.levels[0], qs)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2.0 ** level)
+            for level, level_items in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        weights = weights[order]
+        positions = (np.cumsum(weights) - weights / 2) / weights.sum()
+        return np.interp(qs, positions, items)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a single quantile"""
+        return float(self.quantiles(q))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch"""
+        return {
+            'k': self.k,
+            'count': self.count,
+            'compactions': self._compactions,
+            'levels': [level.tolist() for level in self.levels]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        """Restore a sketch serialized with to_dict"""
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        sketch._compactions = data['compactions']
+        sketch.levels = [np.asarray(level, dtype=float) for level in data['levels']]
+        return sketch
+
+
+def normaltest_from_moments(n: int, skewness: float, kurtosis: float) -> float:
+    """
+    D'Agostino-Pearson normality test p-value from sample moments.
+
+    Mirrors scipy.stats.normaltest, which only depends on the biased sample
+    skewness, the Fisher kurtosis and the sample size.
+
+    Returns:
+        p-value, or NaN when n < 8
+    """
+    if n < 8 or np.isnan(skewness) or np.isnan(kurtosis):
+        return np.nan
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Skewness test
+        y = skewness * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+        beta2 = (3.0 * (n**2 + 27*n - 70) * (n + 1) * (n + 3) /
+                 ((n - 2.0) * (n + 5) * (n + 7) * (n + 9)))
+        w2 = -1 + np.sqrt(2 * (beta2 - 1))
+        delta = 1 / np.sqrt(0.5 * np.log(w2))
+        alpha = np.sqrt(2.0 / (w2 - 1))
+        y = 1.0 if y == 0 else y
+        z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha)**2 + 1))
+
+        # Kurtosis test (on Pearson kurtosis)
+        b2 = kurtosis + 3.0
+        e = 3.0 * (n - 1) / (n + 1)
+        varb2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+        x = (b2 - e) / varb2**0.5
+        sqrtbeta1 = 6.0 * (n*n - 5*n + 2) / ((n + 7) * (n + 9)) * \
+            ((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3)))**0.5
+        a = 6.0 + 8.0 / sqrtbeta1 * (2.0 / sqrtbeta1 + (1 + 4.0 / (sqrtbeta1**2))**0.5)
+        term1 = 1 - 2 / (9.0 * a)
+        denom = 1 + x * (2 / (a - 4.0))**0.5
+        if denom == 0:
+            return np.nan
+        term2 = np.sign(denom) * ((1 - 2.0 / a) / abs(denom))**(1 / 3)
+        z_kurt = (term1 - term2) / (2 / (9.0 * a))**0.5
+
+    statistic = z_skew * z_skew + z_kurt * z_kurt
+    return float(stats.chi2.sf(statistic, 2))
+
+
+class NumericAccumulator:
+    """
+    Streaming statistics for a numeric column.
+
+    Tracks count, mean and the second to fourth central moments with the
+    pairwise (Welford/Chan/Pebay) update, min/max and a quantile sketch.
+    Chunks are folded in with vectorized per-chunk moments, and two
+    accumulators merge with the same update.
+    """
+
+    def __init__(self, sketch_k: int = 200):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch(sketch_k)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk of values (NaNs are ignored)"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        chunk_mean = values.mean()
+        deviations = values - chunk_mean
+        squared = deviations ** 2
+        self._combine(len(values), chunk_mean, squared.sum(),
+                      (squared * deviations).sum(), (squared ** 2).sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.sketch.update(values)
+
+    def merge(self, other: 'NumericAccumulator') -> 'NumericAccumulator':
+        """Merge another accumulator into this one"""
+        if other.count == 0:
+            return self
+        self._combine(other.count, other.mean, other.m2, other.m3, other.m4)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float, m3_b: float, m4_b: float) -> None:
+        """Combine central moments of another partition into this one"""
+        n_a = self.count
+        if n_a == 0:
+            self.count, self.mean, self.m2, self.m3, self.m4 = n_b, mean_b, m2_b, m3_b, m4_b
+            return
+
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+        m2_a, m3_a = self.m2, self.m3
+
+        self.m4 = (self.m4 + m4_b
+                   + delta * delta_n**3 * n_a * n_b * (n_a*n_a - n_a*n_b + n_b*n_b)
+                   + 6 * delta_n**2 * (n_a*n_a * m2_b + n_b*n_b * m2_a)
+                   + 4 * delta_n * (n_a * m3_b - n_b * m3_a))
+        self.m3 = (m3_a + m3_b
+                   + delta * delta_n**2 * n_a * n_b * (n_a - n_b)
+                   + 3 * delta_n * (n_a * m2_b - n_b * m2_a))
+        self.m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+        self.mean = self.mean + delta_n * n_b
+        self.count = n
+
+    def to_stats(self) -> Optional[Dict[str, Any]]:
+        """Produce the same statistics dictionary as a full-history pass"""
+        if self.count == 0:
+            return None
+
+        n = self.count
+        q1, median, q3 = self.sketch.quantiles([0.25, 0.5, 0.75])
+        stats_dict = {
+            'mean': float(self.mean),
+            'median': float(median),
+            'std': float(np.sqrt(self.m2 / (n - 1))) if n > 1 else float('nan'),
+            'min': float(self.min),
+            'max': float(self.max),
+            'count': n,
+            'q1': float(q1),
+            'q3': float(q3),
+        }
+
+        iqr = stats_dict['q3'] - stats_dict['q1']
+        stats_dict['iqr'] = iqr
+        stats_dict['lower_fence'] = stats_dict['q1'] - 1.5 * iqr
+        stats_dict['upper_fence'] = stats_dict['q3'] + 1.5 * iqr
+
+        # Biased skewness and Fisher kurtosis, as scipy.stats computes them
+        if self.m2 > 0:
+            skewness = np.sqrt(n) * self.m3 / self.m2**1.5
+            kurtosis = n * self.m4 / self.m2**2 - 3.0
+        else:
+            skewness = kurtosis = np.nan
+        p_value = normaltest_from_moments(n, skewness, kurtosis)
+
+        stats_dict['is_normal'] = bool(p_value > 0.05)
+        stats_dict['skewness'] = float(skewness)
+        stats_dict['kurtosis'] = float(kurtosis)
+
+        # The sketch may have compacted the extremes away, so pin them
+        quantiles = self.sketch.quantiles(QUANTILE_GRID)
+        quantiles[0] = self.min
+        quantiles[-1] = self.max
+        stats_dict['quantiles'] = quantiles
+        return stats_dict
+
+
+class CategoricalAccumulator:
+    """Exact streaming value counts for a categorical column"""
+
+    def __init__(self):
+        self.counts: Dict[Any, int] = {}
+
+    def update(self, values: pd.Series) -> None:
+        """Add a chunk of values (missing values are ignored)"""
+        for value, count in values.dropna().value_counts(sort=False).items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+
+    def merge(self, other: 'CategoricalAccumulator') -> 'CategoricalAccumulator':
+        """Merge another accumulator into this one"""
+        for value, count in other.counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        return self
+
+    def to_stats(self) -> Optional[Dict[str, Any]]:
+        """Produce the same statistics dictionary as a full-history pass"""
+        if not self.counts:
+            return None
+        value_counts = pd.Series(self.counts, dtype=np.int64)
+        value_counts = value_counts.sort_values(ascending=False, kind='stable')
+        return categorical_stats_from_counts(value_counts)
+
+
+class CategoricalSketchAccumulator:
+    """
+    Bounded-memory streaming counts for a categorical column.
+
+    Tracks the heaviest values exactly-or-nearly with a Space-Saving summary
+    and everything else in a Count-Min sketch, within a fixed memory budget.
+    Accumulators with the same budget merge across shards.
+    """
+
+    def __init__(self, memory_bytes: int = 1 << 20):
+        self.memory_bytes = memory_bytes
+        capacity, width = sketch_dimensions(memory_bytes)
+        self.top = SpaceSaving(capacity)
+        self.sketch = CountMinSketch(width)
+        self.total_count = 0
+
+    def update(self, values: pd.Series) -> None:
+        """Add a chunk of values (missing values are ignored)"""
+        value_counts = values.dropna().value_counts(sort=False)
+        # Unused categories of a category dtype show up with zero counts
+        value_counts = value_counts[value_counts > 0]
+        if len(value_counts) == 0:
+            return
+        value_counts.index = pd.Index(value_counts.index, dtype=object)
+        self.total_count += int(value_counts.sum())
+        self.sketch.update(value_counts.index.to_numpy(dtype=object), value_counts.to_numpy())
+        self.top.update_counts(value_counts)
+
+    def merge(self, other: 'CategoricalSketchAccumulator') -> 'CategoricalSketchAccumulator':
+        """Merge an accumulator with the same memory budget into this one"""
+        self.sketch.merge(other.sketch)
+        self.top.merge(other.top)
+        self.total_count += other.total_count
+        return self
+
+    def to_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Produce categorical statistics in the usual layout.
+
+        unique_values and value_counts cover the tracked top-K only, and
+        unique_count is estimated from the sketch. 'index' holds
+        SketchedCategories instead of a CategoricalIndex.
+        """
+        if self.total_count == 0:
+            return None
+        counts = self.top.counts
+        index = SketchedCategories(list(counts.index), counts.to_numpy(),
+                                   self.top.errors.to_numpy(), self.sketch, self.total_count,
+                                   self.top.floor())
+        return {
+            'unique_values': list(counts.index),
+            'value_counts': counts.to_dict(),
+            'total_count': self.total_count,
+            'unique_count': max(len(counts), self.sketch.distinct_estimate()),
+            'most_common': counts.index[0],
+            'most_common_freq': float(counts.iloc[0] / self.total_count),
+            # Entropy of the tracked values only
+            'entropy': float(stats.entropy(counts.to_numpy())),
+            'sketched': True,
+            'index': index
+        }
+
+
+def categorical_stats_from_counts(value_counts: pd.Series) -> Dict[str, Any]:
+    """
+    Build categorical baseline statistics from sorted value counts.
+
+    Args:
+        value_counts: Counts per value, most common first
+
+    Returns:
+        Dictionary of categorical statistics
+    """
+    total_count = int(value_counts.sum())
+    return {
+        'unique_values': list(value_counts.index),
+        'value_counts': value_counts.to_dict(),
+        'total_count': total_count,
+        'unique_count': len(value_counts),
+        'most_common': value_counts.index[0] if len(value_counts) > 0 else None,
+        'most_common_freq': float(value_counts.iloc[0] / total_count) if len(value_counts) > 0 else 0,
+        'entropy': float(stats.entropy(value_counts.values)),
+        'index': CategoricalIndex.from_value_counts(value_counts)
+    }
+
+
+class CorrelationAccumulator:
+    """
+    Streaming correlation matrix over a fixed set of numeric columns.
+
+    Only rows where every column is present contribute, so results match
+    pandas' pairwise-complete correlation whenever the data has no gaps.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self.count = 0
+        self.mean = np.zeros(len(columns))
+        self.comoment = np.zeros((len(columns), len(columns)))
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add the complete rows of a chunk"""
+        missing = [column for column in self.columns if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"Chunk is missing correlation columns: {missing}")
+        values = chunk[self.columns].to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return
+        chunk_mean = values.mean(axis=0)
+        deviations = values - chunk_mean
+        self._combine(len(values), chunk_mean, deviations.T @ deviations)
+
+    def merge(self, other: 'CorrelationAccumulator') -> 'CorrelationAccumulator':
+        """Merge another accumulator over the same columns into this one"""
+        if other.count > 0:
+            self._combine(other.count, other.mean, other.comoment)
+        return self
+
+    def _combine(self, n_b: int, mean_b: np.ndarray, comoment_b: np.ndarray) -> None:
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.comoment = self.comoment + comoment_b + np.outer(delta, delta) * n_a * n_b / n
+        self.mean = self.mean + delta * n_b / n
+        self.count = n
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Correlation matrix in DataFrame.corr().to_dict() layout"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.sqrt(np.diag(self.comoment))
+            correlation = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(correlation, index=self.columns, columns=self.columns).to_dict()
+
+    def multivariate_stats(self) -> Optional[Dict[str, Any]]:
+        """Mean vector and covariance Cholesky factor, see multivariate_stats()"""
+        if self.count < 2:
+            return None
+        return multivariate_stats(self.columns, self.count, self.mean,
+                                  self.comoment / (self.count - 1))
+
+
+def multivariate_stats(columns: List[str], count: int, mean: np.ndarray,
+                       covariance: np.ndarray) -> Optional[Dict[str, Any]]:
+    """
+    Baseline for multivariate (Mahalanobis) checks over numeric fields.
+
+    Fields without variance are dropped since they make the covariance
+    singular; the rest are kept if their covariance is positive definite.
+
+    Args:
+        columns: Numeric fields in covariance order
+        count: Number of complete rows the moments were computed from
+        mean: Mean vector
+        covariance: Sample covariance matrix
+
+    Returns:
+        Dictionary with fields, count, mean and the lower Cholesky factor of
+        the covariance, or None if no usable covariance exists
+    """
+    keep = np.flatnonzero(np.diag(covariance) > 0)
+    if len(keep) < 2 or count <= len(keep):
+        return None
+    try:
+        cholesky = np.linalg.cholesky(covariance[np.ix_(keep, keep)])
+    except np.linalg.LinAlgError:
+        # Collinear fields; the combination can't be scored
+        return None
+    return {
+        'fields': [columns[i] for i in keep],
+        'count': int(count),
+        'mean': np.asarray(mean, dtype=float)[keep],
+        'cholesky': cholesky
+    }
+
+
+class BaselineAccumulator:
+    """
+    Builds StatisticalValidator baseline statistics from chunks of history.
+
+    Feed DataFrame chunks with update(); accumulators built by different
+    workers or on different days combine with merge(). finalize() returns
+    the same baseline_stats/field_types structures as
+    StatisticalValidator.calculate_baseline_stats, with median and quartiles
+    estimated from quantile sketches.
+
+    The first chunk fixes the schema (see infer_schema): identifier,
+    timestamp and free-text columns are not profiled, and every later chunk
+    and merged accumulator must have the same columns and kinds.
+    """
+
+    def __init__(self, sketch_k: int = 200, categorical_memory: Optional[int] = None,
+                 sample_size: int = 10000):
+        self.sketch_k = sketch_k
+        # Bytes per categorical field; set to keep bounded-memory sketches instead of exact counts
+        self.categorical_memory = categorical_memory
+        self.sample_size = sample_size
+        self.schema: Optional[Dict[str, ColumnSchema]] = None
+        self.field_types: Dict[str, str] = {}
+        self.numeric: Dict[str, NumericAccumulator] = {}
+        self.categorical: Dict[str, Any] = {}
+        self.correlation: Optional[CorrelationAccumulator] = None
+
+    def _set_schema(self, schema: Dict[str, ColumnSchema]) -> None:
+        """Create the per-column accumulators for a schema"""
+        self.schema = dict(schema)
+        for column, column_schema in self.schema.items():
+            if column_schema.kind == 'numeric':
+                self.field_types[column] = 'numeric'
+                self.numeric[column] = NumericAccumulator(self.sketch_k)
+            elif column_schema.kind == 'categorical':
+                self.field_types[column] = 'categorical'
+                self.categorical[column] = self._new_categorical()
+        if len(self.numeric) > 1:
+            self.correlation = CorrelationAccumulator(list(self.numeric))
+
+    def _check_columns(self, columns: List[str]) -> None:
+        """Raise if a chunk doesn't have exactly the schema's columns"""
+        missing = [column for column in self.schema if column not in columns]
+        unexpected = [column for column in columns if column not in self.schema]
+        if missing or unexpected:
+            raise ValueError(f"Chunk columns don't match the baseline schema "
+                             f"(missing: {missing}, unexpected: {unexpected})")
+
+    @staticmethod
+    def _numeric_values(column: str, values: pd.Series) -> np.ndarray:
+        """Float array of a numeric column; raises if it holds values that aren't numbers"""
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            converted = pd.to_numeric(values, errors='coerce')
+            if converted.notna().sum() < values.notna().sum():
+                raise ValueError(f"Column {column} is numeric in the baseline schema "
+                                 f"but has non-numeric values")
+            values = converted
+        return values.to_numpy(dtype=float, na_value=np.nan)
+
+    def update(self, chunk: pd.DataFrame) -> 'BaselineAccumulator':
+        """Fold a chunk of historical records into the accumulator"""
+        if self.schema is None:
+            self._set_schema(infer_schema(chunk, self.sample_size))
+        else:
+            self._check_columns(list(chunk.columns))
+
+        for column, field_type in self.field_types.items():
+            if field_type == 'numeric':
+                self.numeric[column].update(self._numeric_values(column, chunk[column]))
+            else:
+                self.categorical[column].update(chunk[column])
+
+        if self.correlation is not None:
+            self.correlation.update(chunk)
+
+        return self
+
+    def _new_categorical(self):
+        if self.categorical_memory is not None:
+            return CategoricalSketchAccumulator(self.categorical_memory)
+        return CategoricalAccumulator()
+
+    def merge(self, other: 'BaselineAccumulator') -> 'BaselineAccumulator':
+        """Merge an accumulator built on another shard of history with the same schema"""
+        if other.schema is None:
+            return self
+        if self.schema is None:
+            self._set_schema(other.schema)
+        else:
+            kinds = {column: column_schema.kind for column, column_schema in self.schema.items()}
+            other_kinds = {column: column_schema.kind for column, column_schema in other.schema.items()}
+            if kinds != other_kinds:
+                raise ValueError(f"Cannot merge accumulators with different schemas: "
+                                 f"{kinds} vs {other_kinds}")
+
+        for column, accumulator in other.numeric.items():
+            self.numeric[column].merge(accumulator)
+        for column, accumulator in other.categorical.items():
+            self.categorical[column].merge(accumulator)
+
+        if other.correlation is not None:
+            if self.correlation is None or self.correlation.columns != other.correlation.columns:
+                raise ValueError(f"Cannot merge correlations over different columns: "
+                                 f"{self.correlation.columns if self.correlation else []} "
+                                 f"vs {other.correlation.columns}")
+            self.correlation.merge(other.correlation)
+
+        return self
+
+    def finalize(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Produce baseline statistics.
+
+        Returns:
+            Tuple of (baseline_stats, field_types)
+        """
+        baseline_stats = {}
+        field_types = {}
+
+        for column, field_type in self.field_types.items():
+            if field_type == 'numeric':
+                column_stats = self.numeric[column].to_stats()
+            else:
+                column_stats = self.categorical[column].to_stats()
+
+            field_types[column] = field_type
+            if column_stats is not None:
+                baseline_stats[column] = column_stats
+
+        if self.correlation is not None and self.correlation.count > 0:
+            baseline_stats['correlations'] = self.correlation.to_dict()
+            multivariate = self.correlation.multivariate_stats()
+            if multivariate is not None:
+                baseline_stats['multivariate'] = multivariate
+
+        return baseline_stats, field_types
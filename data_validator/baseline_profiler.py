@@ -0,0 +1,191 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from scipy import stats
+
+from baseline_builder import categorical_stats_from_counts, QUANTILE_GRID
+
+
+def numeric_column_stats(values: np.ndarray) -> Optional[Dict[str, Any]]:
+    """
+    Calculate baseline statistics for a numeric column.
+
+    Args:
+        values: Column values, possibly containing NaN
+
+    Returns:
+        Dictionary of statistics, or None if the column has no values
+    """
+    # Columns may arrive downcast to 32 bits; accumulate in float64 regardless
+    values = pd.Series(np.asarray(values, dtype=np.float64)).dropna()
+
+    if len(values) == 0:
+        return None
+
+    # Basic statistics
+    stats_dict = {
+        'mean': float(values.mean()),
+        'median': float(values.median()),
+        'std': float(values.std()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'count': len(values),
+        'q1': float(values.quantile(0.25)),
+        'q3': float(values.quantile(0.75)),
+    }
+
+    # IQR calculations
+    iqr = stats_dict['q3'] - stats_dict['q1']
+    stats_dict['iqr'] = iqr
+    stats_dict['lower_fence'] = stats_dict['q1'] - 1.5 * iqr
+    stats_dict['upper_fence'] = stats_dict['q3'] + 1.5 * iqr
+
+    # Distribution analysis
+    try:
+        # Test for normality
+        _, p_value = stats.normaltest(values)
+        stats_dict['is_normal'] = p_value > 0.05
+
+        # Skewness and kurtosis
+        stats_dict['skewness'] = float(stats.skew(values))
+        stats_dict['kurtosis'] = float(stats.kurtosis(values))
+    except:
+        stats_dict['is_normal'] = False
+        stats_dict['skewness'] = 0
+        stats_dict['kurtosis'] = 0
+
+    # Quantile grid for percentile ranks, so validation never needs the raw history
+    stats_dict['quantiles'] = np.quantile(values.to_numpy(dtype=float), QUANTILE_GRID)
+
+    return stats_dict
+
+
+def category_counts(codes: np.ndarray, n_categories: int) -> np.ndarray:
+    """Count occurrences of each factorized category code (-1 marks missing values)"""
+    return np.bincount(codes[codes >= 0], minlength=n_categories)
+
+
+def categorical_column_stats(counts: np.ndarray, uniques: pd.Index) -> Optional[Dict[str, Any]]:
+    """
+    Calculate baseline statistics for a categorical column from category counts.
+
+    Args:
+        counts: Count per category code
+        uniques: Category values in code order (first appearance)
+
+    Returns:
+        Dictionary of statistics, or None if the column has no values
+    """
+    if counts.sum() == 0:
+        return None
+    value_counts = pd.Series(counts, index=uniques)
+    # Stable sort so ties keep first-appearance order on every run
+    value_counts = value_counts.sort_values(ascending=False, kind='stable')
+    return categorical_stats_from_counts(value_counts)
+
+
+def categorical_counts(values: np.ndarray) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Factorize raw categorical values and count each category.
+
+    Returns:
+        Tuple of (count per category, categories in first-appearance order)
+    """
+    codes, uniques = pd.factorize(values)
+    return category_counts(codes, len(uniques)), pd.Index(uniques, dtype=object)
+
+
+def _profile_array(kind: str, values: np.ndarray, n_categories: int) -> Any:
+    """Run the expensive part of a column profile on a raw array"""
+    if kind == 'numeric':
+        return numeric_column_stats(values)
+    return category_counts(values, n_categories)
+
+
+def _profile_shared_array(kind: str, name: str, shape: Tuple[int, ...], dtype: str,
+                          n_categories: int) -> Any:
+    """Worker entry point: profile a column stored in shared memory"""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return _profile_array(kind, np.ndarray(shape, dtype=dtype, buffer=block.buf), n_categories)
+    finally:
+        block.close()
+
+
+def _column_array(data: pd.DataFrame, column: str, kind: str) -> Tuple[np.ndarray, Optional[pd.Index]]:
+    """Prepare the plain NumPy array a worker profiles for a column"""
+    series = data[column]
+    if kind == 'categorical':
+        # Only the integer codes go to the workers; the categories stay here
+        codes, uniques = pd.factorize(series)
+        return codes, pd.Index(uniques, dtype=object)
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy(), None
+    # Nullable extension dtypes have no plain buffer to share
+    return series.to_numpy(dtype=float, na_value=np.nan), None
+
+
+def profile_columns(data: pd.DataFrame, numeric_columns: List[str],
+                    categorical_columns: List[str], workers: int = 1) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Profile numeric and categorical columns, optionally in a process pool.
+
+    Categorical columns are factorized here, and numeric arrays and
+    category codes are placed in shared memory so workers read them without
+    pickling; workers return statistics or per-code counts. Every column is
+    profiled by the same functions whatever the worker count, so the
+    results do not depend on it.
+
+    Args:
+        data: DataFrame containing historical records
+        numeric_columns: Columns to profile as numeric
+        categorical_columns: Columns to profile as categorical
+        workers: Number of worker processes; 1 profiles in-process
+
+    Returns:
+        Statistics dictionary (or None for empty columns) per column
+    """
+    jobs = [(column, 'numeric') for column in numeric_columns]
+    jobs += [(column, 'categorical') for column in categorical_columns]
+
+    arrays = {}
+    uniques = {}
+    for column, kind in jobs:
+        arrays[column], uniques[column] = _column_array(data, column, kind)
+
+    def n_categories(column: str) -> int:
+        return len(uniques[column]) if uniques[column] is not None else 0
+
+    if workers <= 1 or len(jobs) <= 1:
+        raw = {column: _profile_array(kind, arrays[column], n_categories(column))
+               for column, kind in jobs}
+    else:
+        blocks = []
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for column, kind in jobs:
+                    array = arrays[column]
+                    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                    blocks.append(block)
+                    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                    futures[column] = executor.submit(
+                        _profile_shared_array, kind, block.name, array.shape,
+                        array.dtype.str, n_categories(column)
+                    )
+                # Collect in column order so the output never depends on scheduling
+                raw = {column: futures[column].result() for column, _ in jobs}
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    profiles = {}
+    for column, kind in jobs:
+        if kind == 'numeric':
+            profiles[column] = raw[column]
+        else:
+            profiles[column] = categorical_column_stats(raw[column], uniques[column])
+    return profiles
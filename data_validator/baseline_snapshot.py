@@ -0,0 +1,284 @@
+import json
+import mmap
+import struct
+import numpy as np
+from typing import Dict, List, Any, Tuple
+
+from categorical_index import CategoricalIndex, CategoryCounts
+from frequency_sketch import CountMinSketch, SketchedCategories
+
+
+# File layout:
+#   magic (8 bytes) | format version (uint32) | reserved (uint32) | header length (uint64)
+#   JSON header, padded to 8 bytes
+#   data section: raw little-endian arrays, each aligned to 8 bytes
+# The header describes every field and where its arrays live in the data section.
+SNAPSHOT_MAGIC = b'SVSNAP\x00\x00'
+SNAPSHOT_VERSION = 1
+_PREAMBLE = struct.Struct('<8sIIQ')
+_ALIGNMENT = 8
+
+# Categorical stats rebuilt from the stored dictionary instead of being written out
+_CATEGORICAL_DERIVED = ('unique_values', 'value_counts', 'index')
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _json_value(obj: Any) -> Any:
+    """Convert NumPy scalars that json can't handle natively"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _SectionWriter:
+    """Lays out arrays back to back in the data section"""
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> Dict[str, Any]:
+        """Append an array and return its header entry"""
+        array = np.ascontiguousarray(array)
+        if array.dtype.byteorder == '>':
+            array = array.astype(array.dtype.newbyteorder('<'))
+        offset = _aligned(self.size)
+        if offset > self.size:
+            self.chunks.append(b'\x00' * (offset - self.size))
+        self.chunks.append(array.tobytes())
+        self.size = offset + array.nbytes
+        return {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+
+
+def _split_stats(stats: Dict[str, Any], sections: _SectionWriter,
+                 skip: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Store array-valued stats as sections and keep everything else for the JSON header"""
+    entry = {'arrays': {}, 'extra': {}}
+    for key, value in stats.items():
+        if key in skip:
+            continue
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            entry['arrays'][key] = sections.add(value)
+        else:
+            entry['extra'][key] = value
+    return entry
+
+
+def _numeric_table_columns(numeric_stats: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Scalar stats shared by every numeric field, with the Python type to restore"""
+    if not numeric_stats:
+        return []
+    columns = []
+    for key in numeric_stats[0]:
+        kinds = set()
+        for stats in numeric_stats:
+            value = stats.get(key)
+            if isinstance(value, (bool, np.bool_)):
+                kinds.add('bool')
+            elif isinstance(value, (int, np.integer)):
+                kinds.add('int')
+            elif isinstance(value, (float, np.floating)):
+                kinds.add('float')
+            else:
+                kinds.add(None)
+        if None in kinds:
+            continue
+        # Mixed int/float (e.g. skewness falling back to 0) restores as float
+        kind = kinds.pop() if len(kinds) == 1 else ('float' if 'bool' not in kinds else None)
+        if kind is not None:
+            columns.append((key, kind))
+    return columns
+
+
+def write_snapshot(filename: str, baseline_stats: Dict[str, Any], field_types: Dict[str, str]) -> None:
+    """
+    Write baseline statistics to a binary snapshot file.
+
+    Scalar numeric stats go into one float64 table (fields x stats),
+    categorical dictionaries into a value blob plus an int64 counts array
+    (with error counts and the Count-Min table for sketched fields), and the
+    correlation matrix into a dense float64 array.
+
+    Args:
+        baseline_stats: Baseline statistics as built by StatisticalValidator
+        field_types: Field type ('numeric' or 'categorical') per field
+    """
+    sections = _SectionWriter()
+    header = {
+        'format_version': SNAPSHOT_VERSION,
+        'field_types': dict(field_types),
+        'numeric': {},
+        'categorical': {},
+        'auxiliary': {}
+    }
+
+    numeric_fields = [field for field, kind in field_types.items()
+                      if kind == 'numeric' and field in baseline_stats]
+    numeric_stats = [baseline_stats[field] for field in numeric_fields]
+    columns = _numeric_table_columns(numeric_stats)
+    table = np.array([[float(stats[key]) for key, _ in columns] for stats in numeric_stats],
+                     dtype=np.float64).reshape(len(numeric_fields), len(columns))
+    header['numeric'] = {
+        'fields': numeric_fields,
+        'columns': [key for key, _ in columns],
+        'column_types': [kind for _, kind in columns],
+        'table': sections.add(table),
+        'per_field': {
+            field: _split_stats(stats, sections, skip=tuple(key for key, _ in columns))
+            for field, stats in zip(numeric_fields, numeric_stats)
+        }
+    }
+
+    for field, kind in field_types.items():
+        if kind != 'categorical' or field not in baseline_stats:
+            continue
+        stats = baseline_stats[field]
+        index = stats['index']
+        values = index.values
+        if all(isinstance(value, str) and '\x00' not in value for value in values):
+            encoding = 'nul'
+            blob = '\x00'.join(values).encode('utf-8')
+        else:
+            encoding = 'json'
+            blob = json.dumps(values, default=_json_value).encode('utf-8')
+        entry = _split_stats(stats, sections, skip=_CATEGORICAL_DERIVED)
+        entry.update({
+            'count': len(values),
+            'value_encoding': encoding,
+            'values': sections.add(np.frombuffer(blob, dtype=np.uint8)),
+            'counts': sections.add(index.counts.astype(np.int64))
+        })
+        if isinstance(index, SketchedCategories):
+            entry['sketch'] = {
+                'errors': sections.add(index.errors.astype(np.int64)),
+                'table': sections.add(index.sketch.table.astype(np.int64)),
+                'total_count': index.total_count,
+                'floor': index.floor
+            }
+        header['categorical'][field] = entry
+
+    for key, value in baseline_stats.items():
+        if key in field_types:
+            continue
+        if key == 'correlations':
+            fields = list(value)
+            # Outer keys are columns, as in DataFrame.corr().to_dict()
+            matrix = np.array([[value[col].get(row, np.nan) for col in fields] for row in fields],
+                              dtype=np.float64).reshape(len(fields), len(fields))
+            header['auxiliary'][key] = {'kind': 'matrix', 'fields': fields,
+                                        'matrix': sections.add(matrix)}
+        elif isinstance(value, dict):
+            entry = _split_stats(value, sections)
+            entry['kind'] = 'dict'
+            header['auxiliary'][key] = entry
+        else:
+            header['auxiliary'][key] = {'kind': 'value', 'value': value}
+
+    header_bytes = json.dumps(header, default=_json_value).encode('utf-8')
+    data_start = _aligned(_PREAMBLE.size + len(header_bytes))
+
+    with open(filename, 'wb') as f:
+        f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b'\x00' * (data_start - _PREAMBLE.size - len(header_bytes)))
+        for chunk in sections.chunks:
+            f.write(chunk)
+
+
+class _SectionReader:
+    """Exposes data-section arrays as read-only views of the mapped file"""
+
+    def __init__(self, buffer: mmap.mmap, data_start: int):
+        self.buffer = buffer
+        self.data_start = data_start
+
+    def array(self, entry: Dict[str, Any]) -> np.ndarray:
+        shape = tuple(entry['shape'])
+        return np.frombuffer(self.buffer, dtype=np.dtype(entry['dtype']),
+                             count=int(np.prod(shape, dtype=np.int64)),
+                             offset=self.data_start + entry['offset']).reshape(shape)
+
+    def merge(self, entry: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the arrays and header values of a _split_stats entry to stats"""
+        stats.update(entry['extra'])
+        for key, array_entry in entry['arrays'].items():
+            stats[key] = self.array(array_entry)
+        return stats
+
+
+def read_snapshot(filename: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Load a snapshot written by write_snapshot.
+
+    The file is memory-mapped and every array is a read-only view into the
+    mapping, so loading copies nothing but the small JSON header and the
+    categorical value strings. The mapping stays open for as long as any
+    of those arrays is referenced.
+
+    Returns:
+        Tuple of (baseline_stats, field_types)
+    """
+    with open(filename, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < _PREAMBLE.size:
+        raise ValueError(f"{filename} is not a baseline snapshot")
+    magic, version, _, header_length = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"{filename} is not a baseline snapshot")
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported baseline snapshot version {version} in {filename}")
+
+    header = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length].decode('utf-8'))
+    reader = _SectionReader(buffer, _aligned(_PREAMBLE.size + header_length))
+    baseline_stats = {}
+
+    numeric = header['numeric']
+    table = reader.array(numeric['table'])
+    casts = {'bool': bool, 'int': int, 'float': float}
+    for row, field in enumerate(numeric['fields']):
+        stats = {
+            key: casts[kind](value)
+            for key, kind, value in zip(numeric['columns'], numeric['column_types'], table[row].tolist())
+        }
+        baseline_stats[field] = reader.merge(numeric['per_field'][field], stats)
+
+    for field, entry in header['categorical'].items():
+        blob = reader.array(entry['values']).tobytes()
+        if entry['value_encoding'] == 'nul':
+            values = blob.decode('utf-8').split('\x00') if entry['count'] > 0 else []
+        else:
+            values = json.loads(blob.decode('utf-8'))
+        if 'sketch' in entry:
+            sketch = entry['sketch']
+            table = reader.array(sketch['table'])
+            index = SketchedCategories(values, reader.array(entry['counts']),
+                                       reader.array(sketch['errors']),
+                                       CountMinSketch(table.shape[1], table.shape[0], table),
+                                       sketch['total_count'], sketch['floor'])
+        else:
+            index = CategoricalIndex(values, reader.array(entry['counts']))
+        stats = {
+            'unique_values': index.values,
+            'value_counts': CategoryCounts(index),
+            'index': index
+        }
+        baseline_stats[field] = reader.merge(entry, stats)
+
+    for key, entry in header['auxiliary'].items():
+        if entry['kind'] == 'matrix':
+            fields = entry['fields']
+            matrix = reader.array(entry['matrix'])
+            baseline_stats[key] = {
+                col: {row: value for row, value in zip(fields, matrix[:, j].tolist())}
+                for j, col in enumerate(fields)
+            }
+        elif entry['kind'] == 'dict':
+            baseline_stats[key] = reader.merge(entry, {})
+        else:
+            baseline_stats[key] = entry['value']
+
+    return baseline_stats, header['field_types']
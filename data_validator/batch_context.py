@@ -0,0 +1,121 @@
+import threading
+import numpy as np
+import pandas as pd
+from scipy import stats
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
+
+
+class BatchContext:
+    """
+    A batch of records ingested once and shared by every detector.
+
+    Accepts a list of records, a DataFrame or anything with to_pandas()
+    (such as a pyarrow Table). Columns are converted once; timestamps, if
+    the batch has any, are parsed and sorted once; derived columns (present
+    values, numeric arrays, z-scores, calendar periods) are computed on
+    first use and cached for the remaining detectors.
+    """
+
+    def __init__(self, data: Union[List[Dict[str, Any]], pd.DataFrame, Any]):
+        if isinstance(data, pd.DataFrame):
+            self.df = data
+        elif hasattr(data, 'to_pandas'):
+            self.df = data.to_pandas()
+        else:
+            self.df = pd.DataFrame(data)
+        self._cache: Dict[Any, Any] = {}
+        # One lock per product, so detectors running concurrently compute it once
+        self._locks: Dict[Any, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @classmethod
+    def of(cls, data: Union['BatchContext', List[Dict[str, Any]], pd.DataFrame, Any]) -> 'BatchContext':
+        """Wrap data in a context, or return it unchanged if it already is one"""
+        return data if isinstance(data, cls) else cls(data)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.df.columns
+
+    def cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return a derived value, computing it on first use"""
+        if key in self._cache:
+            return self._cache[key]
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._cache:
+                self._cache[key] = compute()
+        return self._cache[key]
+
+    def present(self, field: str) -> pd.Series:
+        """Values of a field without missing entries, keeping the original index"""
+        return self.cached(('present', field), lambda: self.df[field].dropna())
+
+    def numeric(self, field: str) -> np.ndarray:
+        """Field as a float array; values that aren't numbers become NaN"""
+        return self.cached(('numeric', field),
+                           lambda: pd.to_numeric(self.df[field], errors='coerce').to_numpy(dtype=float))
+
+    def numeric_present(self, field: str) -> np.ndarray:
+        """Numeric values of a field without NaN"""
+        def compute():
+            values = self.numeric(field)
+            return values[~np.isnan(values)]
+        return self.cached(('numeric_present', field), compute)
+
+    def sorted_numeric(self, field: str) -> np.ndarray:
+        """Numeric values of a field without NaN, sorted"""
+        return self.cached(('sorted', field), lambda: np.sort(self.numeric_present(field)))
+
+    def quartiles(self, field: str) -> Tuple[float, float]:
+        """First and third quartile of the present values within the batch"""
+        def compute():
+            values = self.present(field)
+            return values.quantile(0.25), values.quantile(0.75)
+        return self.cached(('quartiles', field), compute)
+
+    def zscores(self, field: str) -> np.ndarray:
+        """Absolute z-scores of the present values within the batch"""
+        return self.cached(('zscores', field), lambda: np.abs(stats.zscore(self.present(field))))
+
+    @property
+    def timestamps(self) -> Optional[pd.Series]:
+        """Parsed timestamps, or None when the batch has no timestamp column"""
+        def compute():
+            if 'timestamp' not in self.df.columns:
+                return None
+            return pd.to_datetime(self.df['timestamp'])
+        return self.cached('timestamps', compute)
+
+    @property
+    def time_sorted(self) -> pd.DataFrame:
+        """Batch in timestamp order (stable), with the parsed timestamps; as given without them"""
+        def compute():
+            if self.timestamps is None:
+                return self.df
+            order = np.argsort(self.timestamps.to_numpy(), kind='stable')
+            frame = self.df.assign(timestamp=self.timestamps)
+            return frame.iloc[order]
+        return self.cached('time_sorted', compute)
+
+    @property
+    def periods(self) -> Optional[Dict[str, np.ndarray]]:
+        """Month, day of week and hour of every row, or None without timestamps"""
+        def compute():
+            timestamps = self.timestamps
+            if timestamps is None:
+                return None
+            return {
+                'month': timestamps.dt.month.to_numpy(),
+                'day_of_week': timestamps.dt.dayofweek.to_numpy(),
+                'hour': timestamps.dt.hour.to_numpy()
+            }
+        return self.cached('periods', compute)
+
+
+# What the detectors accept as a batch
+BatchData = Union[BatchContext, List[Dict[str, Any]], pd.DataFrame, Any]
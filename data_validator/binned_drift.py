@@ -0,0 +1,86 @@
+import numpy as np
+from scipy import stats
+from typing import Dict, List, Any, Tuple
+
+
+# Drift metrics computed from binned baselines
+BINNED_DRIFT_METRICS = ('psi', 'chi2', 'js')
+
+# Floor for bin proportions, so empty bins don't make PSI infinite
+PROPORTION_FLOOR = 1e-4
+
+
+class BinnedBaseline:
+    """
+    Histogram of a field's history over fixed quantile bins.
+
+    Edges are the interior quantiles of the history, so each bin holds
+    roughly the same share of it; the outer bins extend to +/- infinity.
+    Scoring a new batch bins it with searchsorted and then compares two
+    count vectors, so the cost doesn't depend on the size of the history.
+    """
+
+    def __init__(self, edges: np.ndarray, counts: np.ndarray):
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, bins: int = 10) -> 'BinnedBaseline':
+        """Build quantile bins from historical values"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return cls(np.zeros(0), np.zeros(1, dtype=np.int64))
+        # Ties can make quantiles coincide; duplicate edges would give empty bins
+        edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+        baseline = cls(edges, np.zeros(len(edges) + 1, dtype=np.int64))
+        baseline.counts = baseline.histogram(values)
+        return baseline
+
+    def histogram(self, values: np.ndarray) -> np.ndarray:
+        """Counts of values per bin"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        return np.bincount(np.searchsorted(self.edges, values, side='right'),
+                           minlength=len(self.edges) + 1)
+
+    def _proportions(self, new_counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        expected = np.maximum(self.counts / max(self.counts.sum(), 1), PROPORTION_FLOOR)
+        actual = np.maximum(new_counts / max(new_counts.sum(), 1), PROPORTION_FLOOR)
+        return expected / expected.sum(), actual / actual.sum()
+
+    def psi(self, new_counts: np.ndarray) -> float:
+        """Population Stability Index of new counts against the baseline"""
+        expected, actual = self._proportions(new_counts)
+        return float(((actual - expected) * np.log(actual / expected)).sum())
+
+    def chi_square(self, new_counts: np.ndarray) -> Tuple[float, float]:
+        """
+        Chi-square test that the baseline and new counts share one distribution.
+
+        Returns:
+            Tuple of (chi-square statistic, p-value)
+        """
+        table = np.vstack([self.counts, new_counts]).astype(float)
+        table = table[:, table.sum(axis=0) > 0]
+        if table.shape[1] < 2 or (table.sum(axis=1) == 0).any():
+            return 0.0, 1.0
+        statistic, p_value, _, _ = stats.chi2_contingency(table, correction=False)
+        return float(statistic), float(p_value)
+
+    def js_divergence(self, new_counts: np.ndarray) -> float:
+        """Jensen-Shannon divergence (base 2, between 0 and 1) of new counts from the baseline"""
+        expected = self.counts / max(self.counts.sum(), 1)
+        actual = new_counts / max(new_counts.sum(), 1)
+        mixture = (expected + actual) / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            divergence = (np.where(expected > 0, expected * np.log2(expected / mixture), 0).sum()
+                          + np.where(actual > 0, actual * np.log2(actual / mixture), 0).sum()) / 2
+        return float(divergence)
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {'edges': self.edges.tolist(), 'counts': self.counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Any]]) -> 'BinnedBaseline':
+        return cls(data['edges'], data['counts'])
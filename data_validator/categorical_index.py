@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional
+from collections.abc import Mapping
+
+
+class CategoricalIndex:
+    """
+    Dictionary encoding of the categorical values seen in historical data.
+
+    Every known value maps to an integer code with a precomputed frequency,
+    giving O(1) scalar lookups and hash-based encoding of whole columns.
+    Codes follow value_counts order, so code 0 is the most common value.
+    """
+
+    def __init__(self, values: List[Any], counts: List[int]):
+        self.values = list(values)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.total_count = int(self.counts.sum())
+        if self.total_count > 0:
+            self.frequencies = self.counts / self.total_count
+        else:
+            self.frequencies = np.zeros(len(self.counts))
+        self.codes = {value: code for code, value in enumerate(self.values)}
+        self._lookup_index: Optional[pd.Index] = None
+
+    @classmethod
+    def from_value_counts(cls, value_counts: pd.Series) -> 'CategoricalIndex':
+        """Build an index from a pandas value_counts() result"""
+        return cls(list(value_counts.index), value_counts.to_numpy())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.code(value) >= 0
+
+    def code(self, value: Any) -> int:
+        """Return the code for a value, or -1 if it was never seen"""
+        try:
+            return self.codes.get(value, -1)
+        except TypeError:
+            # Unhashable values can't have been counted
+            return -1
+
+    def frequency(self, value: Any) -> Optional[float]:
+        """Return the historical frequency of a value, or None if it was never seen"""
+        code = self.code(value)
+        if code < 0:
+            return None
+        return self.frequencies[code]
+
+    def encode(self, column: pd.Series) -> np.ndarray:
+        """
+        Map a whole column to integer codes.
+
+        Args:
+            column: Series of categorical values
+
+        Returns:
+            Array of codes, with -1 for values not seen in historical data
+        """
+        if self._lookup_index is None:
+            self._lookup_index = pd.Index(self.values, dtype=object)
+        return self._lookup_index.get_indexer(column)
+
+    def isin(self, column: pd.Series) -> np.ndarray:
+        """Boolean mask of the column values seen in historical data"""
+        return self.encode(column) >= 0
+
+    def frequencies_of(self, column: pd.Series) -> np.ndarray:
+        """Historical frequency per value, NaN for values never seen"""
+        codes = self.encode(column)
+        return np.where(codes >= 0, self.frequencies[codes], np.nan)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index for JSON export"""
+        return {
+            'values': self.values,
+            'counts': self.counts.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CategoricalIndex':
+        """Restore an index exported with to_dict"""
+        return cls(data['values'], data['counts'])
+
+
+class CategoryCounts(Mapping):
+    """
+    Read-only value -> count mapping backed by a CategoricalIndex.
+
+    Stands in for the value_counts dict of baselines loaded from a snapshot,
+    so the counts stay in the index's array instead of being copied.
+    """
+
+    def __init__(self, index: CategoricalIndex):
+        self._index = index
+
+    def __getitem__(self, value: Any) -> int:
+        code = self._index.code(value)
+        if code < 0:
+            raise KeyError(value)
+        return int(self._index.counts[code])
+
+    def __iter__(self):
+        return iter(self._index.values)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,108 @@
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+from typing import Callable, Iterable, List, Tuple
+
+
+# Distances to the nearest centroid kept for estimating the outlier cutoff
+DISTANCE_SAMPLE_SIZE = 10000
+
+
+class ClusteringDetector:
+    """
+    Distance-to-nearest-centroid outlier detector on mini-batch k-means.
+
+    The scaler and the centroids are trained chunk by chunk, and the
+    distance cutoff comes from a fixed-size reservoir sample of training
+    distances, so memory stays constant however long the history is. Rows
+    farther from every centroid than the (1 - outlier_threshold) quantile
+    of those distances are outliers. partial_fit keeps training on new
+    batches as they arrive.
+    """
+
+    def __init__(self, fields: List[str], n_clusters: int = 5, outlier_threshold: float = 0.1,
+                 chunk_size: int = 1000, random_state: int = 42):
+        self.fields = list(fields)
+        self.n_clusters = n_clusters
+        self.outlier_threshold = outlier_threshold
+        self.chunk_size = max(int(chunk_size), n_clusters)
+        self.scaler = StandardScaler()
+        self.kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=self.chunk_size,
+                                      random_state=random_state, n_init=3)
+        self.sample = np.zeros(0, dtype=float)
+        self.seen = 0
+        self._rng = np.random.default_rng(random_state)
+
+    def _chunks(self, matrix: np.ndarray):
+        for start in range(0, len(matrix), self.chunk_size):
+            chunk = matrix[start:start + self.chunk_size]
+            # The first k-means update needs at least n_clusters rows
+            if len(chunk) >= self.n_clusters or self.fitted:
+                yield chunk
+
+    def fit(self, matrix: np.ndarray) -> 'ClusteringDetector':
+        """Train on a feature matrix held in memory"""
+        return self.fit_chunks(lambda: [matrix])
+
+    def fit_chunks(self, chunks: Callable[[], Iterable[np.ndarray]]) -> 'ClusteringDetector':
+        """
+        Train the scaler, then the centroids, then the cutoff, one chunk at a time.
+
+        Args:
+            chunks: Callable returning a fresh iterable of feature-matrix
+                chunks on every call; history is read once per pass
+        """
+        for chunk in self._passes(chunks):
+            self.scaler.partial_fit(chunk)
+        for chunk in self._passes(chunks):
+            self.kmeans.partial_fit(self.scaler.transform(chunk))
+        if self.fitted:
+            for chunk in self._passes(chunks):
+                self._sample_distances(self.distances(chunk))
+        return self
+
+    def _passes(self, chunks: Callable[[], Iterable[np.ndarray]]):
+        for matrix in chunks():
+            yield from self._chunks(matrix)
+
+    @property
+    def fitted(self) -> bool:
+        """Whether the centroids have been trained"""
+        return hasattr(self.kmeans, 'cluster_centers_')
+
+    def partial_fit(self, matrix: np.ndarray) -> 'ClusteringDetector':
+        """Move the centroids towards a new batch and add its distances to the cutoff sample"""
+        for chunk in self._chunks(matrix):
+            self.kmeans.partial_fit(self.scaler.transform(chunk))
+            self._sample_distances(self.distances(chunk))
+        return self
+
+    def _sample_distances(self, distances: np.ndarray) -> None:
+        """Reservoir sampling (Algorithm R), vectorized per chunk"""
+        free = max(0, DISTANCE_SAMPLE_SIZE - len(self.sample))
+        self.sample = np.concatenate([self.sample, distances[:free]])
+        rest = distances[free:]
+        if len(rest):
+            positions = self.seen + free + np.arange(len(rest))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < DISTANCE_SAMPLE_SIZE
+            self.sample[slots[keep]] = rest[keep]
+        self.seen += len(distances)
+
+    def distances(self, matrix: np.ndarray) -> np.ndarray:
+        """Distance of every row to its nearest centroid, in scaled units"""
+        return self.kmeans.transform(self.scaler.transform(matrix)).min(axis=1)
+
+    @property
+    def cutoff(self) -> float:
+        return float(np.quantile(self.sample, 1 - self.outlier_threshold))
+
+    def outliers(self, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score rows against the centroids.
+
+        Returns:
+            Tuple of (nearest-centroid distances, outlier mask)
+        """
+        distances = self.distances(matrix)
+        return distances, distances > self.cutoff
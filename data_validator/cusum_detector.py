@@ -0,0 +1,122 @@
+import json
+import numpy as np
+from typing import Dict, List, Any, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Allowance subtracted from every standardized residual before accumulating
+CUSUM_DRIFT = 0.5
+
+
+class CusumState:
+    """
+    Streaming two-sided CUSUM for a single field (or field/series pair).
+
+    Each value is standardized against the mean and standard deviation of
+    the `window` values before it, and the residual is accumulated into the
+    positive and negative sums. The last `window` values and both sums are
+    carried over between batches, so a change that starts at the end of one
+    batch is still detected in the next.
+    """
+
+    def __init__(self, window: int, threshold: float, drift: float = CUSUM_DRIFT):
+        self.window = int(window)
+        self.threshold = float(threshold)
+        self.drift = float(drift)
+        self.buffer = np.zeros(0, dtype=float)
+        self.cusum_pos = 0.0
+        self.cusum_neg = 0.0
+        # Number of values seen so far, so positions keep counting across batches
+        self.position = 0
+
+    def update(self, values: np.ndarray) -> List[Tuple[int, float, float]]:
+        """
+        Process the next values of the stream.
+
+        Args:
+            values: New values in time order, without missing values
+
+        Returns:
+            List of (stream position, value, CUSUM score) for every detected break
+        """
+        values = np.asarray(values, dtype=float)
+        combined = np.concatenate([self.buffer, values])
+        start = self.position - len(self.buffer)
+        breaks = []
+
+        if len(combined) > self.window:
+            # Rolling stats of the window before every scored value, in one pass
+            windows = sliding_window_view(combined[:-1], self.window)
+            expected = windows.mean(axis=1)
+            std = windows.std(axis=1, ddof=1) if self.window > 1 else np.full(len(windows), np.nan)
+            current = combined[self.window:]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                residuals = (current - expected) / std
+            # The buffer holds at most `window` values, so every scored value is new
+            breaks = self._accumulate(residuals, current, start + self.window)
+
+        self.buffer = combined[-self.window:].copy() if self.window > 0 else combined[:0]
+        self.position += len(values)
+        return breaks
+
+    def _accumulate(self, residuals: np.ndarray, current: np.ndarray,
+                    first_position: int) -> List[Tuple[int, float, float]]:
+        """Sequential CUSUM recursion over precomputed residuals"""
+        breaks = []
+        cusum_pos, cusum_neg = self.cusum_pos, self.cusum_neg
+        threshold, drift = self.threshold, self.drift
+        # Plain floats: the recursion can't be vectorized, so keep the loop cheap
+        for offset, residual in enumerate(residuals.tolist()):
+            if residual != residual or residual in (np.inf, -np.inf):
+                continue
+            cusum_pos = max(0.0, cusum_pos + residual - drift)
+            cusum_neg = max(0.0, cusum_neg - residual - drift)
+            if cusum_pos > threshold or cusum_neg > threshold:
+                breaks.append((first_position + offset, float(current[offset]), max(cusum_pos, cusum_neg)))
+                # Reset after detection
+                cusum_pos = 0.0
+                cusum_neg = 0.0
+        self.cusum_pos, self.cusum_neg = cusum_pos, cusum_neg
+        return breaks
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'window': self.window,
+            'threshold': self.threshold,
+            'drift': self.drift,
+            'buffer': self.buffer.tolist(),
+            'cusum_pos': self.cusum_pos,
+            'cusum_neg': self.cusum_neg,
+            'position': self.position
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CusumState':
+        state = cls(data['window'], data['threshold'], data.get('drift', CUSUM_DRIFT))
+        state.buffer = np.asarray(data['buffer'], dtype=float)
+        state.cusum_pos = data['cusum_pos']
+        state.cusum_neg = data['cusum_neg']
+        state.position = data['position']
+        return state
+
+
+def save_cusum_states(filename: str, states: Dict[Tuple[str, Any], CusumState]) -> None:
+    """
+    Checkpoint CUSUM states to a JSON file.
+
+    Args:
+        filename: Output file
+        states: State per (field, series) key; series is None for whole-field states
+    """
+    entries = [{'field': field, 'series': series, 'state': state.to_dict()}
+               for (field, series), state in states.items()]
+    with open(filename, 'w') as f:
+        json.dump({'cusum_states': entries}, f, indent=2, default=str)
+
+
+def load_cusum_states(filename: str) -> Dict[Tuple[str, Any], CusumState]:
+    """Load CUSUM states written by save_cusum_states"""
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    return {(entry['field'], entry['series']): CusumState.from_dict(entry['state'])
+            for entry in data['cusum_states']}
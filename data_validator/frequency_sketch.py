@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Fixed 16-character keys for pd.util.hash_array, so hashes agree across processes and runs
+_HASH_KEYS = ('cms-row-hash-one', 'cms-row-hash-two')
+
+# Rough memory per tracked top-K entry (value, count, error and index overhead)
+TOP_K_ENTRY_BYTES = 128
+
+
+def _hash_pair(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Two independent 64-bit hashes per value"""
+    values = np.asarray(values, dtype=object)
+    first = pd.util.hash_array(values, hash_key=_HASH_KEYS[0], categorize=False)
+    # An odd step keeps the derived row hashes distinct
+    second = pd.util.hash_array(values, hash_key=_HASH_KEYS[1], categorize=False) | np.uint64(1)
+    return first, second
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch over hashed values.
+
+    Estimates never undercount; with width w and depth d they overcount by
+    at most e/w of the total with probability 1 - exp(-d). Sketches with the
+    same shape merge by adding their tables.
+    """
+
+    def __init__(self, width: int, depth: int = 4, table: Optional[np.ndarray] = None):
+        self.width = int(width)
+        self.depth = int(depth)
+        self.table = table if table is not None else np.zeros((self.depth, self.width), dtype=np.int64)
+
+    def _indices(self, values: np.ndarray) -> np.ndarray:
+        """Column index of every value in every row (double hashing)"""
+        first, second = _hash_pair(values)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        with np.errstate(over='ignore'):
+            return ((first[None, :] + rows * second[None, :]) % np.uint64(self.width)).astype(np.intp)
+
+    def update(self, values: np.ndarray, counts: np.ndarray) -> None:
+        """Add counts for distinct values"""
+        if len(values) == 0:
+            return
+        indices = self._indices(values)
+        counts = np.asarray(counts, dtype=np.int64)
+        for row in range(self.depth):
+            np.add.at(self.table[row], indices[row], counts)
+
+    def estimate(self, values: np.ndarray) -> np.ndarray:
+        """Upper-bound count estimates for values"""
+        if len(values) == 0:
+            return np.zeros(0, dtype=np.int64)
+        indices = self._indices(values)
+        return self.table[np.arange(self.depth)[:, None], indices].min(axis=0)
+
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        """Merge a sketch of the same shape into this one"""
+        if self.table.shape != other.table.shape:
+            raise ValueError("Count-Min sketches must have the same width and depth to merge")
+        self.table = self.table + other.table
+        return self
+
+    def distinct_estimate(self) -> int:
+        """Linear-counting estimate of the number of distinct values added"""
+        empty = int((self.table[0] == 0).sum())
+        if empty == 0:
+            return self.width
+        return int(round(-self.width * np.log(empty / self.width)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'width': self.width, 'depth': self.depth, 'table': self.table.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CountMinSketch':
+        return cls(data['width'], data['depth'], np.asarray(data['table'], dtype=np.int64))
+
+
+class SpaceSaving:
+    """
+    Mergeable Space-Saving summary of the most frequent values.
+
+    Keeps at most `capacity` values with an upper-bound count and the maximum
+    overcount (error) for each; count - error is a lower bound. Values that
+    are not tracked occurred at most floor() times.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = int(capacity)
+        self.counts = pd.Series(dtype=np.int64, index=pd.Index([], dtype=object))
+        self.errors = pd.Series(dtype=np.int64, index=pd.Index([], dtype=object))
+
+    def floor(self) -> int:
+        """Upper bound on the count of any untracked value"""
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    def update_counts(self, value_counts: pd.Series) -> None:
+        """Add exact counts of a chunk (value -> count)"""
+        value_counts = value_counts.sort_values(ascending=False, kind='stable')
+        # Values dropped from the chunk occurred at most as often as the first one dropped
+        chunk_floor = int(value_counts.iloc[self.capacity]) if len(value_counts) > self.capacity else 0
+        kept = value_counts.iloc[:self.capacity].astype(np.int64)
+        self._combine(kept, pd.Series(0, index=kept.index, dtype=np.int64), chunk_floor)
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """Merge a summary built on another shard into this one"""
+        self._combine(other.counts, other.errors, other.floor())
+        return self
+
+    def _combine(self, counts: pd.Series, errors: pd.Series, other_floor: int) -> None:
+        own_floor = self.floor()
+        index = self.counts.index.union(counts.index, sort=False)
+        combined = (self.counts.reindex(index, fill_value=own_floor)
+                    + counts.reindex(index, fill_value=other_floor))
+        combined_errors = (self.errors.reindex(index, fill_value=own_floor)
+                           + errors.reindex(index, fill_value=other_floor))
+        keep = combined.sort_values(ascending=False, kind='stable').index[:self.capacity]
+        self.counts = combined[keep]
+        self.errors = combined_errors[keep]
+
+
+class SketchedCategories:
+    """
+    Bounded-memory stand-in for CategoricalIndex.
+
+    Answers the same questions validation asks of a CategoricalIndex (has a
+    value been seen, how frequent is it) from a Space-Saving top-K summary
+    backed by a Count-Min sketch for everything else. Counts are upper
+    bounds, so "seen before?" can report a false positive for a value that
+    collides with frequent ones, but never a false negative.
+    """
+
+    def __init__(self, values: List[Any], counts: np.ndarray, errors: np.ndarray,
+                 sketch: CountMinSketch, total_count: int, floor: int):
+        self.values = list(values)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.errors = np.asarray(errors, dtype=np.int64)
+        self.sketch = sketch
+        self.total_count = int(total_count)
+        # Most an untracked value can have occurred; 0 when every value is tracked
+        self.floor = int(floor)
+        self.codes = {value: code for code, value in enumerate(self.values)}
+        self._lookup_index: Optional[pd.Index] = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.frequency(value) is not None
+
+    def code(self, value: Any) -> int:
+        """Position of a value in the tracked top-K, or -1"""
+        try:
+            return self.codes.get(value, -1)
+        except TypeError:
+            return -1
+
+    def estimate_counts(self, column: pd.Series) -> np.ndarray:
+        """Upper-bound historical counts for every value of a column"""
+        if self._lookup_index is None:
+            self._lookup_index = pd.Index(self.values, dtype=object)
+        codes = self._lookup_index.get_indexer(column)
+        tracked = codes >= 0
+        counts = np.zeros(len(column), dtype=np.int64)
+        counts[tracked] = self.counts[codes[tracked]]
+
+        untracked = np.flatnonzero(~tracked & column.notna().to_numpy())
+        if len(untracked):
+            estimates = self.sketch.estimate(column.to_numpy(dtype=object)[untracked])
+            counts[untracked] = np.minimum(estimates, self.floor)
+        return counts
+
+    def frequencies_of(self, column: pd.Series) -> np.ndarray:
+        """Estimated historical frequency per value, NaN for values never seen"""
+        counts = self.estimate_counts(column)
+        if self.total_count == 0:
+            return np.full(len(column), np.nan)
+        return np.where(counts > 0, counts / self.total_count, np.nan)
+
+    def isin(self, column: pd.Series) -> np.ndarray:
+        """Boolean mask of the column values (probably) seen in historical data"""
+        return self.estimate_counts(column) > 0
+
+    def frequency(self, value: Any) -> Optional[float]:
+        """Estimated historical frequency of a value, or None if it was never seen"""
+        code = self.code(value)
+        if code >= 0:
+            return self.counts[code] / self.total_count
+        try:
+            frequency = self.frequencies_of(pd.Series([value], dtype=object))[0]
+        except TypeError:
+            return None
+        return None if np.isnan(frequency) else frequency
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for JSON export"""
+        return {
+            'values': self.values,
+            'counts': self.counts.tolist(),
+            'errors': self.errors.tolist(),
+            'sketch': self.sketch.to_dict(),
+            'total_count': self.total_count,
+            'floor': self.floor
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SketchedCategories':
+        """Restore categories exported with to_dict"""
+        return cls(data['values'], data['counts'], data['errors'],
+                   CountMinSketch.from_dict(data['sketch']), data['total_count'], data['floor'])
+
+
+def sketch_dimensions(memory_bytes: int, depth: int = 4) -> Tuple[int, int]:
+    """
+    Split a memory budget between the top-K summary and the Count-Min table.
+
+    A quarter goes to top-K entries, the rest to int64 sketch counters.
+
+    Returns:
+        Tuple of (top-K capacity, sketch width)
+    """
+    capacity = max(16, memory_bytes // 4 // TOP_K_ENTRY_BYTES)
+    width = max(64, (memory_bytes - capacity * TOP_K_ENTRY_BYTES) // (8 * depth))
+    return int(capacity), int(width)
@@ -0,0 +1,45 @@
+import os
+import json
+import joblib
+import hashlib
+import pandas as pd
+from typing import Dict, List, Any, Optional
+
+
+def baseline_fingerprint(historical_df: pd.DataFrame, columns: List[str], params: Dict[str, Any]) -> str:
+    """
+    Hash of the historical columns and settings a set of models was fitted on.
+
+    Models saved under one fingerprint are only reused while both the
+    baseline data and the model settings are unchanged.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    for column in sorted(columns):
+        digest.update(column.encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(historical_df[column], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def save_models(filename: str, fingerprint: str, models: Dict[str, Any]) -> None:
+    """Persist fitted models with the fingerprint of the baseline they were fitted on"""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    joblib.dump({'fingerprint': fingerprint, 'models': models}, filename)
+
+
+def load_models(filename: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """
+    Load models saved by save_models.
+
+    Returns:
+        Models by field, or None if the file is missing or was fitted on a
+        different baseline
+    """
+    if not os.path.exists(filename):
+        return None
+    bundle = joblib.load(filename)
+    if bundle.get('fingerprint') != fingerprint:
+        return None
+    return bundle['models']
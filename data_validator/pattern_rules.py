@@ -0,0 +1,86 @@
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, Tuple
+
+
+def _as_text(value: Any) -> str:
+    """Text a pattern is matched against; missing values become empty strings"""
+    if value is None or pd.isna(value) is True:
+        return ''
+    return str(value)
+
+
+class PatternRule:
+    """
+    Compiled 'pattern' / 'allow_empty' rules for a text field.
+
+    Empty values (missing, or whitespace only) fail the 'empty' rule unless
+    allow_empty is set; every other value must match the pattern from its
+    start, as re.match does.
+    """
+
+    def __init__(self, regex: Optional[re.Pattern], allow_empty: bool = True):
+        self.regex = regex
+        self.allow_empty = allow_empty
+
+    @property
+    def pattern(self) -> Optional[str]:
+        return self.regex.pattern if self.regex is not None else None
+
+    def check(self, value: Any) -> Optional[str]:
+        """Return the id of the rule a single value fails, or None"""
+        text = _as_text(value)
+        if not text.strip():
+            return None if self.allow_empty else 'empty'
+        if self.regex is not None and self.regex.match(text) is None:
+            return 'pattern'
+        return None
+
+    def check_column(self, column: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check a whole column with vectorized string methods.
+
+        Returns:
+            Tuple of boolean masks (empty failures, pattern failures)
+        """
+        text = column.where(column.notna(), '').astype(str)
+        empty = text.str.strip().eq('').to_numpy(dtype=bool)
+        empty_failed = empty if not self.allow_empty else np.zeros(len(column), dtype=bool)
+        if self.regex is None:
+            return empty_failed, np.zeros(len(column), dtype=bool)
+        matched = text.str.match(self.regex).to_numpy(dtype=bool)
+        return empty_failed, ~empty & ~matched
+
+
+class PatternRegistry:
+    """
+    Cache of compiled regular expressions.
+
+    Validation plans are recompiled whenever the config version changes; the
+    registry makes sure an unchanged pattern is only ever compiled once.
+    """
+
+    def __init__(self):
+        self._compiled: Dict[str, re.Pattern] = {}
+
+    def compile(self, pattern: str) -> re.Pattern:
+        """Return the compiled form of a pattern, compiling it on first use"""
+        regex = self._compiled.get(pattern)
+        if regex is None:
+            regex = self._compiled[pattern] = re.compile(pattern)
+        return regex
+
+    def rule(self, thresholds: Dict[str, Any]) -> Optional[PatternRule]:
+        """
+        Build the text rule for a field's thresholds.
+
+        Returns:
+            PatternRule, or None if the field configures neither 'pattern'
+            nor 'allow_empty'
+        """
+        if 'pattern' not in thresholds and 'allow_empty' not in thresholds:
+            return None
+        pattern = thresholds.get('pattern')
+        regex = self.compile(pattern) if pattern else None
+        return PatternRule(regex, thresholds.get('allow_empty', True))
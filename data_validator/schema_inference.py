@@ -0,0 +1,195 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Iterable
+from dataclasses import dataclass
+
+
+# Column kinds; only numeric and categorical columns get baseline profiles
+COLUMN_KINDS = ('numeric', 'categorical', 'identifier', 'timestamp', 'text')
+PROFILED_KINDS = ('numeric', 'categorical')
+
+# A column is high-cardinality when at least this share of its sampled values
+# is distinct and the sample holds at least MIN_HIGH_CARDINALITY distinct values
+HIGH_CARDINALITY_RATIO = 0.5
+MIN_HIGH_CARDINALITY = 50
+
+# Share of sampled values that must parse as dates for a timestamp column
+TIMESTAMP_PARSE_RATIO = 0.95
+
+# Thresholds checked without baseline statistics
+TEXT_THRESHOLDS = ('pattern', 'allow_empty')
+
+
+@dataclass
+class ColumnSchema:
+    """Inferred kind and profiling dtype of a single column, from a sample"""
+    name: str
+    kind: str
+    dtype: str
+    null_fraction: float
+    unique_count: int
+    unique_ratio: float
+    sample_size: int
+    # Too many distinct values for exact counts; profiled through a sketch if at all
+    high_cardinality: bool = False
+
+    @property
+    def profiled(self) -> bool:
+        """Whether the column gets full baseline statistics"""
+        return self.kind in PROFILED_KINDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'kind': self.kind,
+            'dtype': self.dtype,
+            'null_fraction': self.null_fraction,
+            'unique_count': self.unique_count,
+            'unique_ratio': self.unique_ratio,
+            'sample_size': self.sample_size,
+            'high_cardinality': self.high_cardinality
+        }
+
+
+def _looks_like_timestamps(values: pd.Series) -> bool:
+    """Check whether string values are mostly parseable dates"""
+    text = values.astype(str)
+    # Plain numbers would parse as years, so require date-like separators
+    if not text.str.contains(r'\d[-/:]\d', regex=True).mean() >= TIMESTAMP_PARSE_RATIO:
+        return False
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        parsed = pd.to_datetime(text, errors='coerce', format='ISO8601')
+    return parsed.notna().mean() >= TIMESTAMP_PARSE_RATIO
+
+
+def _numeric_dtype(values: pd.Series) -> str:
+    """Smallest of int32/float32 that holds the sampled values exactly, else the current dtype"""
+    dtype = values.dtype
+    present = values.dropna()
+    if pd.api.types.is_integer_dtype(dtype):
+        info = np.iinfo(np.int32)
+        if len(present) == 0 or (present.min() >= info.min and present.max() <= info.max):
+            return 'int32'
+        return str(dtype)
+    if pd.api.types.is_float_dtype(dtype):
+        array = present.to_numpy(dtype=np.float64)
+        if np.array_equal(array.astype(np.float32).astype(np.float64), array):
+            return 'float32'
+    return str(dtype)
+
+
+def classify_column(name: str, sample: pd.Series, required: bool = False) -> ColumnSchema:
+    """
+    Classify a sampled column.
+
+    Args:
+        name: Column name
+        sample: Sampled values of the column
+        required: Whether validation needs a baseline for the column; a
+            required high-cardinality column stays categorical instead of
+            becoming an unprofiled identifier or text column
+
+    Returns:
+        ColumnSchema for the column
+    """
+    present = sample.dropna()
+    n_present = len(present)
+    try:
+        unique_count = int(present.nunique())
+    except TypeError:
+        # Unhashable values (lists, dicts) can't be counted as categories
+        unique_count = n_present
+    unique_ratio = unique_count / n_present if n_present else 0.0
+    high_cardinality = unique_count >= MIN_HIGH_CARDINALITY and unique_ratio >= HIGH_CARDINALITY_RATIO
+    dtype = sample.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        kind, target = 'categorical', 'category'
+    elif pd.api.types.is_numeric_dtype(dtype):
+        kind, target = 'numeric', _numeric_dtype(sample)
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        kind, target = 'timestamp', str(dtype)
+    elif isinstance(dtype, pd.CategoricalDtype):
+        kind, target = 'categorical', 'category'
+    elif n_present and _looks_like_timestamps(present):
+        kind, target = 'timestamp', 'datetime64[ns]'
+    elif high_cardinality and not required:
+        # Free text has words; identifiers (SKUs, URLs, ids) don't
+        has_spaces = present.astype(str).str.contains(r'\s', regex=True).mean() >= 0.5
+        kind, target = ('text' if has_spaces else 'identifier'), 'object'
+    else:
+        kind, target = 'categorical', 'category'
+
+    return ColumnSchema(
+        name=name,
+        kind=kind,
+        dtype=target,
+        null_fraction=float(1 - n_present / len(sample)) if len(sample) else 0.0,
+        unique_count=unique_count,
+        unique_ratio=float(unique_ratio),
+        sample_size=len(sample),
+        high_cardinality=high_cardinality
+    )
+
+
+def infer_schema(data: pd.DataFrame, sample_size: int = 10000,
+                 random_state: int = 0, required: Iterable[str] = ()) -> Dict[str, ColumnSchema]:
+    """
+    Infer column kinds from a random sample of rows.
+
+    Args:
+        data: DataFrame to inspect
+        sample_size: Maximum number of rows to sample
+        random_state: Seed for the sample, so inference is repeatable
+        required: Columns validation needs a baseline for (see
+            baseline_columns); these are never dropped for cardinality
+
+    Returns:
+        ColumnSchema per column, in column order
+    """
+    if len(data) > sample_size:
+        sample = data.sample(n=sample_size, random_state=random_state)
+    else:
+        sample = data
+    required = set(required)
+    return {column: classify_column(column, sample[column], column in required)
+            for column in data.columns}
+
+
+def downcast_frame(data: pd.DataFrame, schema: Dict[str, ColumnSchema],
+                   columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Return the given columns converted to their inferred profiling dtypes.
+
+    Numeric columns only shrink when the sample showed the smaller dtype is
+    exact; columns whose full data doesn't fit keep their original dtype.
+    Categorical columns are left as they are, since profiling factorizes
+    them directly.
+    """
+    converted = {}
+    for column in columns:
+        series = data[column]
+        target = schema[column].dtype
+        if target in ('int32', 'float32') and isinstance(series.dtype, np.dtype):
+            narrowed = series.astype(target)
+            exact = narrowed.astype(series.dtype).eq(series) | series.isna()
+            converted[column] = narrowed if exact.all() else series
+        else:
+            converted[column] = series
+    return pd.DataFrame(converted, index=data.index)
+
+
+def referenced_columns(config) -> Optional[List[str]]:
+    """Columns a ThresholdConfig has thresholds for, or None without a config"""
+    if config is None:
+        return None
+    return list(config.get_all_thresholds())
+
+
+def baseline_columns(config) -> List[str]:
+    """Columns a ThresholdConfig has checks for that need baseline statistics"""
+    if config is None:
+        return []
+    return [field for field, thresholds in config.get_all_thresholds().items()
+            if any(key not in TEXT_THRESHOLDS for key in thresholds)]
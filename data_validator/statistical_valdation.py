@@ -2,8 +2,6 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
-from sklearn.neighbors import LocalOutlierFactor
 from typing import Dict, List, Any, Optional, Tuple
 import json
 import yaml
@@ -13,6 +11,15 @@ from enum import Enum
 import warnings
 warnings.filterwarnings('ignore')
 
+from cusum_detector import CusumState, save_cusum_states, load_cusum_states
+from two_sample_tests import SortedSample
+from binned_drift import BinnedBaseline, BINNED_DRIFT_METRICS
+from model_store import baseline_fingerprint, save_models, load_models
+from anomaly_ensemble import AnomalyEnsemble, NoveltyLOF, feature_matrix
+from clustering_detector import ClusteringDetector
+from batch_context import BatchContext, BatchData
+from detector_graph import DetectorGraph
+
 class AnomalyType(Enum):
     DISTRIBUTION_SHIFT = "distribution_shift"
     OUTLIER = "outlier"
@@ -29,12 +36,54 @@ class StatisticalAnomaly:
     message: str
     reference_period: str
 
+# Seasonal periods: derived column name, number of periods, first period value
+SEASONAL_PERIODS = {
+    'month': (12, 1),
+    'day_of_week': (7, 0),
+    'hour': (24, 0)
+}
+
+# Config flag that enables seasonal scoring for each period
+SEASONALITY_FLAGS = {
+    'month': ('monthly_seasonality', True),
+    'day_of_week': ('weekly_seasonality', False),
+    'hour': ('hourly_seasonality', False)
+}
+
+# Detector stages of run_all_statistical_validations, in report order
+DETECTOR_STAGES = (
+    'distribution_shift',
+    'outliers',
+    'ensemble_anomalies',
+    'cluster_anomalies',
+    'trend_breaks',
+    'seasonal_anomalies'
+)
+
+@dataclass
+class SeasonalProfile:
+    """Historical mean/std of a field per period, as dense arrays indexed by period"""
+    mean: np.ndarray
+    std: np.ndarray
+    count: np.ndarray
+    offset: int
+
 class StatisticalValidator:
     def __init__(self, config_path: str):
         """Initialize statistical validator with configuration"""
         self.config = self._load_config(config_path)
         self.historical_data = {}
         self.baseline_stats = {}
+        self.seasonal_profiles: Dict[str, Dict[str, SeasonalProfile]] = {}
+        self.trend_states: Dict[Tuple[str, Any], CusumState] = {}
+        self.sorted_history: Dict[str, SortedSample] = {}
+        self.binned_history: Dict[str, BinnedBaseline] = {}
+        self.isolation_forests: Dict[str, IsolationForest] = {}
+        self.novelty_lof: Optional[NoveltyLOF] = None
+        self.clustering: Optional[ClusteringDetector] = None
+        self.model_path: Optional[str] = None
+        self.model_fingerprint: Optional[str] = None
+        self.last_timings: Dict[str, float] = {}
         self.anomalies: List[StatisticalAnomaly] = []
         
     def _load_config(self, config_path: str) -> Dict:
@@ -45,17 +94,128 @@ class StatisticalValidator:
             else:
                 return json.load(f)
     
-    def set_historical_data(self, historical_data: List[Dict[str, Any]]):
-        """Set historical data for baseline calculations"""
-        self.historical_df = pd.DataFrame(historical_data)
+    def set_historical_data(self, historical_data: List[Dict[str, Any]],
+                            model_path: Optional[str] = None):
+        """
+        Set historical data for baseline calculations.
+        
+        Args:
+            historical_data: Historical records
+            model_path: File to persist the fitted outlier models in. Models
+                saved there for the same baseline and settings are loaded
+                instead of refitted, and update_clustering() saves the
+                updated clustering model back to it.
+        """
+        self.historical = BatchContext(historical_data)
+        self.historical_df = self.historical.df
         self._calculate_baseline_stats()
+        self._calculate_seasonal_profiles()
+        self._fit_baseline_models(model_path)
+        
+    def _n_jobs(self, field_config: Dict[str, Any]) -> Optional[int]:
+        """Worker count for model fitting: the field's n_jobs, else the performance settings"""
+        if 'n_jobs' in field_config:
+            return field_config['n_jobs']
+        performance = self.config.get('performance', {})
+        return performance.get('max_workers') if performance.get('parallel_processing', False) else None
+    
+    def _fit_baseline_models(self, model_path: Optional[str] = None):
+        """Fit the outlier models that score batches against history, or load them from model_path"""
+        self.isolation_forests = {}
+        self.novelty_lof = None
+        self.clustering = None
+        self.model_path = None
+        self.model_fingerprint = None
+        iso_fields = {
+            field: field_config for field, field_config in self.config.get('statistical_fields', {}).items()
+            if field_config.get('isolation_forest', False) and field in self.historical_df.columns
+        }
+        ensemble_config = self.config.get('advanced_methods', {}).get('ensemble_methods', {})
+        lof_fields = []
+        if (ensemble_config.get('enabled', False) and ensemble_config.get('lof_novelty', True)
+                and 'local_outlier_factor' in ensemble_config.get('methods', [])):
+            lof_fields = self._ensemble_fields(self.historical_df)
+        clustering_config = self._clustering_config()
+        cluster_fields = self._clustering_fields(self.historical_df) if clustering_config else []
+        if not iso_fields and not lof_fields and not cluster_fields:
+            return
+        
+        if model_path is not None:
+            params = {
+                'isolation_forest': {field: field_config.get('contamination', 0.1)
+                                     for field, field_config in iso_fields.items()},
+                'local_outlier_factor': {key: ensemble_config.get(key) for key in
+                                         ('contamination', 'n_neighbors', 'lof_algorithm')} if lof_fields else None,
+                'clustering': dict(clustering_config, fields=cluster_fields) if cluster_fields else None
+            }
+            fingerprint = baseline_fingerprint(self.historical_df, list(iso_fields) + lof_fields + cluster_fields, params)
+            self.model_path = model_path
+            self.model_fingerprint = fingerprint
+            models = load_models(model_path, fingerprint)
+            if models is not None:
+                self.isolation_forests = models['isolation_forests']
+                self.novelty_lof = models['novelty_lof']
+                self.clustering = models['clustering']
+                return
+        
+        for field, field_config in iso_fields.items():
+            values = pd.to_numeric(self.historical_df[field], errors='coerce').dropna()
+            if len(values) == 0:
+                continue
+            iso_forest = IsolationForest(
+                contamination=field_config.get('contamination', 0.1),
+                random_state=42,
+                n_jobs=self._n_jobs(field_config)
+            )
+            self.isolation_forests[field] = iso_forest.fit(values.to_numpy(dtype=float).reshape(-1, 1))
+        
+        if lof_fields:
+            matrix, _ = feature_matrix(self.historical_df, lof_fields)
+            if len(matrix) > 1:
+                self.novelty_lof = NoveltyLOF(
+                    lof_fields,
+                    n_neighbors=ensemble_config.get('n_neighbors', 20),
+                    contamination=ensemble_config.get('contamination', 0.1),
+                    algorithm=ensemble_config.get('lof_algorithm', 'auto'),
+                    n_jobs=self._n_jobs(ensemble_config)
+                ).fit(matrix)
+        
+        if cluster_fields:
+            chunk_size = self.config.get('performance', {}).get('chunk_size', 1000)
+            
+            def history_chunks():
+                # Only one chunk of the feature matrix is built at a time
+                for start in range(0, len(self.historical_df), chunk_size):
+                    yield feature_matrix(self.historical_df.iloc[start:start + chunk_size], cluster_fields)[0]
+            
+            clustering = ClusteringDetector(
+                cluster_fields,
+                n_clusters=clustering_config.get('n_clusters', 5),
+                outlier_threshold=clustering_config.get('outlier_threshold', 0.1),
+                chunk_size=chunk_size
+            ).fit_chunks(history_chunks)
+            if clustering.fitted:
+                self.clustering = clustering
+        
+        self._save_models()
+    
+    def _save_models(self):
+        """Persist the fitted models to model_path, if set_historical_data was given one"""
+        if self.model_path is None:
+            return
+        save_models(self.model_path, self.model_fingerprint, {'isolation_forests': self.isolation_forests,
+                                                              'novelty_lof': self.novelty_lof,
+                                                              'clustering': self.clustering})
         
     def _calculate_baseline_stats(self):
         """Calculate baseline statistics from historical data"""
         numeric_columns = self.historical_df.select_dtypes(include=[np.number]).columns
+        self.sorted_history = {}
+        self.binned_history = {}
         
         for col in numeric_columns:
             if col in self.config.get('statistical_fields', {}):
+                field_config = self.config['statistical_fields'][col]
                 self.baseline_stats[col] = {
                     'mean': self.historical_df[col].mean(),
                     'std': self.historical_df[col].std(),
@@ -66,6 +226,46 @@ class StatisticalValidator:
                     'max': self.historical_df[col].max(),
                     'distribution': self._fit_distribution(self.historical_df[col])
                 }
+                values = self.historical_df[col].to_numpy(dtype=float)
+                if field_config.get('drift_method', 'ks') in BINNED_DRIFT_METRICS:
+                    self.binned_history[col] = BinnedBaseline.from_values(values, field_config.get('drift_bins', 10))
+                else:
+                    # Sorted once here so every drift check only sorts the new batch
+                    self.sorted_history[col] = SortedSample(values)
+    
+    def _calculate_seasonal_profiles(self):
+        """Build per-period mean/std tables for fields with seasonal detection"""
+        self.seasonal_profiles = {}
+        fields = [
+            field for field, field_config in self.config.get('statistical_fields', {}).items()
+            if field_config.get('seasonal_detection', False) and field in self.historical_df.columns
+        ]
+        if not fields:
+            return
+        
+        # Without timestamps there is no calendar to profile
+        periods = self.historical.periods
+        if periods is None:
+            return
+        for field in fields:
+            values = self.historical.numeric(field)
+            present = ~np.isnan(values)
+            self.seasonal_profiles[field] = {}
+            
+            for period, (size, offset) in SEASONAL_PERIODS.items():
+                # Rows without a timestamp (NaT) have no period
+                labels = periods[period]
+                keep = present & ~np.isnan(labels)
+                codes = labels[keep].astype(int) - offset
+                observed = values[keep]
+                count = np.bincount(codes, minlength=size)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    mean = np.bincount(codes, weights=observed, minlength=size) / count
+                    # Sample standard deviation (ddof=1), as pandas computes it
+                    squared = np.bincount(codes, weights=(observed - mean[codes]) ** 2, minlength=size)
+                    std = np.sqrt(squared / (count - 1))
+                std[count < 2] = np.nan
+                self.seasonal_profiles[field][period] = SeasonalProfile(mean, std, count, offset)
     
     def _fit_distribution(self, data: pd.Series) -> Dict[str, Any]:
         """Fit statistical distribution to data"""
@@ -113,24 +313,31 @@ class StatisticalValidator:
             return {'s': log_data.std(), 'scale': np.exp(log_data.mean())}
         return {}
     
-    def validate_distribution_shift(self, new_data: List[Dict[str, Any]]) -> List[StatisticalAnomaly]:
+    def validate_distribution_shift(self, new_data: BatchData) -> List[StatisticalAnomaly]:
         """Detect distribution shifts using statistical tests"""
         anomalies = []
-        new_df = pd.DataFrame(new_data)
+        batch = BatchContext.of(new_data)
         
         for field in self.config.get('statistical_fields', {}):
-            if field not in new_df.columns or field not in self.baseline_stats:
+            if field not in batch.columns or field not in self.baseline_stats:
                 continue
                 
             field_config = self.config['statistical_fields'][field]
-            historical_values = self.historical_df[field].dropna()
-            new_values = new_df[field].dropna()
+            new_values = batch.sorted_numeric(field)
             
             if len(new_values) < field_config.get('min_samples', 10):
                 continue
             
+            if field in self.binned_history:
+                anomaly = self._detect_binned_drift(field, field_config, new_values)
+                if anomaly is not None:
+                    anomalies.append(anomaly)
+                continue
+            
+            history = self.sorted_history[field]
+            
             # Kolmogorov-Smirnov test for distribution comparison
-            ks_stat, ks_p_value = stats.ks_2samp(historical_values, new_values)
+            ks_stat, ks_p_value = history.ks_test(new_values, presorted=True)
             ks_threshold = field_config.get('ks_threshold', 0.05)
             
             if ks_p_value < ks_threshold:
@@ -145,7 +352,7 @@ class StatisticalValidator:
                 ))
             
             # Mann-Whitney U test for median comparison
-            u_stat, u_p_value = stats.mannwhitneyu(historical_values, new_values, alternative='two-sided')
+            u_stat, u_p_value = history.mannwhitney_test(new_values, presorted=True)
             u_threshold = field_config.get('mannwhitney_threshold', 0.05)
             
             if u_p_value < u_threshold:
@@ -161,24 +368,62 @@ class StatisticalValidator:
         
         return anomalies
     
-    def detect_outliers(self, data: List[Dict[str, Any]]) -> List[StatisticalAnomaly]:
+    def _detect_binned_drift(self, field: str, field_config: Dict[str, Any],
+                             new_values: np.ndarray) -> Optional[StatisticalAnomaly]:
+        """Score a batch against the field's binned baseline with its configured metric"""
+        baseline = self.binned_history[field]
+        new_counts = baseline.histogram(new_values)
+        method = field_config.get('drift_method')
+        
+        if method == 'chi2':
+            chi2_stat, chi2_p_value = baseline.chi_square(new_counts)
+            chi2_threshold = field_config.get('chi2_threshold', 0.05)
+            if chi2_p_value >= chi2_threshold:
+                return None
+            return StatisticalAnomaly(
+                field=field,
+                anomaly_type=AnomalyType.DISTRIBUTION_SHIFT,
+                value=f"Chi-square: {chi2_stat:.4f}",
+                score=chi2_stat,
+                confidence=1 - chi2_p_value,
+                message=f"Distribution shift detected in {field} (chi-square p-value: {chi2_p_value:.4f})",
+                reference_period="baseline"
+            )
+        
+        if method == 'psi':
+            score, threshold, label = baseline.psi(new_counts), field_config.get('psi_threshold', 0.2), 'PSI'
+        else:
+            score, threshold, label = baseline.js_divergence(new_counts), field_config.get('js_threshold', 0.1), 'JS divergence'
+        if score <= threshold:
+            return None
+        return StatisticalAnomaly(
+            field=field,
+            anomaly_type=AnomalyType.DISTRIBUTION_SHIFT,
+            value=f"{label}: {score:.4f}",
+            score=score,
+            confidence=min(score / threshold, 1.0),
+            message=f"Distribution shift detected in {field} ({label}: {score:.4f}, threshold: {threshold})",
+            reference_period="baseline"
+        )
+    
+    def detect_outliers(self, data: BatchData) -> List[StatisticalAnomaly]:
         """Detect outliers using multiple methods"""
         anomalies = []
-        df = pd.DataFrame(data)
+        batch = BatchContext.of(data)
         
         for field in self.config.get('statistical_fields', {}):
-            if field not in df.columns:
+            if field not in batch.columns:
                 continue
                 
             field_config = self.config['statistical_fields'][field]
-            values = df[field].dropna()
+            values = batch.present(field)
             
             if len(values) < field_config.get('min_samples', 10):
                 continue
             
             # Z-score based outlier detection
             if field_config.get('z_score_detection', True):
-                z_scores = np.abs(stats.zscore(values))
+                z_scores = batch.zscores(field)
                 z_threshold = field_config.get('z_threshold', 3.0)
                 z_outliers = np.where(z_scores > z_threshold)[0]
                 
@@ -195,8 +440,7 @@ class StatisticalValidator:
             
             # IQR-based outlier detection
             if field_config.get('iqr_detection', True):
-                Q1 = values.quantile(0.25)
-                Q3 = values.quantile(0.75)
+                Q1, Q3 = batch.quartiles(field)
                 IQR = Q3 - Q1
                 iqr_multiplier = field_config.get('iqr_multiplier', 1.5)
                 
@@ -217,40 +461,199 @@ class StatisticalValidator:
                         reference_period="current_batch"
                     ))
             
-            # Isolation Forest for multivariate outlier detection
-            if field_config.get('isolation_forest', False) and len(values) > 50:
-                iso_forest = IsolationForest(
-                    contamination=field_config.get('contamination', 0.1),
-                    random_state=42
-                )
-                outlier_labels = iso_forest.fit_predict(values.values.reshape(-1, 1))
-                outlier_scores = iso_forest.decision_function(values.values.reshape(-1, 1))
+            # Isolation Forest, fitted on the historical baseline when there is one
+            if field_config.get('isolation_forest', False):
+                iso_forest = self.isolation_forests.get(field)
+                reference_period = "baseline"
+                if iso_forest is None:
+                    if len(values) <= 50:
+                        continue
+                    iso_forest = IsolationForest(
+                        contamination=field_config.get('contamination', 0.1),
+                        random_state=42
+                    ).fit(values.values.reshape(-1, 1))
+                    reference_period = "current_batch"
+                
+                outlier_scores = iso_forest.decision_function(values.to_numpy(dtype=float).reshape(-1, 1))
                 
-                for idx, (label, score) in enumerate(zip(outlier_labels, outlier_scores)):
-                    if label == -1:  # Outlier
-                        anomalies.append(StatisticalAnomaly(
-                            field=field,
-                            anomaly_type=AnomalyType.OUTLIER,
-                            value=values.iloc[idx],
-                            score=abs(score),
-                            confidence=min(abs(score) * 2, 1.0),
-                            message=f"Isolation Forest outlier in {field}: {values.iloc[idx]} (score: {score:.3f})",
-                            reference_period="current_batch"
-                        ))
+                # Negative decision scores are what predict() labels -1
+                for idx in np.flatnonzero(outlier_scores < 0):
+                    score = outlier_scores[idx]
+                    anomalies.append(StatisticalAnomaly(
+                        field=field,
+                        anomaly_type=AnomalyType.OUTLIER,
+                        value=values.iloc[idx],
+                        score=abs(score),
+                        confidence=min(abs(score) * 2, 1.0),
+                        message=f"Isolation Forest outlier in {field}: {values.iloc[idx]} (score: {score:.3f})",
+                        reference_period=reference_period
+                    ))
         
         return anomalies
     
-    def detect_trend_breaks(self, data: List[Dict[str, Any]]) -> List[StatisticalAnomaly]:
-        """Detect trend breaks and sudden changes"""
+    def detect_ensemble_anomalies(self, data: BatchData) -> List[StatisticalAnomaly]:
+        """
+        Detect multivariate outliers with the detector ensemble from
+        advanced_methods.ensemble_methods.
+        
+        The configured fields are scaled into one feature matrix, every
+        detector runs on it concurrently (max_workers from the performance
+        section), and rows flagged by at least voting_threshold detectors
+        are reported. With lof_novelty, LOF scores the batch against the
+        model fitted on history in set_historical_data.
+        """
         anomalies = []
-        df = pd.DataFrame(data)
+        ensemble_config = self.config.get('advanced_methods', {}).get('ensemble_methods', {})
+        if not ensemble_config.get('enabled', False):
+            return anomalies
+        
+        batch = BatchContext.of(data)
+        fields = self._ensemble_fields(batch.df)
+        if not fields:
+            return anomalies
+        
+        matrix, rows = batch.cached(('features', tuple(fields)), lambda: feature_matrix(batch.df, fields))
+        if len(rows) < ensemble_config.get('min_samples', 50):
+            return anomalies
+        
+        performance = self.config.get('performance', {})
+        ensemble = AnomalyEnsemble(
+            ensemble_config.get('methods', []),
+            contamination=ensemble_config.get('contamination', 0.1),
+            voting_threshold=ensemble_config.get('voting_threshold', 2),
+            max_workers=performance.get('max_workers') if performance.get('parallel_processing', False) else 1,
+            n_neighbors=ensemble_config.get('n_neighbors', 20)
+        )
+        # Score LOF against history when it was fitted on the same fields
+        fitted = {}
+        if self.novelty_lof is not None and self.novelty_lof.fields == fields:
+            fitted['local_outlier_factor'] = self.novelty_lof
+        votes, flags = ensemble.vote(matrix, fitted)
+        
+        name = '+'.join(fields)
+        for idx in np.flatnonzero(votes >= ensemble.voting_threshold):
+            value = dict(zip(fields, matrix[idx].tolist()))
+            detectors = [method for method, flagged in zip(ensemble.methods, flags[:, idx]) if flagged]
+            anomalies.append(StatisticalAnomaly(
+                field=name,
+                anomaly_type=AnomalyType.OUTLIER,
+                value=value,
+                score=votes[idx] / len(ensemble.methods),
+                confidence=votes[idx] / len(ensemble.methods),
+                message=f"Ensemble outlier in {name} at row {rows[idx]}: {value} ({votes[idx]}/{len(ensemble.methods)} detectors: {', '.join(detectors)})",
+                reference_period="current_batch"
+            ))
         
-        # Add timestamp if not present
-        if 'timestamp' not in df.columns:
-            df['timestamp'] = pd.date_range(start='2024-01-01', periods=len(df), freq='D')
+        return anomalies
+    
+    def detect_cluster_anomalies(self, data: BatchData) -> List[StatisticalAnomaly]:
+        """
+        Detect outliers by distance to the nearest k-means centroid.
+        
+        Centroids and the distance cutoff are trained on history in
+        set_historical_data. Scoring leaves the model unchanged unless
+        clustering.online_update is set, in which case the rows of each batch
+        that are not outliers train it further in memory; update_clustering()
+        does the same explicitly and persists the result.
+        """
+        anomalies = []
+        clustering_config = self._clustering_config()
+        scored = self._cluster_scores(data) if clustering_config is not None else None
+        if scored is None:
+            return anomalies
+        matrix, rows, distances, outliers = scored
+        cutoff = self.clustering.cutoff
+        
+        fields = self.clustering.fields
+        name = '+'.join(fields)
+        for idx in np.flatnonzero(outliers):
+            value = dict(zip(fields, matrix[idx].tolist()))
+            anomalies.append(StatisticalAnomaly(
+                field=name,
+                anomaly_type=AnomalyType.OUTLIER,
+                value=value,
+                score=distances[idx],
+                confidence=min(distances[idx] / cutoff, 1.0) if cutoff > 0 else 1.0,
+                message=f"Cluster outlier in {name} at row {rows[idx]}: {value} (distance to nearest centroid: {distances[idx]:.2f}, cutoff: {cutoff:.2f})",
+                reference_period="baseline"
+            ))
+        
+        if clustering_config.get('online_update', False):
+            self.clustering.partial_fit(matrix[~outliers])
         
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
+        return anomalies
+    
+    def update_clustering(self, data: BatchData) -> int:
+        """
+        Train the clustering model further on the non-outlier rows of a batch.
+        
+        The updated model is saved to the model_path given to
+        set_historical_data, so a restart on the same baseline resumes from it.
+        
+        Returns:
+            Number of rows the model was trained on
+        """
+        if self.clustering is None:
+            return 0
+        scored = self._cluster_scores(data)
+        if scored is None:
+            return 0
+        matrix, _, _, outliers = scored
+        self.clustering.partial_fit(matrix[~outliers])
+        self._save_models()
+        return int((~outliers).sum())
+    
+    def _cluster_scores(self, data: BatchData) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """Feature matrix, row positions, centroid distances and outlier mask of a batch"""
+        if self.clustering is None:
+            return None
+        batch = BatchContext.of(data)
+        fields = self.clustering.fields
+        if not all(field in batch.columns for field in fields):
+            return None
+        matrix, rows = batch.cached(('features', tuple(fields)), lambda: feature_matrix(batch.df, fields))
+        if len(rows) == 0:
+            return None
+        distances, outliers = self.clustering.outliers(matrix)
+        return matrix, rows, distances, outliers
+    
+    def _clustering_config(self) -> Optional[Dict[str, Any]]:
+        """advanced_methods.clustering settings, or None when clustering is disabled"""
+        clustering_config = self.config.get('advanced_methods', {}).get('clustering', {})
+        if not clustering_config.get('enabled', False):
+            return None
+        if clustering_config.get('method', 'kmeans') != 'kmeans':
+            raise ValueError(f"Unsupported clustering method: {clustering_config['method']}")
+        return clustering_config
+    
+    def _clustering_fields(self, df: pd.DataFrame) -> List[str]:
+        """Clustering feature fields present in a frame: the configured ones, else all statistical fields"""
+        clustering_config = self.config.get('advanced_methods', {}).get('clustering', {})
+        fields = clustering_config.get('fields') or [
+            field for field in self.config.get('statistical_fields', {}) if field in self.baseline_stats
+        ]
+        return [field for field in fields if field in df.columns]
+    
+    def _ensemble_fields(self, df: pd.DataFrame) -> List[str]:
+        """Ensemble feature fields present in a frame: the configured ones, else all statistical fields"""
+        ensemble_config = self.config.get('advanced_methods', {}).get('ensemble_methods', {})
+        fields = ensemble_config.get('fields') or [
+            field for field in self.config.get('statistical_fields', {}) if field in self.baseline_stats
+        ]
+        return [field for field in fields if field in df.columns]
+    
+    def detect_trend_breaks(self, data: BatchData) -> List[StatisticalAnomaly]:
+        """
+        Detect trend breaks and sudden changes.
+        
+        CUSUM state is kept per field (or per field and series when the field
+        sets 'trend_series_key') across calls, so consecutive batches of one
+        stream are scored as a single sequence. Use save_trend_state() and
+        load_trend_state() to carry it across processes.
+        """
+        anomalies = []
+        # Without timestamps the batch is scored in the order given
+        df = BatchContext.of(data).time_sorted
         
         for field in self.config.get('statistical_fields', {}):
             if field not in df.columns:
@@ -260,69 +663,79 @@ class StatisticalValidator:
             
             if not field_config.get('trend_detection', False):
                 continue
-                
-            values = df[field].dropna()
             
-            if len(values) < field_config.get('min_trend_samples', 20):
-                continue
-            
-            # Calculate rolling statistics
             window = field_config.get('trend_window', 7)
-            rolling_mean = values.rolling(window=window).mean()
-            rolling_std = values.rolling(window=window).std()
-            
-            # Detect sudden changes using CUSUM
             cusum_threshold = field_config.get('cusum_threshold', 2.0)
-            cusum_pos = 0
-            cusum_neg = 0
+            min_samples = field_config.get('min_trend_samples', 20)
+            series_key = field_config.get('trend_series_key')
             
-            for i in range(window, len(values)):
-                current_val = values.iloc[i]
-                expected_val = rolling_mean.iloc[i-1]
-                std_val = rolling_std.iloc[i-1]
-                
-                if pd.isna(expected_val) or pd.isna(std_val) or std_val == 0:
+            if series_key is not None and series_key in df.columns:
+                groups = df.groupby(series_key, sort=False)[field]
+            else:
+                groups = [(None, df[field])]
+            
+            for series, series_values in groups:
+                values = series_values.dropna().to_numpy(dtype=float)
+                if len(values) == 0:
                     continue
+                if isinstance(series, np.generic):
+                    series = series.item()
                 
-                # Standardized residual
-                residual = (current_val - expected_val) / std_val
-                
-                # CUSUM calculation
-                cusum_pos = max(0, cusum_pos + residual - 0.5)
-                cusum_neg = max(0, cusum_neg - residual - 0.5)
+                state = self._trend_state(field, series, window, cusum_threshold)
+                seen = state.position + len(values)
+                breaks = state.update(values)
+                # Too short a stream to trust yet; the values still warm up the state
+                if seen < min_samples:
+                    continue
                 
-                if cusum_pos > cusum_threshold or cusum_neg > cusum_threshold:
+                label = field if series is None else f"{field} ({series_key}={series})"
+                for position, value, score in breaks:
                     anomalies.append(StatisticalAnomaly(
                         field=field,
                         anomaly_type=AnomalyType.TREND_BREAK,
-                        value=current_val,
-                        score=max(cusum_pos, cusum_neg),
-                        confidence=min(max(cusum_pos, cusum_neg) / cusum_threshold, 1.0),
-                        message=f"Trend break detected in {field} at index {i}: {current_val} (CUSUM: {max(cusum_pos, cusum_neg):.2f})",
+                        value=value,
+                        score=score,
+                        confidence=min(score / cusum_threshold, 1.0),
+                        message=f"Trend break detected in {label} at index {position}: {value} (CUSUM: {score:.2f})",
                         reference_period=f"rolling_{window}_days"
                     ))
-                    
-                    # Reset CUSUM after detection
-                    cusum_pos = 0
-                    cusum_neg = 0
         
         return anomalies
     
-    def detect_seasonal_anomalies(self, data: List[Dict[str, Any]]) -> List[StatisticalAnomaly]:
+    def _trend_state(self, field: str, series: Any, window: int, threshold: float) -> CusumState:
+        """CUSUM state of a field/series, restarted if the configured window changed"""
+        key = (field, series)
+        state = self.trend_states.get(key)
+        if state is None or state.window != window:
+            state = self.trend_states[key] = CusumState(window, threshold)
+        state.threshold = float(threshold)
+        return state
+    
+    def save_trend_state(self, filename: str):
+        """Checkpoint the CUSUM state of every field/series to a file"""
+        save_cusum_states(filename, self.trend_states)
+    
+    def load_trend_state(self, filename: str):
+        """Resume trend detection from a checkpoint written by save_trend_state"""
+        self.trend_states = load_cusum_states(filename)
+    
+    def reset_trend_state(self):
+        """Forget all CUSUM state, so the next batch starts a new stream"""
+        self.trend_states = {}
+    
+    def detect_seasonal_anomalies(self, data: BatchData) -> List[StatisticalAnomaly]:
         """Detect seasonal anomalies using historical patterns"""
         anomalies = []
-        df = pd.DataFrame(data)
+        batch = BatchContext.of(data)
+        if len(batch) == 0:
+            return anomalies
         
-        if 'timestamp' not in df.columns:
-            df['timestamp'] = pd.date_range(start='2024-01-01', periods=len(df), freq='D')
-        
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['month'] = df['timestamp'].dt.month
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['hour'] = df['timestamp'].dt.hour
+        periods = batch.periods
+        if periods is None:
+            return anomalies
         
         for field in self.config.get('statistical_fields', {}):
-            if field not in df.columns:
+            if field not in batch.columns or field not in self.seasonal_profiles:
                 continue
                 
             field_config = self.config['statistical_fields'][field]
@@ -330,54 +743,55 @@ class StatisticalValidator:
             if not field_config.get('seasonal_detection', False):
                 continue
             
-            # Monthly seasonal pattern detection
-            if field_config.get('monthly_seasonality', True):
-                monthly_stats = self.historical_df.groupby('month')[field].agg(['mean', 'std'])
+            values = batch.numeric(field)
+            seasonal_threshold = field_config.get('seasonal_z_threshold', 2.5)
+            
+            for period, (flag, default) in SEASONALITY_FLAGS.items():
+                if not field_config.get(flag, default):
+                    continue
                 
-                for _, row in df.iterrows():
-                    month = row['month']
-                    value = row[field]
-                    
-                    if pd.isna(value):
-                        continue
-                        
-                    expected_mean = monthly_stats.loc[month, 'mean']
-                    expected_std = monthly_stats.loc[month, 'std']
-                    
-                    if expected_std > 0:
-                        z_score = abs(value - expected_mean) / expected_std
-                        seasonal_threshold = field_config.get('seasonal_z_threshold', 2.5)
-                        
-                        if z_score > seasonal_threshold:
-                            anomalies.append(StatisticalAnomaly(
-                                field=field,
-                                anomaly_type=AnomalyType.SEASONAL_ANOMALY,
-                                value=value,
-                                score=z_score,
-                                confidence=min(z_score / seasonal_threshold, 1.0),
-                                message=f"Seasonal anomaly in {field} for month {month}: {value} (expected: {expected_mean:.2f}±{expected_std:.2f})",
-                                reference_period=f"month_{month}_historical"
-                            ))
+                # Look up every row's expected mean/std in one gather
+                profile = self.seasonal_profiles[field][period]
+                rows = np.flatnonzero(~np.isnan(periods[period]))
+                labels = periods[period][rows].astype(int)
+                observed = values[rows]
+                expected_mean = profile.mean[labels - profile.offset]
+                expected_std = profile.std[labels - profile.offset]
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    z_scores = np.abs(observed - expected_mean) / expected_std
+                flagged = np.flatnonzero((expected_std > 0) & (z_scores > seasonal_threshold))
+                
+                for idx in flagged:
+                    label = labels[idx]
+                    anomalies.append(StatisticalAnomaly(
+                        field=field,
+                        anomaly_type=AnomalyType.SEASONAL_ANOMALY,
+                        value=observed[idx],
+                        score=z_scores[idx],
+                        confidence=min(z_scores[idx] / seasonal_threshold, 1.0),
+                        message=f"Seasonal anomaly in {field} for {period.replace('_', ' ')} {label}: {observed[idx]} (expected: {expected_mean[idx]:.2f}±{expected_std[idx]:.2f})",
+                        reference_period=f"{period}_{label}_historical"
+                    ))
         
         return anomalies
     
-    def validate_data_quality(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_data_quality(self, data: BatchData) -> Dict[str, Any]:
         """Comprehensive data quality assessment"""
-        df = pd.DataFrame(data)
+        batch = BatchContext.of(data)
         quality_metrics = {}
         
         for field in self.config.get('statistical_fields', {}):
-            if field not in df.columns:
+            if field not in batch.columns:
                 continue
                 
-            values = df[field]
+            values = batch.df[field]
             
             quality_metrics[field] = {
                 'completeness': 1 - values.isna().sum() / len(values),
                 'uniqueness': values.nunique() / len(values),
                 'consistency': self._calculate_consistency_score(values),
-                'validity': self._calculate_validity_score(values, field),
-                'accuracy': self._calculate_accuracy_score(values, field)
+                'validity': self._calculate_validity_score(batch, field),
+                'accuracy': self._calculate_accuracy_score(batch, field)
             }
         
         return quality_metrics
@@ -396,27 +810,41 @@ class StatisticalValidator:
         
         return min(consistency, 1.0)
     
-    def _calculate_validity_score(self, values: pd.Series, field: str) -> float:
-        """Calculate validity score based on field-specific rules"""
+    def _valid_range_mask(self, batch: BatchContext, field: str) -> Optional[pd.Series]:
+        """Mask of the values inside the field's valid_range, or None without one"""
         field_config = self.config.get('statistical_fields', {}).get(field, {})
+        if 'valid_range' not in field_config:
+            return None
         
-        if 'valid_range' in field_config:
+        def compute():
             min_val, max_val = field_config['valid_range']
-            valid_count = ((values >= min_val) & (values <= max_val)).sum()
-            return valid_count / len(values)
+            values = batch.df[field]
+            return (values >= min_val) & (values <= max_val)
+        return batch.cached(('valid_range', field), compute)
+    
+    def _baseline_deviation(self, batch: BatchContext, field: str) -> pd.Series:
+        """Absolute deviation of every value from the baseline mean"""
+        return batch.cached(('baseline_deviation', field),
+                            lambda: abs(batch.df[field] - self.baseline_stats[field]['mean']))
+    
+    def _calculate_validity_score(self, batch: BatchContext, field: str) -> float:
+        """Calculate validity score based on field-specific rules"""
+        in_range = self._valid_range_mask(batch, field)
+        
+        if in_range is not None:
+            return in_range.sum() / len(in_range)
         
         return 1.0  # Default to valid if no rules specified
     
-    def _calculate_accuracy_score(self, values: pd.Series, field: str) -> float:
+    def _calculate_accuracy_score(self, batch: BatchContext, field: str) -> float:
         """Calculate accuracy score against baseline if available"""
         if field in self.baseline_stats:
-            baseline_mean = self.baseline_stats[field]['mean']
             baseline_std = self.baseline_stats[field]['std']
             
             # Calculate how many values fall within reasonable range of baseline
             reasonable_range = 2 * baseline_std
-            within_range = abs(values - baseline_mean) <= reasonable_range
-            return within_range.sum() / len(values)
+            within_range = self._baseline_deviation(batch, field) <= reasonable_range
+            return within_range.sum() / len(within_range)
         
         return 1.0  # Default to accurate if no baseline
     
@@ -433,35 +861,93 @@ class StatisticalValidator:
         else:
             return 'text'
     
-    def run_all_statistical_validations(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Run all statistical validation methods"""
-        all_anomalies = []
+    def run_all_statistical_validations(self, data: BatchData) -> Dict[str, Any]:
+        """
+        Run all statistical validation methods.
+        
+        The checks run as a DetectorGraph: shared per-field products
+        (present and sorted values, z-scores, quartiles, range masks,
+        baseline deviations) are computed once, and detectors that don't
+        depend on each other run concurrently (max_workers from the
+        performance section).
+        
+        Args:
+            data: Records, a DataFrame, a pyarrow Table or a BatchContext.
+                The batch is ingested once and every detector reads from
+                the same context.
+        
+        Returns:
+            Anomalies and quality metrics; 'timings' holds the seconds
+            spent in every graph node
+        """
+        batch = BatchContext.of(data)
+        graph = self._build_detector_graph(batch)
+        results = graph.run()
+        self.last_timings = graph.timings
         
-        # Distribution shift detection
-        if hasattr(self, 'historical_df') and len(self.historical_df) > 0:
-            all_anomalies.extend(self.validate_distribution_shift(data))
-        
-        # Outlier detection
-        all_anomalies.extend(self.detect_outliers(data))
-        
-        # Trend break detection
-        all_anomalies.extend(self.detect_trend_breaks(data))
-        
-        # Seasonal anomaly detection
-        if hasattr(self, 'historical_df') and len(self.historical_df) > 0:
-            all_anomalies.extend(self.detect_seasonal_anomalies(data))
+        all_anomalies = []
+        for stage in DETECTOR_STAGES:
+            all_anomalies.extend(results.get(stage, []))
         
         # Data quality assessment
-        quality_metrics = self.validate_data_quality(data)
+        quality_metrics = results['data_quality']
         
         return {
             'anomalies': all_anomalies,
             'quality_metrics': quality_metrics,
             'total_anomalies': len(all_anomalies),
             'anomaly_types': {atype.value: len([a for a in all_anomalies if a.anomaly_type == atype]) 
-                             for atype in AnomalyType}
+                             for atype in AnomalyType},
+            'timings': graph.timings
         }
-
+    
+    def _build_detector_graph(self, batch: BatchContext) -> DetectorGraph:
+        """
+        Dependency graph of the shared batch products and the detector stages.
+        
+        Product nodes fill the batch context's cache, so the detectors that
+        depend on them read the cached values instead of recomputing them.
+        """
+        performance = self.config.get('performance', {})
+        graph = DetectorGraph(performance.get('max_workers') if performance.get('parallel_processing', False) else 1)
+        has_history = hasattr(self, 'historical_df') and len(self.historical_df) > 0
+        
+        graph.add('timestamps', lambda: batch.timestamps)
+        graph.add('periods', lambda: batch.periods, ['timestamps'])
+        graph.add('time_sorted', lambda: batch.time_sorted, ['timestamps'])
+        
+        products = {'numeric': [], 'sorted': [], 'zscores': [], 'quartiles': [], 'valid_range': [], 'baseline_deviation': []}
+        for field in self.config.get('statistical_fields', {}):
+            if field not in batch.columns or not pd.api.types.is_numeric_dtype(batch.df[field]):
+                continue
+            # Bind the field now; the lambdas run later on worker threads
+            graph.add(f'{field}.present', lambda field=field: batch.present(field))
+            graph.add(f'{field}.numeric', lambda field=field: batch.numeric(field))
+            graph.add(f'{field}.sorted', lambda field=field: batch.sorted_numeric(field), [f'{field}.numeric'])
+            graph.add(f'{field}.zscores', lambda field=field: batch.zscores(field), [f'{field}.present'])
+            graph.add(f'{field}.quartiles', lambda field=field: batch.quartiles(field), [f'{field}.present'])
+            graph.add(f'{field}.valid_range', lambda field=field: self._valid_range_mask(batch, field))
+            products['numeric'].append(f'{field}.numeric')
+            products['sorted'].append(f'{field}.sorted')
+            products['zscores'].append(f'{field}.zscores')
+            products['quartiles'].append(f'{field}.quartiles')
+            products['valid_range'].append(f'{field}.valid_range')
+            if field in self.baseline_stats:
+                graph.add(f'{field}.baseline_deviation', lambda field=field: self._baseline_deviation(batch, field))
+                products['baseline_deviation'].append(f'{field}.baseline_deviation')
+        
+        if has_history:
+            graph.add('distribution_shift', lambda: self.validate_distribution_shift(batch), products['sorted'])
+            graph.add('seasonal_anomalies', lambda: self.detect_seasonal_anomalies(batch),
+                      ['periods'] + products['numeric'])
+        graph.add('outliers', lambda: self.detect_outliers(batch), products['zscores'] + products['quartiles'])
+        graph.add('ensemble_anomalies', lambda: self.detect_ensemble_anomalies(batch))
+        graph.add('cluster_anomalies', lambda: self.detect_cluster_anomalies(batch))
+        graph.add('trend_breaks', lambda: self.detect_trend_breaks(batch), ['time_sorted'])
+        graph.add('data_quality', lambda: self.validate_data_quality(batch),
+                  products['valid_range'] + products['baseline_deviation'])
+        return graph
+    
 # Example usage
 if __name__ == "__main__":
     # Sample configuration would be loaded from file
@@ -194,22 +194,19 @@ def run_validation_demo():
         print("\n=== VALIDATING CURRENT DATA ===")
         current_df = pd.DataFrame(demo.current_data)
         
-        validation_results = []
-        anomaly_count = 0
+        validation_results = validator.validate_frame(current_df, config)
+        anomaly_count = int((~validation_results.is_valid).sum())
         
-        for idx, record in current_df.iterrows():
-            result = validator.validate_record(record.to_dict(), config)
-            validation_results.append(result)
-            
-            if not result['is_valid']:
-                anomaly_count += 1
-                print(f"\n🚨 ANOMALY DETECTED - Record {idx + 1}:")
-                print(f"   Product: {record['name']}")
-                print(f"   Category: {record['category']}")
-                print(f"   Issues found:")
-                for issue in result['issues']:
-                    print(f"     - {issue}")
-                print(f"   Confidence: {result['confidence']:.2f}")
+        for idx in np.flatnonzero(~validation_results.is_valid):
+            result = validation_results[idx]
+            record = current_df.iloc[idx]
+            print(f"\n🚨 ANOMALY DETECTED - Record {idx + 1}:")
+            print(f"   Product: {record['name']}")
+            print(f"   Category: {record['category']}")
+            print(f"   Issues found:")
+            for issue in result['issues']:
+                print(f"     - {issue}")
+            print(f"   Confidence: {result['confidence']:.2f}")
         
         # Summary statistics
         print(f"\n=== VALIDATION SUMMARY ===")
@@ -220,13 +217,10 @@ def run_validation_demo():
         
         # Show some examples of valid records
         print(f"\n=== SAMPLE VALID RECORDS ===")
-        valid_count = 0
-        for idx, result in enumerate(validation_results):
-            if result['is_valid'] and valid_count < 3:
-                record = current_df.iloc[idx]
-                print(f"✅ Record {idx + 1}: {record['name']}")
-                print(f"   Price: ${record['price']:.2f}, Rating: {record['rating']}, Reviews: {record['review_count']}")
-                valid_count += 1
+        for idx in np.flatnonzero(validation_results.is_valid)[:3]:
+            record = current_df.iloc[idx]
+            print(f"✅ Record {idx + 1}: {record['name']}")
+            print(f"   Price: ${record['price']:.2f}, Rating: {record['rating']}, Reviews: {record['review_count']}")
         
         # Generate validation report
         print(f"\n=== GENERATING VALIDATION REPORT ===")
@@ -1,12 +1,25 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union, Iterable
 from datetime import datetime
 import json
-from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+from validation_plan import ValidationPlan, FieldPlan, MultivariatePlan, BASELINE_AUX_KEYS, percentile_ranks
+from categorical_index import CategoricalIndex, CategoryCounts
+from frequency_sketch import SketchedCategories
+from validation_issues import ValidationIssue
+from validation_results import ValidationResults, IssueTableBuilder
+from validation_report import ReportAccumulator
+from pattern_rules import PatternRegistry
+from schema_inference import ColumnSchema, infer_schema, downcast_frame, referenced_columns, baseline_columns
+from baseline_builder import BaselineAccumulator, CategoricalSketchAccumulator, multivariate_stats
+from baseline_snapshot import write_snapshot, read_snapshot
+from baseline_profiler import (
+    profile_columns, numeric_column_stats, categorical_column_stats, categorical_counts
+)
+
 
 class StatisticalValidator:
     """
@@ -17,6 +30,12 @@ class StatisticalValidator:
     def __init__(self):
         self.baseline_stats = {}
         self.field_types = {}
+        # Column kinds from the last schema-inference pass (see schema_inference)
+        self.schema: Dict[str, ColumnSchema] = {}
+        # Compiled plan is rebuilt whenever the baseline or config version changes
+        self._baseline_version = 0
+        self._plan: Optional[ValidationPlan] = None
+        self._patterns = PatternRegistry()
         self.validation_methods = {
             'z_score': self._validate_z_score,
             'iqr': self._validate_iqr,
@@ -26,126 +45,191 @@ class StatisticalValidator:
             'correlation': self._validate_correlation
         }
     
-    def calculate_baseline_stats(self, historical_data: pd.DataFrame) -> None:
+    def calculate_baseline_stats(self, historical_data: pd.DataFrame, workers: int = 1,
+                                 config=None, sample_size: int = 10000,
+                                 categorical_memory: Optional[int] = None) -> None:
         """
         Calculate baseline statistics from historical data.
         
+        A sampled schema-inference pass runs first. Identifier, timestamp and
+        free-text columns are recorded in self.schema but not profiled, and
+        numeric columns are downcast (int32, float32 where exact). Columns
+        whose thresholds need a baseline are always profiled; high-cardinality
+        ones through a bounded-memory sketch.
+        
         Args:
             historical_data: DataFrame containing historical records
+            workers: Number of processes used to profile columns in parallel.
+                Results are identical for any worker count.
+            config: Optional ThresholdConfig; when given, only columns it has
+                thresholds for are profiled
+            sample_size: Number of rows sampled for schema inference
+            categorical_memory: If set, categorical fields keep a Space-Saving
+                top-K plus Count-Min sketch of about this many bytes each
+                instead of exact value counts (high-cardinality fields always
+                do, with the sketch's default budget when this is None)
         """
         print("Calculating baseline statistics...")
+        self._baseline_version += 1
         
-        # Identify numeric and categorical columns
-        numeric_columns = historical_data.select_dtypes(include=[np.number]).columns
-        categorical_columns = historical_data.select_dtypes(include=['object']).columns
-        
-        for column in historical_data.columns:
-            if column in numeric_columns:
-                self.field_types[column] = 'numeric'
-                self._calculate_numeric_stats(historical_data, column)
-            elif column in categorical_columns:
-                self.field_types[column] = 'categorical'
-                self._calculate_categorical_stats(historical_data, column)
+        self.schema = infer_schema(historical_data, sample_size, required=baseline_columns(config))
+        referenced = referenced_columns(config)
+        profiled_columns = [
+            column for column, column_schema in self.schema.items()
+            if column_schema.profiled and (referenced is None or column in referenced)
+        ]
+        numeric_columns = [column for column in profiled_columns
+                           if self.schema[column].kind == 'numeric']
+        categorical_columns = [column for column in profiled_columns
+                               if self.schema[column].kind == 'categorical']
+        
+        sketched_columns = [column for column in categorical_columns
+                            if categorical_memory is not None or self.schema[column].high_cardinality]
+        exact_columns = [column for column in categorical_columns if column not in sketched_columns]
+        
+        profile_data = downcast_frame(historical_data, self.schema, profiled_columns)
+        profiles = profile_columns(profile_data, numeric_columns, exact_columns, workers=workers)
+        for column in sketched_columns:
+            accumulator = (CategoricalSketchAccumulator(categorical_memory) if categorical_memory is not None
+                           else CategoricalSketchAccumulator())
+            accumulator.update(profile_data[column])
+            profiles[column] = accumulator.to_stats()
+        
+        for column in profiled_columns:
+            self.field_types[column] = self.schema[column].kind
+            if profiles[column] is not None:
+                self.baseline_stats[column] = profiles[column]
+        
+        skipped = [column for column, column_schema in self.schema.items() if not column_schema.profiled]
+        if skipped:
+            print(f"Skipped profiling for identifier/timestamp/text columns: {', '.join(skipped)}")
         
         # Calculate correlations for numeric fields
         if len(numeric_columns) > 1:
             correlation_matrix = historical_data[numeric_columns].corr()
             self.baseline_stats['correlations'] = correlation_matrix.to_dict()
+            
+            # Mean vector and covariance factor for the Mahalanobis check
+            complete_rows = historical_data[numeric_columns].dropna().to_numpy(dtype=float)
+            if len(complete_rows) > 1:
+                multivariate = multivariate_stats(
+                    list(numeric_columns), len(complete_rows), complete_rows.mean(axis=0),
+                    np.cov(complete_rows, rowvar=False)
+                )
+                if multivariate is not None:
+                    self.baseline_stats['multivariate'] = multivariate
         
         print(f"Baseline statistics calculated for {len(self.baseline_stats)} fields")
     
-    def _calculate_numeric_stats(self, data: pd.DataFrame, column: str) -> None:
-        """Calculate statistics for numeric columns"""
-        values = data[column].dropna()
-        
-        if len(values) == 0:
-            return
-        
-        # Basic statistics
-        stats_dict = {
-            'mean': float(values.mean()),
-            'median': float(values.median()),
-            'std': float(values.std()),
-            'min': float(values.min()),
-            'max': float(values.max()),
-            'count': len(values),
-            'q1': float(values.quantile(0.25)),
-            'q3': float(values.quantile(0.75)),
-        }
+    def calculate_baseline_stats_streaming(self, chunks: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                                           accumulator: Optional[BaselineAccumulator] = None,
+                                           sketch_k: int = 200,
+                                           categorical_memory: Optional[int] = None) -> BaselineAccumulator:
+        """
+        Calculate baseline statistics from chunks of historical data.
         
-        # IQR calculations
-        iqr = stats_dict['q3'] - stats_dict['q1']
-        stats_dict['iqr'] = iqr
-        stats_dict['lower_fence'] = stats_dict['q1'] - 1.5 * iqr
-        stats_dict['upper_fence'] = stats_dict['q3'] + 1.5 * iqr
+        Each chunk is folded into a BaselineAccumulator (Welford-style moments
+        and mergeable quantile sketches), so the full history never has to be
+        in memory at once.
         
-        # Distribution analysis
-        try:
-            # Test for normality
-            _, p_value = stats.normaltest(values)
-            stats_dict['is_normal'] = p_value > 0.05
+        Args:
+            chunks: DataFrame or iterable of DataFrame chunks (e.g. one per day)
+            accumulator: Existing accumulator to continue from
+            sketch_k: Quantile sketch size; larger is more accurate
+            categorical_memory: If set, bytes per categorical field for bounded
+                heavy-hitter sketches instead of exact value counts
             
-            # Skewness and kurtosis
-            stats_dict['skewness'] = float(stats.skew(values))
-            stats_dict['kurtosis'] = float(stats.kurtosis(values))
-        except:
-            stats_dict['is_normal'] = False
-            stats_dict['skewness'] = 0
-            stats_dict['kurtosis'] = 0
-        
-        self.baseline_stats[column] = stats_dict
+        Returns:
+            The accumulator, which can be merged with accumulators from other workers
+        """
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        if accumulator is None:
+            accumulator = BaselineAccumulator(sketch_k, categorical_memory)
+        
+        for chunk in chunks:
+            accumulator.update(chunk)
+        
+        self.set_baseline_from_accumulator(accumulator)
+        return accumulator
+    
+    def set_baseline_from_accumulator(self, accumulator: BaselineAccumulator) -> None:
+        """
+        Use the statistics of a (possibly merged) BaselineAccumulator as baseline.
+        
+        Args:
+            accumulator: Accumulator built with BaselineAccumulator.update/merge
+        """
+        baseline_stats, field_types = accumulator.finalize()
+        if accumulator.schema is not None:
+            self.schema.update(accumulator.schema)
+        self.baseline_stats.update(baseline_stats)
+        self.field_types.update(field_types)
+        self._baseline_version += 1
+        print(f"Baseline statistics calculated for {len(self.baseline_stats)} fields")
+    
+    def _calculate_numeric_stats(self, data: pd.DataFrame, column: str) -> None:
+        """Calculate statistics for numeric columns"""
+        stats_dict = numeric_column_stats(data[column].to_numpy())
+        if stats_dict is not None:
+            self.baseline_stats[column] = stats_dict
     
     def _calculate_categorical_stats(self, data: pd.DataFrame, column: str) -> None:
         """Calculate statistics for categorical columns"""
-        values = data[column].dropna()
-        
-        if len(values) == 0:
-            return
-        
-        value_counts = values.value_counts()
-        total_count = len(values)
-        
-        stats_dict = {
-            'unique_values': list(value_counts.index),
-            'value_counts': value_counts.to_dict(),
-            'total_count': total_count,
-            'unique_count': len(value_counts),
-            'most_common': value_counts.index[0] if len(value_counts) > 0 else None,
-            'most_common_freq': float(value_counts.iloc[0] / total_count) if len(value_counts) > 0 else 0,
-            'entropy': float(stats.entropy(value_counts.values))
-        }
-        
-        self.baseline_stats[column] = stats_dict
+        stats_dict = categorical_column_stats(*categorical_counts(data[column].to_numpy(dtype=object)))
+        if stats_dict is not None:
+            self.baseline_stats[column] = stats_dict
     
-    def validate_record(self, record: Dict[str, Any], config) -> Dict[str, Any]:
+    def validate_record(self, record: Dict[str, Any], config,
+                        timestamp: Optional[str] = None,
+                        mode: str = 'full') -> Union[Dict[str, Any], bool]:
         """
         Validate a single record against baseline statistics and thresholds.
         
         Args:
             record: Dictionary containing the record to validate
             config: ThresholdConfig object with validation thresholds
+            timestamp: Timestamp to stamp on the result; batch callers can pass
+                one shared value instead of formatting the clock per record
+            mode: 'full' for the detailed result, or 'gate' to only return
+                whether the record is valid, stopping at the first failed rule
             
         Returns:
-            Dictionary with validation results
+            Dictionary with validation results. 'issues' and 'warnings' hold
+            ValidationIssue entries; use str() or .message for the text.
+            In 'gate' mode, just the validity as a bool.
         """
+        if mode == 'gate':
+            return self._passes_record(self._get_plan(config), record)
+        if mode != 'full':
+            raise ValueError(f"Unknown validation mode: {mode}")
+        
         validation_result = {
             'is_valid': True,
             'issues': [],
             'warnings': [],
             'confidence': 1.0,
             'field_scores': {},
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp if timestamp is not None else datetime.now().isoformat()
         }
         
         issue_count = 0
         total_checks = 0
+        plan = self._get_plan(config)
         
         # Validate each field
+        field_results = {}
         for field, value in record.items():
-            if field not in self.baseline_stats:
-                continue
-                
-            field_result = self._validate_field(field, value, config)
+            field_plan = plan.fields.get(field)
+            if field_plan is not None:
+                field_results[field] = self._validate_field(field_plan, value)
+        
+        # The multivariate check counts as one more field when all its fields are present
+        multivariate = plan.multivariate
+        if multivariate is not None and all(field in record for field in multivariate.fields):
+            field_results[multivariate.name] = self._validate_multivariate(multivariate, record)
+        
+        for field, field_result in field_results.items():
             validation_result['field_scores'][field] = field_result
             
             if not field_result['is_valid']:
@@ -164,7 +248,46 @@ class StatisticalValidator:
         
         return validation_result
     
-    def _validate_field(self, field: str, value: Any, config) -> Dict[str, Any]:
+    def _passes_record(self, plan: ValidationPlan, record: Dict[str, Any]) -> bool:
+        """Gate-mode validation: no scores, warnings or confidence"""
+        for field, value in record.items():
+            field_plan = plan.fields.get(field)
+            if field_plan is not None and not self._passes_field(field_plan, value):
+                return False
+        
+        multivariate = plan.multivariate
+        if multivariate is not None and all(field in record for field in multivariate.fields):
+            return self._validate_multivariate(multivariate, record)['is_valid']
+        return True
+    
+    def _passes_field(self, plan: FieldPlan, value: Any) -> bool:
+        """Check a single value against the field's rules, stopping at the first failure"""
+        if value is not None:
+            if plan.field_type == 'numeric':
+                if plan.z_threshold is not None and abs(value - plan.mean) / plan.std > plan.z_threshold:
+                    return False
+                for bounds in (plan.iqr_bounds, plan.range_bounds, plan.percentile_bounds):
+                    if bounds is not None and (value < bounds[0] or value > bounds[1]):
+                        return False
+            elif plan.field_type == 'categorical':
+                if plan.allowed_values is not None:
+                    if value not in plan.allowed_values:
+                        return False
+                elif plan.reject_new_categories and value not in plan.categories:
+                    return False
+        
+        return plan.text_rule is None or plan.text_rule.check(value) is None
+    
+    def _get_plan(self, config) -> ValidationPlan:
+        """Return the compiled validation plan for config, recompiling it if stale"""
+        if self._plan is None or not self._plan.is_current(config, self._baseline_version):
+            self._plan = ValidationPlan.compile(
+                self.baseline_stats, self.field_types, config, self._baseline_version,
+                self._patterns
+            )
+        return self._plan
+    
+    def _validate_field(self, field_plan: FieldPlan, value: Any) -> Dict[str, Any]:
         """Validate a single field value"""
         result = {
             'is_valid': True,
@@ -173,102 +296,397 @@ class StatisticalValidator:
             'scores': {}
         }
         
-        if field not in self.baseline_stats:
-            return result
-        
-        field_stats = self.baseline_stats[field]
-        field_type = self.field_types.get(field, 'unknown')
+        # Apply validation methods based on field type and configured thresholds.
+        # NaN fails no numeric check, so like None it is left unscored, as in validate_frame
+        if field_plan.field_type == 'numeric' and value is not None and value == value:
+            self._validate_numeric_field(field_plan, value, result)
+        elif field_plan.field_type == 'categorical' and value is not None:
+            self._validate_categorical_field(field_plan, value, result)
+        
+        # Text rules also judge missing values, which can't be empty if allow_empty is off
+        if field_plan.text_rule is not None:
+            failed_rule = field_plan.text_rule.check(value)
+            if failed_rule is not None:
+                result['is_valid'] = False
+                bound = field_plan.text_rule.pattern if failed_rule == 'pattern' else None
+                result['issues'].append(ValidationIssue(field_plan.field, failed_rule, value, bound))
         
-        # Get thresholds for this field
-        field_thresholds = config.get_field_thresholds(field)
+        return result
+    
+    def _validate_multivariate(self, plan: MultivariatePlan, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Check a record's combination of numeric fields against the baseline covariance"""
+        result = {
+            'is_valid': True,
+            'issues': [],
+            'warnings': [],
+            'scores': {}
+        }
         
-        # Apply validation methods based on field type and configured thresholds
-        if field_type == 'numeric' and value is not None:
-            self._validate_numeric_field(field, value, field_stats, field_thresholds, result)
-        elif field_type == 'categorical' and value is not None:
-            self._validate_categorical_field(field, value, field_stats, field_thresholds, result)
+        values = tuple(record[field] for field in plan.fields)
+        try:
+            vector = np.array([values], dtype=float)
+        except (TypeError, ValueError):
+            return result
+        # Records with a missing component are not scored
+        if np.isnan(vector).any():
+            return result
         
+        distance = float(plan.distances(vector)[0])
+        result['scores']['mahalanobis'] = distance
+        if distance > plan.threshold:
+            result['is_valid'] = False
+            result['issues'].append(ValidationIssue(plan.name, 'mahalanobis', values,
+                                                    plan.threshold, distance))
         return result
-    
-    def _validate_numeric_field(self, field: str, value: float, stats: Dict, 
-                              thresholds: Dict, result: Dict) -> None:
+
+    def validate_frame(self, df: pd.DataFrame, config) -> ValidationResults:
+        """
+        Validate a whole DataFrame column by column using NumPy boolean masks.
+
+        Produces the same validity, confidence, field scores, issues and
+        warnings as calling validate_record on every row, without a per-row
+        Python loop.
+
+        Args:
+            df: DataFrame containing the records to validate
+            config: ThresholdConfig object with validation thresholds
+
+        Returns:
+            ValidationResults holding the columnar results
+        """
+        n_rows = len(df)
+        plan = self._get_plan(config)
+        fields = [field for field in dict.fromkeys(df.columns) if field in plan.fields]
+        column_fields = list(fields)
+        multivariate = plan.multivariate
+        if multivariate is not None and all(field in df.columns for field in multivariate.fields):
+            fields.append(multivariate.name)
+        else:
+            multivariate = None
+
+        field_valid = np.ones((n_rows, len(fields)), dtype=bool)
+        score_fields = []
+        score_names = []
+        score_columns = []
+        issues = IssueTableBuilder()
+        warnings = IssueTableBuilder()
+        bounds = {}
+
+        for field_id, field in enumerate(column_fields):
+            field_plan = plan.fields[field]
+            column = df[field]
+            field_result = self._validate_column(field_plan, column)
+            field_valid[:, field_id] = field_result['is_valid']
+
+            for name, field_scores in field_result['scores'].items():
+                score_fields.append(field)
+                score_names.append(name)
+                score_columns.append(field_scores)
+
+            raw_values = column.to_numpy()
+            for rule, mask, scores in field_result['issues']:
+                issues.add(field_id, rule, mask, raw_values, scores)
+            for rule, mask, scores in field_result['warnings']:
+                warnings.add(field_id, rule, mask, raw_values, scores)
+            bounds.update({(field, rule): bound for rule, bound in field_plan.bounds().items()})
+
+        if multivariate is not None:
+            field_id = len(column_fields)
+            distances, values = self._validate_multivariate_frame(multivariate, df)
+            failed = distances > multivariate.threshold
+            field_valid[:, field_id] = ~failed
+            score_fields.append(multivariate.name)
+            score_names.append('mahalanobis')
+            score_columns.append(distances)
+            issues.add(field_id, 'mahalanobis', failed, values, distances)
+            bounds.update({(multivariate.name, rule): bound
+                           for rule, bound in multivariate.bounds().items()})
+
+        issue_count = (~field_valid).sum(axis=1)
+        if fields:
+            confidence = np.maximum(0.0, 1.0 - (issue_count / len(fields)))
+        else:
+            confidence = np.ones(n_rows)
+
+        scores = np.column_stack(score_columns) if score_columns else np.empty((n_rows, 0))
+
+        return ValidationResults(
+            is_valid=issue_count == 0,
+            confidence=confidence,
+            fields=fields,
+            field_valid=field_valid,
+            score_fields=score_fields,
+            scores=scores,
+            issues=issues.build(),
+            warnings=warnings.build(),
+            bounds=bounds,
+            timestamp=datetime.now().isoformat(),
+            score_names=score_names
+        )
+
+    # Gate-mode field order: plain comparisons first, hash lookups next, regexes last
+    _GATE_ORDER = {'numeric': 0, 'categorical': 1, 'text': 2}
+
+    def is_valid_batch(self, df: pd.DataFrame, config) -> np.ndarray:
+        """
+        Gate-mode validation of a whole DataFrame.
+
+        Returns the same validity as validate_frame but skips scores, warnings,
+        issue tables and confidence. Fields are checked cheapest first, and
+        each field only looks at the rows that are still valid.
+
+        Args:
+            df: DataFrame containing the records to validate
+            config: ThresholdConfig object with validation thresholds
+
+        Returns:
+            Boolean mask, True for valid rows
+        """
+        plan = self._get_plan(config)
+        valid = np.ones(len(df), dtype=bool)
+        fields = sorted(
+            (field for field in dict.fromkeys(df.columns) if field in plan.fields),
+            key=lambda field: (self._GATE_ORDER.get(plan.fields[field].field_type, len(self._GATE_ORDER)),
+                               plan.fields[field].text_rule is not None)
+        )
+
+        remaining = np.arange(len(df))
+        for field in fields:
+            if len(remaining) == 0:
+                return valid
+            column = df[field]
+            if len(remaining) < len(df):
+                column = column.iloc[remaining]
+            failed = self._column_fails(plan.fields[field], column)
+            valid[remaining[failed]] = False
+            remaining = remaining[~failed]
+
+        multivariate = plan.multivariate
+        if (multivariate is not None and len(remaining) > 0
+                and all(field in df.columns for field in multivariate.fields)):
+            distances = self._multivariate_distances(multivariate, df.iloc[remaining])
+            valid[remaining[distances > multivariate.threshold]] = False
+
+        return valid
+
+    def _column_fails(self, plan: FieldPlan, column: pd.Series) -> np.ndarray:
+        """Boolean mask of the values that fail any of the field's rules"""
+        failed = np.zeros(len(column), dtype=bool)
+
+        if plan.field_type == 'numeric':
+            values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+            if plan.z_threshold is not None:
+                failed |= np.abs(values - plan.mean) / plan.std > plan.z_threshold
+            for bounds in (plan.iqr_bounds, plan.range_bounds, plan.percentile_bounds):
+                if bounds is not None:
+                    failed |= (values < bounds[0]) | (values > bounds[1])
+        elif plan.field_type == 'categorical':
+            present = column.to_numpy(dtype=object) != None  # noqa: E711
+            if plan.allowed_values is not None:
+                failed |= present & ~column.isin(plan.allowed_values).to_numpy()
+            elif plan.reject_new_categories:
+                failed |= present & ~plan.categories.isin(column)
+
+        if plan.text_rule is not None:
+            # Regexes only run on values that passed everything else
+            passing = np.flatnonzero(~failed)
+            empty_failed, pattern_failed = plan.text_rule.check_column(column.iloc[passing])
+            failed[passing[empty_failed | pattern_failed]] = True
+
+        return failed
+
+    def _multivariate_distances(self, plan: MultivariatePlan, df: pd.DataFrame) -> np.ndarray:
+        """Mahalanobis distances for every row of a frame, NaN where a component is missing"""
+        matrix = np.column_stack([
+            pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=float) for field in plan.fields
+        ])
+        complete = ~np.isnan(matrix).any(axis=1)
+        distances = np.full(len(df), np.nan)
+        distances[complete] = plan.distances(matrix[complete])
+        return distances
+
+    def _validate_multivariate_frame(self, plan: MultivariatePlan,
+                                     df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mahalanobis distances for every row of a frame in one matrix operation.
+
+        Returns:
+            Tuple of (distances, values): distances are NaN for rows with a
+            missing component, values hold the field tuples of flagged rows
+        """
+        distances = self._multivariate_distances(plan, df)
+
+        # Issue values are only materialized for rows that fail the check
+        values = np.empty(len(df), dtype=object)
+        raw = df[plan.fields].to_numpy(dtype=object)
+        for row in np.flatnonzero(distances > plan.threshold):
+            values[row] = tuple(raw[row])
+        return distances, values
+
+    def _validate_column(self, field_plan: FieldPlan, column: pd.Series) -> Dict[str, Any]:
+        """
+        Validate every value of a single column, mirroring _validate_field.
+
+        Issues and warnings are returned as (rule, mask, scores) tuples.
+        """
+        result = {
+            'is_valid': np.ones(len(column), dtype=bool),
+            'issues': [],
+            'warnings': [],
+            'scores': {}
+        }
+
+        if field_plan.field_type == 'numeric':
+            # Missing values become NaN, which fails every comparison below
+            values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+            self._validate_numeric_column(field_plan, values, result)
+        elif field_plan.field_type == 'categorical':
+            self._validate_categorical_column(field_plan, column, result)
+
+        if field_plan.text_rule is not None:
+            empty_failed, pattern_failed = field_plan.text_rule.check_column(column)
+            result['issues'].append(('empty', empty_failed, None))
+            result['issues'].append(('pattern', pattern_failed, None))
+
+        for _, mask, _ in result['issues']:
+            result['is_valid'] &= ~mask
+
+        return result
+
+    def _validate_numeric_column(self, plan: FieldPlan, values: np.ndarray,
+                                 result: Dict) -> None:
+        """Vectorized counterpart of _validate_numeric_field"""
+        if plan.z_warning_band is not None:
+            z_scores = np.abs(values - plan.mean) / plan.std
+
+        if plan.z_threshold is not None:
+            result['scores']['z_score'] = z_scores
+            result['issues'].append(('z_score', z_scores > plan.z_threshold, z_scores))
+
+        if plan.iqr_bounds is not None:
+            lower_bound, upper_bound = plan.iqr_bounds
+            result['issues'].append(('iqr', (values < lower_bound) | (values > upper_bound), None))
+
+        if plan.range_bounds is not None:
+            min_val, max_val = plan.range_bounds
+            result['issues'].append(('range', (values < min_val) | (values > max_val), None))
+
+        if plan.percentile_bounds is not None:
+            percentiles = percentile_ranks(plan.quantiles, values)
+            result['scores']['percentile'] = percentiles
+            lower_bound, upper_bound = plan.percentile_bounds
+            result['issues'].append(('percentile', (values < lower_bound) | (values > upper_bound),
+                                     percentiles))
+
+        if plan.z_warning_band is not None:
+            warn_lower, warn_upper = plan.z_warning_band
+            moderate = (z_scores > warn_lower) & (z_scores <= warn_upper)
+            result['warnings'].append(('moderate_deviation', moderate, z_scores))
+
+    def _validate_categorical_column(self, plan: FieldPlan, column: pd.Series,
+                                     result: Dict) -> None:
+        """Vectorized counterpart of _validate_categorical_field"""
+        # validate_record skips None values entirely, but still checks NaN
+        present = column.to_numpy(dtype=object) != None  # noqa: E711
+        frequencies = plan.categories.frequencies_of(column)
+        known = ~np.isnan(frequencies)
+
+        if plan.allowed_values is not None:
+            allowed = column.isin(plan.allowed_values).to_numpy()
+            result['issues'].append(('allowed_values', present & ~allowed, None))
+        elif plan.reject_new_categories:
+            result['issues'].append(('new_category', present & ~known, None))
+        else:
+            result['warnings'].append(('new_category_warning', present & ~known, None))
+
+        if plan.min_frequency is not None:
+            result['warnings'].append(('low_frequency', frequencies < plan.min_frequency, frequencies))
+
+    def _validate_numeric_field(self, plan: FieldPlan, value: float, result: Dict) -> None:
         """Validate numeric field using various statistical methods"""
+        field = plan.field
+        
+        # The z-score feeds both the check and the warning, so compute it once
+        if plan.z_warning_band is not None:
+            z_score = abs(value - plan.mean) / plan.std
         
         # Z-score validation
-        if 'z_score' in thresholds and stats['std'] > 0:
-            z_score = abs(value - stats['mean']) / stats['std']
+        if plan.z_threshold is not None:
             result['scores']['z_score'] = z_score
             
-            if z_score > thresholds['z_score']:
+            if z_score > plan.z_threshold:
                 result['is_valid'] = False
                 result['issues'].append(
-                    f"{field}: Z-score {z_score:.2f} exceeds threshold {thresholds['z_score']}"
+                    ValidationIssue(field, 'z_score', value, plan.z_threshold, z_score)
                 )
         
         # IQR validation
-        if 'iqr_multiplier' in thresholds:
-            iqr_multiplier = thresholds['iqr_multiplier']
-            lower_bound = stats['q1'] - iqr_multiplier * stats['iqr']
-            upper_bound = stats['q3'] + iqr_multiplier * stats['iqr']
+        if plan.iqr_bounds is not None:
+            lower_bound, upper_bound = plan.iqr_bounds
             
             if value < lower_bound or value > upper_bound:
                 result['is_valid'] = False
                 result['issues'].append(
-                    f"{field}: Value {value} outside IQR bounds [{lower_bound:.2f}, {upper_bound:.2f}]"
+                    ValidationIssue(field, 'iqr', value, plan.iqr_bounds)
                 )
         
         # Range validation
-        if 'range' in thresholds:
-            min_val, max_val = thresholds['range']
+        if plan.range_bounds is not None:
+            min_val, max_val = plan.range_bounds
             if value < min_val or value > max_val:
                 result['is_valid'] = False
                 result['issues'].append(
-                    f"{field}: Value {value} outside allowed range [{min_val}, {max_val}]"
+                    ValidationIssue(field, 'range', value, plan.range_bounds)
                 )
         
-        # Percentile validation
-        if 'percentile_range' in thresholds:
-            lower_pct, upper_pct = thresholds['percentile_range']
-            # We'd need to store percentiles in baseline stats for this
-            pass
+        # Percentile validation against the stored quantile grid
+        if plan.percentile_bounds is not None:
+            percentile = float(percentile_ranks(plan.quantiles, value))
+            result['scores']['percentile'] = percentile
+            lower_bound, upper_bound = plan.percentile_bounds
+            if value < lower_bound or value > upper_bound:
+                result['is_valid'] = False
+                result['issues'].append(
+                    ValidationIssue(field, 'percentile', value, plan.percentile_range, percentile)
+                )
         
         # Add warnings for suspicious but not invalid values
-        if 'std' in stats and stats['std'] > 0:
-            z_score = abs(value - stats['mean']) / stats['std']
-            if z_score > 2.0 and z_score <= thresholds.get('z_score', 3.0):
+        if plan.z_warning_band is not None:
+            warn_lower, warn_upper = plan.z_warning_band
+            if z_score > warn_lower and z_score <= warn_upper:
                 result['warnings'].append(
-                    f"{field}: Moderate deviation (Z-score: {z_score:.2f})"
+                    ValidationIssue(field, 'moderate_deviation', value, plan.z_warning_band, z_score)
                 )
     
-    def _validate_categorical_field(self, field: str, value: str, stats: Dict,
-                                  thresholds: Dict, result: Dict) -> None:
+    def _validate_categorical_field(self, plan: FieldPlan, value: str, result: Dict) -> None:
         """Validate categorical field"""
+        field = plan.field
+        frequency = plan.categories.frequency(value)
         
         # Check if value exists in historical data
-        if 'allowed_values' in thresholds:
-            if value not in thresholds['allowed_values']:
+        if plan.allowed_values is not None:
+            if value not in plan.allowed_values:
                 result['is_valid'] = False
                 result['issues'].append(
-                    f"{field}: Value '{value}' not in allowed values"
+                    ValidationIssue(field, 'allowed_values', value)
                 )
-        elif value not in stats['unique_values']:
+        elif frequency is None:
             # New categorical value
-            if 'allow_new_categories' in thresholds and not thresholds['allow_new_categories']:
+            if plan.reject_new_categories:
                 result['is_valid'] = False
                 result['issues'].append(
-                    f"{field}: New categorical value '{value}' not seen in historical data"
+                    ValidationIssue(field, 'new_category', value)
                 )
             else:
                 result['warnings'].append(
-                    f"{field}: New categorical value '{value}'"
+                    ValidationIssue(field, 'new_category_warning', value)
                 )
         
         # Check frequency if it's a known value
-        if value in stats['value_counts']:
-            frequency = stats['value_counts'][value] / stats['total_count']
-            if 'min_frequency' in thresholds and frequency < thresholds['min_frequency']:
+        if frequency is not None:
+            if plan.min_frequency is not None and frequency < plan.min_frequency:
                 result['warnings'].append(
-                    f"{field}: Low frequency value '{value}' (freq: {frequency:.3f})"
+                    ValidationIssue(field, 'low_frequency', value, plan.min_frequency, frequency)
                 )
     
     def _validate_z_score(self, value: float, stats: Dict, threshold: float) -> Tuple[bool, str]:
@@ -305,66 +723,53 @@ class StatisticalValidator:
     
     def _validate_pattern(self, value: str, stats: Dict, pattern: str) -> Tuple[bool, str]:
         """Pattern validation method"""
-        import re
-        if not re.match(pattern, str(value)):
+        if not self._patterns.compile(pattern).match(str(value)):
             return False, f"Value doesn't match pattern: {pattern}"
         return True, ""
     
     def _validate_correlation(self, record: Dict, stats: Dict, threshold: float) -> Tuple[bool, str]:
-        """Correlation validation method"""
-        # This would check if relationships between fields are maintained
-        # Implementation would depend on specific correlation rules
+        """Correlation validation method (Mahalanobis distance against baseline_stats['multivariate'])"""
+        plan = MultivariatePlan(fields=list(stats['fields']), mean=np.asarray(stats['mean']),
+                                cholesky=np.asarray(stats['cholesky']), threshold=threshold)
+        if not all(field in record for field in plan.fields):
+            return True, ""
+        result = self._validate_multivariate(plan, record)
+        if not result['is_valid']:
+            return False, result['issues'][0].message
         return True, ""
     
-    def generate_validation_report(self, validation_results: List[Dict]) -> Dict:
+    def generate_validation_report(self, validation_results: Union[List[Dict], ValidationResults,
+                                                                   ReportAccumulator]) -> Dict:
         """
         Generate a comprehensive validation report.
         
         Args:
-            validation_results: List of validation results from validate_record
+            validation_results: List of validation results from validate_record,
+                a ValidationResults container from validate_frame, or a
+                ReportAccumulator that has already consumed the results
             
         Returns:
             Dictionary containing the validation report
         """
-        total_records = len(validation_results)
-        valid_records = sum(1 for r in validation_results if r['is_valid'])
-        invalid_records = total_records - valid_records
+        if isinstance(validation_results, ReportAccumulator):
+            aggregates = validation_results
+        else:
+            aggregates = ReportAccumulator().update(validation_results)
         
-        # Collect all issues by field
-        field_issues = {}
-        issue_types = {}
-        
-        for result in validation_results:
-            for issue in result['issues']:
-                # Extract field name from issue string
-                field_name = issue.split(':')[0]
-                if field_name not in field_issues:
-                    field_issues[field_name] = []
-                field_issues[field_name].append(issue)
-                
-                # Categorize issue types
-                if 'Z-score' in issue:
-                    issue_types['z_score'] = issue_types.get('z_score', 0) + 1
-                elif 'IQR' in issue:
-                    issue_types['iqr'] = issue_types.get('iqr', 0) + 1
-                elif 'range' in issue:
-                    issue_types['range'] = issue_types.get('range', 0) + 1
-                elif 'categorical' in issue:
-                    issue_types['categorical'] = issue_types.get('categorical', 0) + 1
-                else:
-                    issue_types['other'] = issue_types.get('other', 0) + 1
-        
-        # Calculate confidence statistics
-        confidences = [r['confidence'] for r in validation_results]
-        avg_confidence = np.mean(confidences) if confidences else 0
+        total_records = aggregates.total_records
+        valid_records = aggregates.valid_records
+        invalid_records = total_records - valid_records
+        avg_confidence = aggregates.average_confidence
+        field_issue_counts = aggregates.field_issue_counts
+        issue_types = aggregates.issue_types
         
         # Field-level analysis
         field_analysis = {}
-        for field, issues in field_issues.items():
+        for field, anomaly_count in field_issue_counts.items():
             field_analysis[field] = {
-                'anomaly_count': len(issues),
-                'anomaly_rate': len(issues) / total_records,
-                'common_issues': list(set(issues))[:5]  # Top 5 unique issues
+                'anomaly_count': anomaly_count,
+                'anomaly_rate': anomaly_count / total_records,
+                'common_issues': aggregates.sample_messages(field)
             }
         
         report = {
@@ -374,7 +779,8 @@ class StatisticalValidator:
                 'valid_records': valid_records,
                 'invalid_records': invalid_records,
                 'validation_rate': (valid_records / total_records * 100) if total_records > 0 else 0,
-                'average_confidence': avg_confidence
+                'average_confidence': avg_confidence,
+                'confidence_std': aggregates.confidence_std
             },
             'issue_breakdown': issue_types,
             'field_analysis': field_analysis,
@@ -386,7 +792,7 @@ class StatisticalValidator:
                     'unique_count': stats.get('unique_count', 'N/A')
                 }
                 for field, stats in self.baseline_stats.items()
-                if field != 'correlations'
+                if field not in BASELINE_AUX_KEYS
             },
             'recommendations': self._generate_recommendations(field_analysis, issue_types)
         }
@@ -422,6 +828,18 @@ class StatisticalValidator:
                 "or indicate data quality issues."
             )
         
+        if issue_types.get('multivariate', 0) > 0:
+            recommendations.append(
+                "Unusual combinations of field values detected. Check whether the "
+                "relationships between fields have changed at the source."
+            )
+        
+        if issue_types.get('pattern', 0) > 0:
+            recommendations.append(
+                "Text values failing pattern or emptiness checks detected. These often "
+                "indicate changed page layouts at the scraped source."
+            )
+        
         if issue_types.get('range', 0) > 0:
             recommendations.append(
                 "Range violations detected. Verify if range constraints are appropriate "
@@ -436,21 +854,68 @@ class StatisticalValidator:
     def export_baseline_stats(self, filename: str) -> None:
         """Export baseline statistics to JSON file"""
         with open(filename, 'w') as f:
-            json.dump(self.baseline_stats, f, indent=2)
+            json.dump(self.baseline_stats, f, indent=2, default=self._json_default)
         print(f"Baseline statistics exported to {filename}")
     
     def import_baseline_stats(self, filename: str) -> None:
         """Import baseline statistics from JSON file"""
         with open(filename, 'r') as f:
             self.baseline_stats = json.load(f)
+        self._baseline_version += 1
         print(f"Baseline statistics imported from {filename}")
         
         # Rebuild field types
+        if 'multivariate' in self.baseline_stats:
+            multivariate = self.baseline_stats['multivariate']
+            multivariate['mean'] = np.asarray(multivariate['mean'], dtype=float)
+            multivariate['cholesky'] = np.asarray(multivariate['cholesky'], dtype=float)
+        
         for field, stats in self.baseline_stats.items():
-            if field == 'correlations':
+            if field in BASELINE_AUX_KEYS:
                 continue
             if 'mean' in stats:
                 self.field_types[field] = 'numeric'
+                if 'quantiles' in stats:
+                    stats['quantiles'] = np.asarray(stats['quantiles'], dtype=float)
             else:
                 self.field_types[field] = 'categorical'
+                # Older exports only carry value_counts, so rebuild the index from it
+                if stats.get('sketched'):
+                    stats['index'] = SketchedCategories.from_dict(stats['index'])
+                elif 'index' in stats:
+                    stats['index'] = CategoricalIndex.from_dict(stats['index'])
+                else:
+                    stats['index'] = CategoricalIndex(
+                        list(stats['value_counts'].keys()),
+                        list(stats['value_counts'].values())
+                    )
+    
+    def export_baseline_snapshot(self, filename: str) -> None:
+        """
+        Export baseline statistics to a compact binary snapshot.
+
+        Unlike the JSON export, the snapshot records field types explicitly and
+        loads through a memory map, which keeps worker start-up cheap.
+        """
+        write_snapshot(filename, self.baseline_stats, self.field_types)
+        print(f"Baseline snapshot exported to {filename}")
+    
+    def import_baseline_snapshot(self, filename: str) -> None:
+        """Import baseline statistics from a binary snapshot written by export_baseline_snapshot"""
+        self.baseline_stats, self.field_types = read_snapshot(filename)
+        self._baseline_version += 1
+        print(f"Baseline snapshot imported from {filename}")
+    
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """Serialize baseline objects that json can't handle natively"""
+        if isinstance(obj, (CategoricalIndex, SketchedCategories)):
+            return obj.to_dict()
+        if isinstance(obj, CategoryCounts):
+            return dict(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
                 
\ No newline at end of file
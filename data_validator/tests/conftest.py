@@ -0,0 +1,18 @@
+import json
+import os
+import sys
+
+import pytest
+
+# The validator modules import each other by their flat module names
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture()
+def write_config(tmp_path):
+    """Write a validation config to a JSON file and return its path"""
+    def write(config):
+        path = tmp_path / 'rules.json'
+        path.write_text(json.dumps(config))
+        return str(path)
+    return write
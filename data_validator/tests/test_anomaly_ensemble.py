@@ -0,0 +1,53 @@
+from unittest import mock
+
+import numpy as np
+
+import anomaly_ensemble
+from anomaly_ensemble import AnomalyEnsemble
+from statistical_valdation import StatisticalValidator
+
+
+def features(rows=100, seed=0):
+    return np.random.default_rng(seed).normal(size=(rows, 2))
+
+
+def lof_neighbors(ensemble, matrix):
+    with mock.patch.object(anomaly_ensemble, 'LocalOutlierFactor',
+                           wraps=anomaly_ensemble.LocalOutlierFactor) as lof:
+        ensemble.vote(matrix)
+    return lof.call_args.kwargs['n_neighbors']
+
+
+def test_lof_uses_configured_neighbors():
+    ensemble = AnomalyEnsemble(['local_outlier_factor'], n_neighbors=7)
+    assert lof_neighbors(ensemble, features()) == 7
+
+
+def test_lof_neighbors_capped_by_batch_size():
+    ensemble = AnomalyEnsemble(['local_outlier_factor'], n_neighbors=50)
+    assert lof_neighbors(ensemble, features(rows=10)) == 9
+
+
+def test_validator_passes_configured_neighbors(write_config):
+    config = {
+        'statistical_fields': {'price': {}, 'stock': {}},
+        'advanced_methods': {
+            'ensemble_methods': {
+                'enabled': True,
+                'fields': ['price', 'stock'],
+                'methods': ['local_outlier_factor'],
+                'voting_threshold': 1,
+                'min_samples': 10,
+                'n_neighbors': 5,
+                'lof_novelty': False
+            }
+        }
+    }
+    validator = StatisticalValidator(write_config(config))
+    batch = [{'price': price, 'stock': stock} for price, stock in features()]
+
+    with mock.patch.object(anomaly_ensemble, 'LocalOutlierFactor',
+                           wraps=anomaly_ensemble.LocalOutlierFactor) as lof:
+        validator.detect_ensemble_anomalies(batch)
+
+    assert lof.call_args.kwargs['n_neighbors'] == 5
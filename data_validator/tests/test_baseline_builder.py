@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from baseline_builder import BaselineAccumulator
+
+
+def chunk(seed, rows=200, **extra):
+    rng = np.random.default_rng(seed)
+    data = {
+        'sku': [f'SKU-{seed}-{i}' for i in range(rows)],
+        'price': rng.normal(100, 10, rows),
+        'rating': rng.uniform(1, 5, rows),
+        'brand': rng.choice(['a', 'b', 'c'], rows)
+    }
+    data.update(extra)
+    return pd.DataFrame(data)
+
+
+def test_first_chunk_schema_decides_what_is_profiled():
+    accumulator = BaselineAccumulator().update(chunk(0)).update(chunk(1))
+
+    assert accumulator.field_types == {'price': 'numeric', 'rating': 'numeric', 'brand': 'categorical'}
+    assert accumulator.schema['sku'].kind == 'identifier'
+    assert accumulator.correlation.columns == ['price', 'rating']
+
+
+def test_update_rejects_chunk_with_other_columns():
+    accumulator = BaselineAccumulator().update(chunk(0))
+
+    with pytest.raises(ValueError, match='missing'):
+        accumulator.update(chunk(1).drop(columns=['rating']))
+    with pytest.raises(ValueError, match='unexpected'):
+        accumulator.update(chunk(1, shipping=1.0))
+
+
+def test_update_rejects_non_numeric_values_in_numeric_column():
+    accumulator = BaselineAccumulator().update(chunk(0))
+    bad = chunk(1)
+    bad['price'] = bad['price'].astype(object)
+    bad.loc[3, 'price'] = 'n/a'
+
+    with pytest.raises(ValueError, match='price'):
+        accumulator.update(bad)
+
+
+def test_merge_rejects_different_schema():
+    accumulator = BaselineAccumulator().update(chunk(0))
+    other = BaselineAccumulator().update(chunk(1, shipping=np.arange(200.0)))
+
+    with pytest.raises(ValueError, match='different schemas'):
+        accumulator.merge(other)
+
+
+def test_merge_matches_single_accumulator():
+    merged = BaselineAccumulator().update(chunk(0)).merge(BaselineAccumulator().update(chunk(1)))
+    single = BaselineAccumulator().update(chunk(0)).update(chunk(1))
+
+    merged_stats, _ = merged.finalize()
+    single_stats, _ = single.finalize()
+    assert merged_stats['price']['mean'] == pytest.approx(single_stats['price']['mean'])
+    assert merged_stats['brand']['value_counts'] == single_stats['brand']['value_counts']
+    assert merged_stats['correlations']['price']['rating'] == pytest.approx(
+        single_stats['correlations']['price']['rating'])
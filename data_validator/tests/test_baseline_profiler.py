@@ -0,0 +1,58 @@
+from concurrent.futures import Future
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import baseline_profiler
+from baseline_profiler import profile_columns
+
+
+class InlineExecutor:
+    """Runs submitted jobs in-process and records their arguments"""
+
+    def __init__(self, max_workers=None):
+        self.submitted = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, function, *args):
+        self.submitted.append(args)
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+def history(rows=1000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'price': rng.normal(100, 10, rows),
+        'color': rng.choice(np.array(['red', 'green', 'blue', None], dtype=object), rows)
+    })
+
+
+def test_categorical_profiles_do_not_depend_on_worker_count():
+    data = history()
+
+    serial = profile_columns(data, ['price'], ['color'], workers=1)
+    parallel = profile_columns(data, ['price'], ['color'], workers=2)
+
+    assert parallel['color']['value_counts'] == serial['color']['value_counts']
+    assert parallel['color']['unique_values'] == serial['color']['unique_values']
+    assert parallel['price']['mean'] == serial['price']['mean']
+
+
+def test_workers_receive_shared_memory_handles_only():
+    executor = InlineExecutor()
+    with mock.patch.object(baseline_profiler, 'ProcessPoolExecutor', return_value=executor):
+        profiles = profile_columns(history(), ['price'], ['color'], workers=2)
+
+    assert len(executor.submitted) == 2
+    for args in executor.submitted:
+        # (kind, shared memory name, shape, dtype, category count): no column data
+        assert all(isinstance(arg, (str, int, tuple)) for arg in args)
+    assert profiles['color']['value_counts'] == profile_columns(history(), [], ['color'])['color']['value_counts']
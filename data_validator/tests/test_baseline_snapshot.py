@@ -0,0 +1,88 @@
+import struct
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from baseline_builder import CategoricalSketchAccumulator
+from baseline_snapshot import write_snapshot, read_snapshot, SNAPSHOT_MAGIC, SNAPSHOT_VERSION
+from statistical_validator import StatisticalValidator
+
+
+def assert_same(actual, expected, path='stats'):
+    """Deep equality for baseline stats, comparing index objects by their public state"""
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected), path
+        for key in expected:
+            assert_same(actual[key], expected[key], f'{path}[{key!r}]')
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected), path
+        for position, (left, right) in enumerate(zip(actual, expected)):
+            assert_same(left, right, f'{path}[{position}]')
+    elif isinstance(expected, np.ndarray):
+        np.testing.assert_array_equal(actual, expected, err_msg=path)
+    elif isinstance(expected, float) and np.isnan(expected):
+        assert np.isnan(actual), path
+    elif hasattr(expected, '__dict__'):
+        assert type(actual) is type(expected), path
+        public = {key: value for key, value in vars(expected).items() if not key.startswith('_')}
+        assert_same({key: getattr(actual, key) for key in public}, public, path)
+    else:
+        assert actual == expected, path
+
+
+@pytest.fixture()
+def baseline():
+    rng = np.random.default_rng(0)
+    rows = 300
+    history = pd.DataFrame({
+        'price': rng.normal(100, 10, rows),
+        'rating': rng.uniform(1, 5, rows),
+        'stock': rng.integers(0, 50, rows),
+        'brand': rng.choice(['acme', 'globex', 'initech'], rows),
+        'seller': rng.choice([f'seller_{i}' for i in range(40)], rows)
+    })
+    validator = StatisticalValidator()
+    validator.calculate_baseline_stats(history)
+    # One categorical field profiled through the bounded-memory sketch
+    accumulator = CategoricalSketchAccumulator(4096)
+    accumulator.update(history['seller'])
+    validator.baseline_stats['seller'] = accumulator.to_stats()
+    return validator.baseline_stats, validator.field_types
+
+
+def test_snapshot_round_trip(baseline, tmp_path):
+    baseline_stats, field_types = baseline
+    filename = str(tmp_path / 'baseline.snap')
+
+    write_snapshot(filename, baseline_stats, field_types)
+    loaded_stats, loaded_types = read_snapshot(filename)
+
+    assert loaded_types == field_types
+    assert {'correlations', 'multivariate', 'brand', 'seller'} <= set(loaded_stats)
+    assert_same(loaded_stats, baseline_stats)
+
+
+def rewrite_preamble(filename, magic=SNAPSHOT_MAGIC, version=SNAPSHOT_VERSION):
+    with open(filename, 'r+b') as f:
+        _, _, reserved, header_length = struct.unpack('<8sIIQ', f.read(24))
+        f.seek(0)
+        f.write(struct.pack('<8sIIQ', magic, version, reserved, header_length))
+
+
+def test_snapshot_rejects_bad_magic(baseline, tmp_path):
+    filename = str(tmp_path / 'baseline.snap')
+    write_snapshot(filename, *baseline)
+    rewrite_preamble(filename, magic=b'NOTASNAP')
+
+    with pytest.raises(ValueError, match='not a baseline snapshot'):
+        read_snapshot(filename)
+
+
+def test_snapshot_rejects_newer_version(baseline, tmp_path):
+    filename = str(tmp_path / 'baseline.snap')
+    write_snapshot(filename, *baseline)
+    rewrite_preamble(filename, version=SNAPSHOT_VERSION + 1)
+
+    with pytest.raises(ValueError, match='Unsupported baseline snapshot version'):
+        read_snapshot(filename)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from statistical_valdation import StatisticalValidator
+
+
+CONFIG = {
+    'statistical_fields': {
+        'price': {
+            'min_samples': 10, 'z_score_detection': True, 'z_threshold': 3.0,
+            'iqr_detection': True, 'iqr_multiplier': 1.5,
+            'trend_detection': True, 'trend_window': 5, 'cusum_threshold': 1.5, 'min_trend_samples': 15,
+            'seasonal_detection': True, 'monthly_seasonality': True, 'seasonal_z_threshold': 2.5,
+            'valid_range': [0, 400]
+        },
+        'stock_quantity': {'min_samples': 10, 'z_score_detection': True, 'z_threshold': 2.5,
+                           'valid_range': [0, 1000]}
+    }
+}
+
+
+def records(rows, start, shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range(start, periods=rows, freq='D')
+    prices = 100 + 5 * timestamps.month.to_numpy() + rng.normal(shift, 3, rows)
+    stock = rng.normal(50, 5, rows)
+    return [{'timestamp': ts.isoformat(), 'price': price, 'stock_quantity': quantity}
+            for ts, price, quantity in zip(timestamps, prices, stock)]
+
+
+@pytest.fixture
+def validator(write_config):
+    validator = StatisticalValidator(write_config(CONFIG))
+    validator.set_historical_data(records(400, '2023-01-01'))
+    return validator
+
+
+@pytest.fixture
+def batch():
+    batch = records(60, '2024-03-01', shift=8.0, seed=1)
+    batch[10]['price'] = 900.0
+    batch[20]['stock_quantity'] = None
+    return batch
+
+
+def anomaly_keys(result):
+    return [(a.field, a.anomaly_type, str(a.value), a.score, a.message, a.reference_period)
+            for a in result['anomalies']]
+
+
+def run(validator, data):
+    # Trend state resumes across batches; start every input from the same point
+    validator.reset_trend_state()
+    return validator.run_all_statistical_validations(data)
+
+
+def assert_same_results(result, expected):
+    assert anomaly_keys(result) == anomaly_keys(expected)
+    assert result['anomaly_types'] == expected['anomaly_types']
+    assert result['quality_metrics'] == expected['quality_metrics']
+
+
+def test_dataframe_matches_records(validator, batch):
+    expected = run(validator, batch)
+
+    result = run(validator, pd.DataFrame(batch))
+
+    assert expected['anomalies']
+    assert_same_results(result, expected)
+
+
+def test_arrow_table_matches_records(validator, batch):
+    pa = pytest.importorskip('pyarrow')
+    expected = run(validator, batch)
+
+    result = run(validator, pa.Table.from_pylist(batch))
+
+    assert_same_results(result, expected)
@@ -0,0 +1,78 @@
+import numpy as np
+
+from cusum_detector import CusumState, save_cusum_states, load_cusum_states
+from statistical_valdation import StatisticalValidator
+
+
+def stream(length=300):
+    rng = np.random.default_rng(0)
+    values = rng.normal(10, 1, length)
+    # Level shifts inside the stream, including one straddling chunk boundaries
+    values[120:] += 4
+    values[205:] -= 6
+    return values
+
+
+def test_chunked_updates_match_single_update():
+    values = stream()
+    single = CusumState(window=7, threshold=2.0).update(values)
+
+    chunked_state = CusumState(window=7, threshold=2.0)
+    chunked = []
+    for start in range(0, len(values), 23):
+        chunked.extend(chunked_state.update(values[start:start + 23]))
+
+    assert single
+    assert chunked == single
+    assert chunked_state.position == len(values)
+
+
+def test_checkpointed_state_resumes_the_stream(tmp_path):
+    values = stream()
+    expected = CusumState(window=7, threshold=2.0).update(values)
+
+    state = CusumState(window=7, threshold=2.0)
+    breaks = state.update(values[:150])
+    filename = str(tmp_path / 'cusum.json')
+    save_cusum_states(filename, {('price', None): state, ('price', 'site_a'): CusumState(5, 3.0)})
+    restored = load_cusum_states(filename)
+    breaks += restored[('price', None)].update(values[150:])
+
+    assert set(restored) == {('price', None), ('price', 'site_a')}
+    assert restored[('price', 'site_a')].window == 5
+    assert breaks == expected
+
+
+TREND_CONFIG = {
+    'statistical_fields': {
+        'price': {'trend_detection': True, 'trend_window': 7, 'cusum_threshold': 2.0,
+                  'min_trend_samples': 20, 'trend_series_key': 'source'}
+    }
+}
+
+
+def trend_batch(values, start):
+    return [{'timestamp': f'2024-01-01T00:00:{(start + i) % 60:02d}', 'price': value,
+             'source': 'site_a' if i % 3 else 'site_b'}
+            for i, value in enumerate(values)]
+
+
+def test_save_and_load_trend_state(write_config, tmp_path):
+    values = stream()
+    first, second = values[:150], values[150:]
+
+    reference = StatisticalValidator(write_config(TREND_CONFIG))
+    expected = (reference.detect_trend_breaks(trend_batch(first, 0))
+                + reference.detect_trend_breaks(trend_batch(second, 150)))
+
+    validator = StatisticalValidator(write_config(TREND_CONFIG))
+    anomalies = validator.detect_trend_breaks(trend_batch(first, 0))
+    filename = str(tmp_path / 'trend.json')
+    validator.save_trend_state(filename)
+
+    resumed = StatisticalValidator(write_config(TREND_CONFIG))
+    resumed.load_trend_state(filename)
+    anomalies += resumed.detect_trend_breaks(trend_batch(second, 150))
+
+    assert expected
+    assert [anomaly.message for anomaly in anomalies] == [anomaly.message for anomaly in expected]
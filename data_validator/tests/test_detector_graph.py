@@ -0,0 +1,119 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch_context import BatchContext
+from detector_graph import DetectorGraph
+from statistical_valdation import StatisticalValidator
+
+
+def test_cycle_is_rejected():
+    graph = DetectorGraph()
+    graph.add('a', lambda: 1, ['c'])
+    graph.add('b', lambda: 2, ['a'])
+    graph.add('c', lambda: 3, ['b'])
+    graph.add('d', lambda: 4)
+
+    with pytest.raises(ValueError, match='dependency cycle'):
+        graph.run()
+
+
+def test_unknown_dependency_and_duplicates_are_rejected():
+    graph = DetectorGraph()
+    graph.add('a', lambda: 1, ['missing'])
+    with pytest.raises(ValueError, match='unknown node missing'):
+        graph.run()
+    with pytest.raises(ValueError, match='Duplicate'):
+        graph.add('a', lambda: 2)
+
+
+def test_nodes_run_after_their_dependencies():
+    events = []
+    lock = threading.Lock()
+
+    def node(name, delay):
+        def compute():
+            with lock:
+                events.append(('start', name))
+            time.sleep(delay)
+            with lock:
+                events.append(('end', name))
+            return name
+        return compute
+
+    dependencies = {
+        'timestamps': [],
+        'price.present': [],
+        'price.zscores': ['price.present'],
+        'price.quartiles': ['price.present'],
+        'outliers': ['price.zscores', 'price.quartiles'],
+        'trend_breaks': ['timestamps'],
+        'report': ['outliers', 'trend_breaks'],
+    }
+    graph = DetectorGraph(max_workers=4)
+    for index, (name, depends_on) in enumerate(dependencies.items()):
+        graph.add(name, node(name, 0.01 * (index % 3)), depends_on)
+
+    results = graph.run()
+
+    assert results == {name: name for name in dependencies}
+    for name, depends_on in dependencies.items():
+        started = events.index(('start', name))
+        for dependency in depends_on:
+            assert events.index(('end', dependency)) < started
+    assert set(graph.timings) == set(dependencies)
+    assert all(seconds >= 0 for seconds in graph.timings.values())
+
+
+def graph_config(max_workers):
+    field = {
+        'min_samples': 10, 'ks_threshold': 0.05, 'mannwhitney_threshold': 0.05,
+        'z_score_detection': True, 'z_threshold': 3.0,
+        'iqr_detection': True, 'iqr_multiplier': 1.5,
+        'trend_detection': True, 'trend_window': 5, 'cusum_threshold': 1.5, 'min_trend_samples': 15,
+        'seasonal_detection': True, 'monthly_seasonality': True, 'weekly_seasonality': True,
+        'seasonal_z_threshold': 2.5, 'valid_range': [0, 400],
+    }
+    return {
+        'statistical_fields': {'price': dict(field), 'stock_quantity': dict(field)},
+        'performance': {'parallel_processing': max_workers > 1, 'max_workers': max_workers},
+    }
+
+
+def records(rows, start, shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range(start, periods=rows, freq='D')
+    prices = 100 + 5 * timestamps.month.to_numpy() + rng.normal(shift, 3, rows)
+    stock = rng.normal(50, 5, rows)
+    return [{'timestamp': ts.isoformat(), 'price': price, 'stock_quantity': quantity}
+            for ts, price, quantity in zip(timestamps, prices, stock)]
+
+
+def anomaly_keys(result):
+    return [(a.field, a.anomaly_type, str(a.value), a.score, a.message, a.reference_period)
+            for a in result['anomalies']]
+
+
+def test_run_all_is_independent_of_worker_count(write_config):
+    history = records(400, '2023-01-01')
+    batch = records(60, '2024-03-01', shift=8.0, seed=1)
+    batch[10]['price'] = 900.0
+    batch[20]['stock_quantity'] = None
+
+    results = []
+    for max_workers in (1, 4):
+        validator = StatisticalValidator(write_config(graph_config(max_workers)))
+        validator.set_historical_data(history)
+        results.append(validator.run_all_statistical_validations(batch))
+        nodes = validator._build_detector_graph(BatchContext.of(batch)).nodes
+        assert set(results[-1]['timings']) == set(nodes)
+    serial, parallel = results
+
+    assert serial['anomalies']
+    assert anomaly_keys(serial) == anomaly_keys(parallel)
+    assert serial['anomaly_types'] == parallel['anomaly_types']
+    assert serial['quality_metrics'] == parallel['quality_metrics']
+    assert all(count > 0 for count in serial['anomaly_types'].values())
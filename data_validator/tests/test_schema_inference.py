@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from schema_inference import infer_schema
+from statistical_validator import StatisticalValidator
+from threshold_config import ThresholdConfig
+
+
+def history(rows=400):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'sku': [f'SKU-{i}' for i in range(rows)],
+        'brand': [f'brand_{i}' for i in rng.integers(0, 300, rows)],
+        'price': rng.normal(100, 10, rows)
+    })
+
+
+def brand_config():
+    config = ThresholdConfig()
+    config.thresholds = {'brand': {'allow_new_categories': False}, 'price': {'z_score': 3.0}}
+    return config
+
+
+def test_unreferenced_high_cardinality_column_is_not_profiled():
+    schema = infer_schema(history())
+
+    assert schema['sku'].kind == 'identifier'
+    assert schema['brand'].kind == 'identifier'
+    assert schema['brand'].high_cardinality
+
+
+def test_referenced_high_cardinality_column_stays_categorical():
+    schema = infer_schema(history(), required=['brand'])
+
+    assert schema['brand'].kind == 'categorical'
+    assert schema['brand'].high_cardinality
+    assert schema['sku'].kind == 'identifier'
+
+
+def test_high_cardinality_referenced_categorical_rejects_new_categories():
+    data = history()
+    validator = StatisticalValidator()
+    config = brand_config()
+    validator.calculate_baseline_stats(data, config=config)
+
+    assert 'brand' in validator.baseline_stats
+    assert 'sku' not in validator.baseline_stats
+    known = validator.validate_record({'brand': data['brand'].iloc[0], 'price': 100.0}, config)
+    unknown = validator.validate_record({'brand': 'NOT_A_BRAND', 'price': 100.0}, config)
+    assert known['is_valid']
+    assert not unknown['is_valid']
+    assert [issue.rule for issue in unknown['issues']] == ['new_category']
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from statistical_valdation import StatisticalValidator, AnomalyType
+
+
+SEASONAL_CONFIG = {
+    'statistical_fields': {
+        'price': {
+            'seasonal_detection': True,
+            'monthly_seasonality': True,
+            'weekly_seasonality': True,
+            'seasonal_z_threshold': 2.5
+        }
+    }
+}
+
+
+def history(days=400):
+    rng = np.random.default_rng(0)
+    timestamps = pd.date_range('2023-01-01', periods=days, freq='D')
+    prices = 100 + 10 * timestamps.month.to_numpy() + rng.normal(0, 1, days)
+    return [{'timestamp': ts.isoformat(), 'price': price} for ts, price in zip(timestamps, prices)]
+
+
+def seasonal_anomalies(validator, batch):
+    return [anomaly for anomaly in validator.detect_seasonal_anomalies(batch)
+            if anomaly.anomaly_type == AnomalyType.SEASONAL_ANOMALY]
+
+
+def test_seasonal_profiles_skip_missing_timestamp_in_history(write_config):
+    records = history()
+    clean = StatisticalValidator(write_config(SEASONAL_CONFIG))
+    clean.set_historical_data(records)
+    records.append({'timestamp': None, 'price': 1000.0})
+
+    validator = StatisticalValidator(write_config(SEASONAL_CONFIG))
+    validator.set_historical_data(records)
+
+    for period, profile in validator.seasonal_profiles['price'].items():
+        expected = clean.seasonal_profiles['price'][period]
+        np.testing.assert_array_equal(profile.count, expected.count)
+        np.testing.assert_allclose(profile.mean, expected.mean)
+
+
+def test_seasonal_scoring_skips_missing_timestamp_in_batch(write_config):
+    validator = StatisticalValidator(write_config(SEASONAL_CONFIG))
+    validator.set_historical_data(history())
+    batch = [
+        {'timestamp': None, 'price': 1000.0},
+        {'timestamp': '2024-03-05T00:00:00', 'price': 500.0},
+        {'timestamp': '2024-03-06T00:00:00', 'price': 130.0}
+    ]
+
+    anomalies = seasonal_anomalies(validator, batch)
+
+    assert anomalies
+    assert {anomaly.value for anomaly in anomalies} == {500.0}
+    assert any(anomaly.reference_period == 'month_3_historical' for anomaly in anomalies)
+
+
+def test_seasonal_detection_needs_timestamps(write_config):
+    records = [{'price': record['price']} for record in history()]
+    validator = StatisticalValidator(write_config(SEASONAL_CONFIG))
+    validator.set_historical_data(records)
+
+    assert validator.seasonal_profiles == {}
+    assert validator.detect_seasonal_anomalies([{'price': 1000.0}]) == []
+
+
+CLUSTERING_CONFIG = {
+    'statistical_fields': {'price': {}, 'stock': {}},
+    'advanced_methods': {
+        'clustering': {'enabled': True, 'method': 'kmeans', 'n_clusters': 3}
+    },
+    'performance': {'chunk_size': 100}
+}
+
+
+def cluster_history(rows=500):
+    rng = np.random.default_rng(1)
+    return [{'price': price, 'stock': stock}
+            for price, stock in zip(rng.normal(100, 5, rows), rng.normal(50, 5, rows))]
+
+
+def test_cluster_detection_leaves_model_unchanged(write_config, tmp_path):
+    model_path = tmp_path / 'models.joblib'
+    validator = StatisticalValidator(write_config(CLUSTERING_CONFIG))
+    validator.set_historical_data(cluster_history(), model_path=str(model_path))
+    saved_at = model_path.stat().st_mtime_ns
+    batch = cluster_history(50) + [{'price': 1000.0, 'stock': 50.0}]
+
+    first = validator.detect_cluster_anomalies(batch)
+    second = validator.detect_cluster_anomalies(batch)
+
+    assert [anomaly.message for anomaly in first] == [anomaly.message for anomaly in second]
+    assert first
+    assert model_path.stat().st_mtime_ns == saved_at
+
+
+def test_clustering_updates_are_saved(write_config, tmp_path):
+    model_path = str(tmp_path / 'models.joblib')
+    validator = StatisticalValidator(write_config(CLUSTERING_CONFIG))
+    validator.set_historical_data(cluster_history(), model_path=model_path)
+    fitted_rows = validator.clustering.seen
+
+    trained = validator.update_clustering(cluster_history(50))
+
+    assert 0 < trained <= 50
+    restarted = StatisticalValidator(write_config(CLUSTERING_CONFIG))
+    restarted.set_historical_data(cluster_history(), model_path=model_path)
+    assert restarted.clustering.seen == validator.clustering.seen == fitted_rows + trained
+    np.testing.assert_array_equal(restarted.clustering.kmeans.cluster_centers_,
+                                  validator.clustering.kmeans.cluster_centers_)
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from statistical_validator import StatisticalValidator
+from threshold_config import ThresholdConfig
+
+
+@pytest.fixture(scope='module')
+def config():
+    config = ThresholdConfig()
+    config.thresholds = {
+        'price': {'z_score': 2.5, 'iqr_multiplier': 1.5, 'range': (0, 500), 'percentile_range': (0.01, 0.99)},
+        'rating': {'z_score': 3.0, 'range': (0, 5)},
+        'brand': {'allow_new_categories': False, 'min_frequency': 0.05},
+        'title': {'pattern': r'^[A-Z][\w ]+$'}
+    }
+    config.set_global_config('mahalanobis_alpha', 0.01)
+    return config
+
+
+@pytest.fixture(scope='module')
+def validator(config):
+    rng = np.random.default_rng(0)
+    rows = 500
+    price = rng.normal(100, 10, rows)
+    history = pd.DataFrame({
+        'price': price,
+        # Rating tracks price, so an off-trend pair is a multivariate outlier
+        'rating': 2.5 + (price - 100) / 10 + rng.normal(0, 0.2, rows),
+        'brand': rng.choice(['acme', 'globex', 'initech', 'rare'], rows, p=[0.4, 0.3, 0.28, 0.02]),
+        'title': [f'Product {i}' for i in range(rows)]
+    })
+    validator = StatisticalValidator()
+    validator.calculate_baseline_stats(history, config=config)
+    return validator
+
+
+@pytest.fixture(scope='module')
+def batch():
+    return pd.DataFrame({
+        'price': [100.0, 160.0, np.nan, None, 110.0, 90.0, 101.0, 600.0],
+        'rating': [2.5, 8.5, 2.0, 3.0, 1.5, 3.5, np.nan, 2.4],
+        'brand': ['acme', 'globex', 'NOT_A_BRAND', None, 'rare', 'initech', np.nan, 'acme'],
+        'title': ['Product 1', 'Product 2', 'lowercase', 'Product 4', None, 'Product 5', 'Product 6', '']
+    }, dtype=object)
+
+
+def records(batch):
+    return [{field: value for field, value in row.items()} for row in batch.to_dict('records')]
+
+
+def assert_same_issues(actual, expected, row):
+    """Same issues in the same order; scores may differ in the last bits"""
+    assert [(issue.field, issue.rule, str(issue.value), str(issue.bound)) for issue in actual] == \
+        [(issue.field, issue.rule, str(issue.value), str(issue.bound)) for issue in expected], row
+    for actual_issue, expected_issue in zip(actual, expected):
+        assert actual_issue.score == pytest.approx(expected_issue.score, nan_ok=True), row
+
+
+def test_frame_issues_match_record_validation(validator, config, batch):
+    results = validator.validate_frame(batch, config)
+
+    for row, record in enumerate(records(batch)):
+        expected = validator.validate_record(record, config)
+        actual = results[row]
+        assert actual['is_valid'] == expected['is_valid'], row
+        assert_same_issues(actual['issues'], expected['issues'], row)
+        assert_same_issues(actual['warnings'], expected['warnings'], row)
+        assert actual['confidence'] == pytest.approx(expected['confidence']), row
+        assert actual['field_scores'].keys() == expected['field_scores'].keys(), row
+        for field, field_result in expected['field_scores'].items():
+            assert actual['field_scores'][field]['is_valid'] == field_result['is_valid'], (row, field)
+            assert actual['field_scores'][field]['scores'] == pytest.approx(field_result['scores']), (row, field)
+
+
+def test_gate_mode_matches_frame_validity(validator, config, batch):
+    results = validator.validate_frame(batch, config)
+    gate = [validator.validate_record(record, config, mode='gate') for record in records(batch)]
+
+    np.testing.assert_array_equal(validator.is_valid_batch(batch, config), results.is_valid)
+    assert gate == results.is_valid.tolist()
+
+
+def test_batch_covers_every_kind_of_issue(validator, config, batch):
+    rules = {issue.rule for row in range(len(batch)) for issue in validator.validate_frame(batch, config)[row]['issues']}
+
+    assert {'z_score', 'range', 'new_category', 'pattern', 'mahalanobis'} <= rules
+    assert not all(validator.is_valid_batch(batch, config))
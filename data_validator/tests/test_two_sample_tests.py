@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from two_sample_tests import SortedSample
+
+
+def tied_samples(shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    reference = np.round(rng.normal(10, 2, 2000))
+    # Half-integers never occur in the reference, so some new ties are new groups
+    new = np.round(rng.normal(10 + shift, 2, 300) * 2) / 2
+    return reference, new
+
+
+@pytest.mark.parametrize('shift', [0.0, 0.3, 1.5])
+def test_ks_matches_scipy_asymptotic(shift):
+    reference, new = tied_samples(shift)
+
+    d, p_value = SortedSample(reference).ks_test(new)
+    expected = stats.ks_2samp(reference, new, method='asymp')
+
+    assert d == pytest.approx(expected.statistic, abs=1e-12)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-9, abs=1e-300)
+
+
+@pytest.mark.parametrize('shift', [0.0, 0.3, 1.5])
+def test_mannwhitney_matches_scipy_asymptotic(shift):
+    reference, new = tied_samples(shift)
+
+    u, p_value = SortedSample(reference).mannwhitney_test(new)
+    expected = stats.mannwhitneyu(reference, new, alternative='two-sided',
+                                  method='asymptotic', use_continuity=True)
+
+    assert u == pytest.approx(expected.statistic)
+    assert p_value == pytest.approx(expected.pvalue, rel=1e-9, abs=1e-300)
+
+
+def test_presorted_and_nan_reference_match():
+    reference, new = tied_samples(0.3, seed=1)
+    sample = SortedSample(np.r_[reference, np.nan])
+
+    assert sample.n == len(reference)
+    assert sample.ks_test(np.sort(new), presorted=True) == sample.ks_test(new)
+    assert sample.mannwhitney_test(np.sort(new), presorted=True) == sample.mannwhitney_test(new)
@@ -0,0 +1,51 @@
+from unittest import mock
+
+import numpy as np
+
+from validation_report import ReportAccumulator
+from validation_results import ValidationResults, IssueTableBuilder
+
+
+def range_failures(values, fields=('price', 'rating')):
+    """Results where every value of the first field fails its range check"""
+    values = np.asarray(values, dtype=object)
+    rows = len(values)
+    issues = IssueTableBuilder()
+    issues.add(0, 'range', np.ones(rows, dtype=bool), values)
+    return ValidationResults(
+        is_valid=np.zeros(rows, dtype=bool),
+        confidence=np.full(rows, 0.5),
+        fields=list(fields),
+        field_valid=np.zeros((rows, len(fields)), dtype=bool),
+        score_fields=[],
+        scores=np.zeros((rows, 0)),
+        issues=issues.build(),
+        warnings=IssueTableBuilder().build(),
+        bounds={('price', 'range'): (0, 100)},
+        timestamp='2024-01-01T00:00:00'
+    )
+
+
+def test_samples_are_first_distinct_issues():
+    results = range_failures([500, 500, 600, 500, 700, 800, 600, 900, 1000, 1100] * 100)
+
+    accumulator = ReportAccumulator().update(results)
+
+    assert [issue.value for issue in accumulator.field_issue_samples['price']] == [500, 600, 700, 800, 900]
+    assert accumulator.field_issue_counts == {'price': 1000}
+
+
+def test_only_sampled_issues_are_materialized():
+    results = range_failures(np.arange(10000) + 101)
+
+    with mock.patch.object(results, 'issue_at', wraps=results.issue_at) as issue_at:
+        ReportAccumulator().update(results)
+
+    assert issue_at.call_count == 5
+
+
+def test_samples_fill_up_across_chunks():
+    accumulator = ReportAccumulator().update(range_failures([500, 600, 500]))
+    accumulator.update(range_failures([600, 500, 700, 800, 900, 1000]))
+
+    assert [issue.value for issue in accumulator.field_issue_samples['price']] == [500, 600, 700, 800, 900]
@@ -0,0 +1,57 @@
+import importlib.util
+
+import numpy as np
+import pytest
+
+from validation_results import ValidationResults, IssueTableBuilder
+
+
+def results():
+    values = np.array([150.0, 20.0, 300.0], dtype=object)
+    issues = IssueTableBuilder()
+    issues.add(0, 'range', np.array([True, False, True]), values)
+    return ValidationResults(
+        is_valid=np.array([False, True, False]),
+        confidence=np.array([0.5, 1.0, 0.5]),
+        fields=['price'],
+        field_valid=np.array([[False], [True], [False]]),
+        score_fields=['price'],
+        scores=np.array([[2.5], [0.1], [4.0]]),
+        issues=issues.build(),
+        warnings=IssueTableBuilder().build(),
+        bounds={('price', 'range'): (0, 100)},
+        timestamp='2024-01-01T00:00:00'
+    )
+
+
+def assert_same(loaded, original):
+    np.testing.assert_array_equal(loaded.is_valid, original.is_valid)
+    np.testing.assert_array_equal(loaded.confidence, original.confidence)
+    np.testing.assert_array_equal(loaded.field_valid, original.field_valid)
+    np.testing.assert_array_equal(loaded.scores, original.scores)
+    assert ([loaded.issue_at(entry).message for entry in range(len(loaded.issues))]
+            == [original.issue_at(entry).message for entry in range(len(original.issues))])
+
+
+def test_npz_round_trip(tmp_path):
+    original = results()
+    original.to_npz(str(tmp_path / 'results.npz'))
+
+    assert_same(ValidationResults.from_npz(str(tmp_path / 'results.npz')), original)
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip('pyarrow')
+    original = results()
+    original.to_parquet(str(tmp_path / 'results'))
+
+    assert_same(ValidationResults.from_parquet(str(tmp_path / 'results')), original)
+
+
+def test_parquet_without_engine_points_to_npz(tmp_path, monkeypatch):
+    monkeypatch.setattr(importlib.util, 'find_spec', lambda name, *args: None)
+
+    with pytest.raises(ImportError, match='to_npz'):
+        results().to_parquet(str(tmp_path / 'results'))
+    with pytest.raises(ImportError, match='to_npz'):
+        ValidationResults.from_parquet(str(tmp_path / 'results'))
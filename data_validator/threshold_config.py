@@ -1,7 +1,10 @@
 import json
-from typing import Dict, Any, Optional, List, Tuple
+import re
+from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime
 
+from validation_results import ValidationResults
+
 
 class ThresholdConfig:
     """
@@ -11,11 +14,15 @@ class ThresholdConfig:
     
     def __init__(self):
         self.thresholds = {}
+        # Bumped on every change so compiled validation plans can detect staleness
+        self.version = 0
         self.global_config = {
             'default_z_score': 3.0,
             'default_iqr_multiplier': 1.5,
             'default_confidence_threshold': 0.8,
             'allow_new_categories': True,
+            # Chi-square tail probability for the multivariate Mahalanobis check; None disables it
+            'mahalanobis_alpha': None,
             'created_at': datetime.now().isoformat(),
             'updated_at': datetime.now().isoformat()
         }
@@ -89,6 +96,7 @@ class ThresholdConfig:
         
         self.thresholds[field][threshold_type] = value
         self.global_config['updated_at'] = datetime.now().isoformat()
+        self.version += 1
         
         print(f"Set {threshold_type} threshold for {field}: {value}")
     
@@ -133,6 +141,7 @@ class ThresholdConfig:
         if field in self.thresholds and threshold_type in self.thresholds[field]:
             del self.thresholds[field][threshold_type]
             self.global_config['updated_at'] = datetime.now().isoformat()
+            self.version += 1
             print(f"Removed {threshold_type} threshold for {field}")
             return True
         return False
@@ -147,6 +156,7 @@ class ThresholdConfig:
         """
         self.thresholds[field] = config.copy()
         self.global_config['updated_at'] = datetime.now().isoformat()
+        self.version += 1
         print(f"Set complete configuration for {field}")
     
     def get_all_thresholds(self) -> Dict[str, Dict[str, Any]]:
@@ -157,6 +167,7 @@ class ThresholdConfig:
         """Set a global configuration parameter"""
         self.global_config[key] = value
         self.global_config['updated_at'] = datetime.now().isoformat()
+        self.version += 1
         print(f"Set global config {key}: {value}")
     
     def get_global_config(self, key: str) -> Optional[Any]:
@@ -233,6 +244,10 @@ class ThresholdConfig:
         """
         warnings = []
         
+        alpha = self.global_config.get('mahalanobis_alpha')
+        if alpha is not None and not 0 < alpha < 1:
+            warnings.append(f"mahalanobis_alpha {alpha} must be between 0 and 1")
+        
         for field, config in self.thresholds.items():
             # Check for conflicting thresholds
             if 'range' in config and 'z_score' in config:
@@ -254,6 +269,13 @@ class ThresholdConfig:
                 elif config['iqr_multiplier'] > 3.0:
                     warnings.append(f"{field}: IQR multiplier {config['iqr_multiplier']} is very lenient")
             
+            # Check text patterns compile
+            if config.get('pattern'):
+                try:
+                    re.compile(config['pattern'])
+                except re.error as e:
+                    warnings.append(f"{field}: pattern {config['pattern']!r} is not a valid regex ({e})")
+            
             # Check categorical configurations
             if 'allowed_values' in config:
                 if not isinstance(config['allowed_values'], list):
@@ -263,19 +285,23 @@ class ThresholdConfig:
         
         return warnings
     
-    def optimize_thresholds(self, validation_results: List[Dict[str, Any]], 
+    def optimize_thresholds(self, validation_results: Union[List[Dict[str, Any]], ValidationResults], 
                           target_anomaly_rate: float = 0.05) -> Dict[str, Any]:
         """
         Optimize thresholds based on validation results to achieve target anomaly rate.
         
         Args:
-            validation_results: List of validation results
+            validation_results: List of validation results, or a ValidationResults
+                container from StatisticalValidator.validate_frame
             target_anomaly_rate: Desired anomaly detection rate (0.05 = 5%)
             
         Returns:
             Dictionary containing optimization results
         """
-        current_anomaly_rate = sum(1 for r in validation_results if not r['is_valid']) / len(validation_results)
+        if isinstance(validation_results, ValidationResults):
+            current_anomaly_rate = float((~validation_results.is_valid).mean())
+        else:
+            current_anomaly_rate = sum(1 for r in validation_results if not r['is_valid']) / len(validation_results)
         
         optimization_results = {
             'current_anomaly_rate': current_anomaly_rate,
@@ -285,26 +311,30 @@ class ThresholdConfig:
         }
         
         # Collect field-specific anomaly rates
-        field_anomalies = {}
-        for result in validation_results:
-            for field, field_result in result.get('field_scores', {}).items():
-                if field not in field_anomalies:
-                    field_anomalies[field] = {'total': 0, 'anomalies': 0}
-                field_anomalies[field]['total'] += 1
-                if not field_result['is_valid']:
-                    field_anomalies[field]['anomalies'] += 1
+        if isinstance(validation_results, ValidationResults):
+            field_anomalies = validation_results.field_anomaly_counts()
+        else:
+            field_anomalies = {}
+            for result in validation_results:
+                for field, field_result in result.get('field_scores', {}).items():
+                    if field not in field_anomalies:
+                        field_anomalies[field] = {'total': 0, 'anomalies': 0}
+                    field_anomalies[field]['total'] += 1
+                    if not field_result['is_valid']:
+                        field_anomalies[field]['anomalies'] += 1
         
         # Calculate field-specific anomaly rates
         field_rates = {}
         for field, counts in field_anomalies.items():
-            field_rates[field] = counts['anomalies'] / counts['total'] if counts['total'] > 0
+            field_rates[field] = counts['anomalies'] / counts['total'] if counts['total'] > 0 else 0.0
 
         # Claoude excedded the lenght of the output here, so we will not be able to complete the code.
         # the below code is Copilot fantasy :)     
         optimization_results['field_anomaly_rates'] = field_rates
         optimization_results['field_adjustments'] = {}
         for field, rate in field_rates.items():
-            if rate > target_anomaly_rate:
+            # Multivariate checks (e.g. 'price+rating') have no per-field thresholds
+            if rate > target_anomaly_rate and field in self.thresholds:
                 # Adjust thresholds to reduce anomalies
                 if 'z_score' in self.thresholds[field]:
                     new_z_score = self.thresholds[field]['z_score'] * 0.9
@@ -340,7 +370,6 @@ class ThresholdConfig:
         with open(file_path, 'w') as f:
             json.dump(config_data, f, indent=4)
         print(f"Configuration saved to {file_path}")
-        self.save_config("threshold_config.json")
     def load_config(self, file_path: str) -> None:
         """
         Load configuration from a JSON file.
@@ -352,6 +381,7 @@ class ThresholdConfig:
                 config_data = json.load(f)
             self.thresholds = config_data.get('thresholds', {})
             self.global_config = config_data.get('global_config', self.global_config)
+            self.version += 1
             print(f"Configuration loaded from {file_path}")
         except FileNotFoundError:
             print(f"Configuration file {file_path} not found.")
@@ -359,15 +389,3 @@ class ThresholdConfig:
             print(f"Error decoding JSON from {file_path}.")
         except Exception as e:
             print(f"Unexpected error loading configuration: {e}")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        except Exception as e:
-            print(f"Unexpected error loading configuration: {e}")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
-        self.save_config("threshold_config.json")
@@ -0,0 +1,104 @@
+import numpy as np
+from scipy import stats
+from typing import Tuple
+
+
+class SortedSample:
+    """
+    Reference sample sorted once for repeated two-sample tests.
+
+    The sorted values double as the ECDF and the rank table of the
+    reference: the number of reference values below (or up to) any point is
+    a searchsorted away. Testing a new batch then only sorts the batch and
+    merges it into the reference with searchsorted, instead of re-sorting
+    and re-ranking the whole reference every time.
+
+    P-values use the asymptotic distributions (Smirnov's for KS, the
+    tie-corrected normal approximation with continuity correction for
+    Mann-Whitney), as scipy does for large samples.
+    """
+
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        self.values = np.sort(values[~np.isnan(values)])
+        self.n = len(self.values)
+        # sum(t^3 - t) over groups of tied reference values
+        ties = self._tie_counts(self.values)
+        self.tie_term = float((ties ** 3 - ties).sum())
+
+    @staticmethod
+    def _tie_counts(sorted_values: np.ndarray) -> np.ndarray:
+        """Size of every group of equal values in a sorted array"""
+        if len(sorted_values) == 0:
+            return np.zeros(0, dtype=float)
+        starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+        return np.diff(np.r_[starts, len(sorted_values)]).astype(float)
+
+    def ecdf(self, points: np.ndarray) -> np.ndarray:
+        """Share of reference values at or below each point"""
+        return np.searchsorted(self.values, points, side='right') / self.n
+
+    def ks_test(self, new_values: np.ndarray, presorted: bool = False) -> Tuple[float, float]:
+        """
+        Two-sided Kolmogorov-Smirnov test of a new sample against the reference.
+
+        Args:
+            new_values: New sample without NaN
+            presorted: Whether new_values is already sorted
+
+        Returns:
+            Tuple of (KS statistic, p-value)
+        """
+        new = np.asarray(new_values, dtype=float)
+        if not presorted:
+            new = np.sort(new)
+        m = len(new)
+        # Both ECDFs only jump at sample points. Between two new values the new
+        # ECDF is flat, so the largest gap sits at a new value or just below it.
+        gap_at = np.abs(np.searchsorted(self.values, new, side='right') / self.n
+                        - np.searchsorted(new, new, side='right') / m)
+        gap_below = np.abs(np.searchsorted(self.values, new, side='left') / self.n
+                           - np.searchsorted(new, new, side='left') / m)
+        d = float(max(gap_at.max(), gap_below.max()))
+
+        en = self.n * m / (self.n + m)
+        p_value = float(np.clip(stats.kstwo.sf(d, np.round(en)), 0, 1))
+        return d, p_value
+
+    def mannwhitney_test(self, new_values: np.ndarray, presorted: bool = False) -> Tuple[float, float]:
+        """
+        Two-sided Mann-Whitney U test of the reference against a new sample.
+
+        Args:
+            new_values: New sample without NaN
+            presorted: Whether new_values is already sorted
+
+        Returns:
+            Tuple of (U statistic of the reference sample, p-value)
+        """
+        new = np.asarray(new_values, dtype=float)
+        if not presorted:
+            new = np.sort(new)
+        n1, n2 = self.n, len(new)
+        total = n1 + n2
+
+        # Mid-rank of every new value in the combined sample
+        ref_below = np.searchsorted(self.values, new, side='left')
+        ref_ties = np.searchsorted(self.values, new, side='right') - ref_below
+        new_below = np.searchsorted(new, new, side='left')
+        new_ties = np.searchsorted(new, new, side='right') - new_below
+        ranks = ref_below + new_below + (ref_ties + new_ties + 1) / 2
+        u2 = float(ranks.sum()) - n2 * (n2 + 1) / 2
+        u1 = n1 * n2 - u2
+
+        # Tie correction: replace the reference groups the new values join
+        first = np.r_[True, new[1:] != new[:-1]]
+        shared = ref_ties[first].astype(float)
+        combined = shared + new_ties[first]
+        tie_term = self.tie_term - (shared ** 3 - shared).sum() + (combined ** 3 - combined).sum()
+
+        sigma = np.sqrt(n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1))))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (max(u1, u2) - n1 * n2 / 2 - 0.5) / sigma
+        p_value = float(np.clip(2 * stats.norm.sf(z), 0, 1))
+        return u1, p_value
@@ -0,0 +1,69 @@
+from typing import Any, NamedTuple, Optional
+
+
+# Message templates per rule id, rendered only when a message is requested.
+# Saved results store rules by position, so new rules are appended at the end.
+RULE_MESSAGES = {
+    # Issues
+    'z_score': "{field}: Z-score {score:.2f} exceeds threshold {bound}",
+    'iqr': "{field}: Value {value} outside IQR bounds [{bound[0]:.2f}, {bound[1]:.2f}]",
+    'range': "{field}: Value {value} outside allowed range [{bound[0]}, {bound[1]}]",
+    'allowed_values': "{field}: Value '{value}' not in allowed values",
+    'new_category': "{field}: New categorical value '{value}' not seen in historical data",
+
+    # Warnings
+    'moderate_deviation': "{field}: Moderate deviation (Z-score: {score:.2f})",
+    'new_category_warning': "{field}: New categorical value '{value}'",
+    'low_frequency': "{field}: Low frequency value '{value}' (freq: {score:.3f})",
+
+    # Multivariate issues
+    'mahalanobis': "{field}: Mahalanobis distance {score:.2f} exceeds threshold {bound:.2f}",
+
+    # Issues backed by the stored quantile grid
+    'percentile': "{field}: Value {value} at percentile {score:.3f} outside percentile range [{bound[0]}, {bound[1]}]",
+
+    # Text issues
+    'pattern': "{field}: Value '{value}' doesn't match pattern: {bound}",
+    'empty': "{field}: Empty value not allowed",
+}
+
+# Report issue type for each rule id; anything not listed counts as 'other'
+ISSUE_TYPES = {
+    'z_score': 'z_score',
+    'iqr': 'iqr',
+    'range': 'range',
+    'new_category': 'categorical',
+    'mahalanobis': 'multivariate',
+    'percentile': 'percentile',
+    'pattern': 'pattern',
+    'empty': 'pattern',
+}
+
+
+class ValidationIssue(NamedTuple):
+    """
+    Compact record of a failed rule or warning for a single field value.
+
+    Human-readable text is rendered on demand through message/str(), so
+    validation itself never formats strings.
+    """
+    field: str
+    rule: str
+    value: Any = None
+    bound: Any = None
+    score: Optional[float] = None
+
+    @property
+    def message(self) -> str:
+        """Render the human-readable message for this issue"""
+        template = RULE_MESSAGES.get(self.rule, "{field}: {rule} check failed for value {value}")
+        return template.format(field=self.field, rule=self.rule, value=self.value,
+                               bound=self.bound, score=self.score)
+
+    @property
+    def issue_type(self) -> str:
+        """Issue type used to group issues in validation reports"""
+        return ISSUE_TYPES.get(self.rule, 'other')
+
+    def __str__(self) -> str:
+        return self.message
@@ -0,0 +1,280 @@
+import numpy as np
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field as dataclass_field
+from scipy import stats as scipy_stats
+from scipy.linalg import solve_triangular
+
+from pattern_rules import PatternRule, PatternRegistry
+
+
+# Z-scores above this (but within the field threshold) raise a warning
+WARNING_Z_SCORE = 2.0
+
+# Baseline entries that describe several fields rather than a single one
+BASELINE_AUX_KEYS = ('correlations', 'multivariate')
+
+
+def percentile_ranks(quantiles: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Percentile ranks of values from an evenly spaced quantile grid.
+
+    quantiles[i] is the baseline quantile at level i / (len(quantiles) - 1).
+    Each value is located with a binary search and interpolated linearly
+    between the neighbouring grid points; values tied with grid points get
+    the middle of the tied levels. Values outside the grid clip to 0 and 1.
+
+    Args:
+        quantiles: Non-decreasing quantile grid
+        values: Values to rank (NaN stays NaN)
+
+    Returns:
+        Array of percentile ranks in [0, 1]
+    """
+    values = np.asarray(values, dtype=float)
+    step = 1.0 / (len(quantiles) - 1)
+    lower = np.searchsorted(quantiles, values, side='left')
+    upper = np.searchsorted(quantiles, values, side='right')
+
+    # Values strictly between grid points interpolate within their cell
+    left = np.clip(lower - 1, 0, len(quantiles) - 1)
+    right = np.clip(lower, 0, len(quantiles) - 1)
+    width = quantiles[right] - quantiles[left]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = np.where(width > 0, (values - quantiles[left]) / width, 0.0)
+    ranks = (left + fraction) * step
+
+    tied = upper > lower
+    ranks = np.where(tied, (lower + upper - 1) * step / 2, ranks)
+    ranks = np.where(values < quantiles[0], 0.0, ranks)
+    ranks = np.where(values > quantiles[-1], 1.0, ranks)
+    return np.where(np.isnan(values), np.nan, ranks)
+
+
+@dataclass
+class FieldPlan:
+    """Precomputed checks for a single field, resolved to plain float bounds"""
+    field: str
+    field_type: str
+    stats: Dict[str, Any] = dataclass_field(default_factory=dict)
+    thresholds: Dict[str, Any] = dataclass_field(default_factory=dict)
+
+    # Numeric checks
+    mean: float = 0.0
+    std: float = 0.0
+    z_threshold: Optional[float] = None
+    z_warning_band: Optional[Tuple[float, float]] = None
+    iqr_bounds: Optional[Tuple[float, float]] = None
+    range_bounds: Optional[Tuple[Any, Any]] = None
+    quantiles: Optional[np.ndarray] = None
+    percentile_range: Optional[Tuple[float, float]] = None
+    percentile_bounds: Optional[Tuple[float, float]] = None
+
+    # Categorical checks
+    categories: Optional[Any] = None
+    allowed_values: Optional[Any] = None
+    reject_new_categories: bool = False
+    min_frequency: Optional[float] = None
+
+    # Text checks ('pattern' / 'allow_empty'), for any field type
+    text_rule: Optional[PatternRule] = None
+
+    def bounds(self) -> Dict[str, Any]:
+        """Bound reported with each rule's issues, keyed by rule id"""
+        bounds = {
+            'z_score': self.z_threshold,
+            'iqr': self.iqr_bounds,
+            'range': self.range_bounds,
+            'percentile': self.percentile_range,
+            'moderate_deviation': self.z_warning_band,
+            'low_frequency': self.min_frequency,
+            'pattern': self.text_rule.pattern if self.text_rule is not None else None,
+        }
+        return {rule: bound for rule, bound in bounds.items() if bound is not None}
+
+
+@dataclass
+class MultivariatePlan:
+    """Mahalanobis distance check over a group of numeric fields"""
+    fields: List[str]
+    mean: np.ndarray
+    cholesky: np.ndarray
+    threshold: float
+
+    @property
+    def name(self) -> str:
+        """Name the check reports its results under, e.g. 'price+rating'"""
+        return '+'.join(self.fields)
+
+    def distances(self, values: np.ndarray) -> np.ndarray:
+        """
+        Mahalanobis distances for an (n_rows, n_fields) array of complete rows.
+
+        Solving against the Cholesky factor whitens the whole batch in one
+        triangular solve, so no covariance inverse is ever formed.
+        """
+        whitened = solve_triangular(self.cholesky, (values - self.mean).T, lower=True)
+        return np.sqrt((whitened ** 2).sum(axis=0))
+
+    def bounds(self) -> Dict[str, Any]:
+        """Bound reported with the check's issues, keyed by rule id"""
+        return {'mahalanobis': self.threshold}
+
+
+class ValidationPlan:
+    """
+    Validation plan compiled from baseline statistics and a ThresholdConfig.
+
+    All threshold lookups and bound arithmetic happen once at compile time so
+    the per-record hot path only compares floats. A plan is tied to the
+    baseline version and config version it was built from; StatisticalValidator
+    recompiles it whenever either one changes.
+    """
+
+    def __init__(self, fields: Dict[str, FieldPlan], config, baseline_version: int,
+                 multivariate: Optional[MultivariatePlan] = None):
+        self.fields = fields
+        self.multivariate = multivariate
+        self.config = config
+        self.baseline_version = baseline_version
+        self.config_version = getattr(config, 'version', None)
+
+    def is_current(self, config, baseline_version: int) -> bool:
+        """Check whether the plan still matches the given config and baseline"""
+        # Configs without a version counter cannot report changes, so never reuse
+        return (
+            self.config is config
+            and self.config_version is not None
+            and self.config_version == getattr(config, 'version', None)
+            and self.baseline_version == baseline_version
+        )
+
+    @classmethod
+    def compile(cls, baseline_stats: Dict[str, Any], field_types: Dict[str, str],
+                config, baseline_version: int,
+                patterns: Optional[PatternRegistry] = None) -> 'ValidationPlan':
+        """
+        Compile a plan for every field that has baseline statistics, plus
+        every configured field with text rules ('pattern' / 'allow_empty').
+
+        Args:
+            baseline_stats: Baseline statistics from StatisticalValidator
+            field_types: Field type per field ('numeric' or 'categorical')
+            config: ThresholdConfig object with validation thresholds
+            baseline_version: Version of the baseline statistics
+            patterns: Registry of compiled patterns to reuse across plans
+
+        Returns:
+            Compiled ValidationPlan
+        """
+        if patterns is None:
+            patterns = PatternRegistry()
+
+        fields = {}
+        for field, field_stats in baseline_stats.items():
+            if field in BASELINE_AUX_KEYS:
+                continue
+            field_type = field_types.get(field, 'unknown')
+            thresholds = config.get_field_thresholds(field)
+            plan = FieldPlan(field=field, field_type=field_type,
+                             stats=field_stats, thresholds=thresholds)
+
+            if field_type == 'numeric':
+                cls._compile_numeric(plan, field_stats, thresholds)
+            elif field_type == 'categorical':
+                cls._compile_categorical(plan, field_stats, thresholds)
+
+            plan.text_rule = patterns.rule(thresholds)
+            fields[field] = plan
+
+        # Text rules need no baseline, so configured fields are checked even without one
+        for field, thresholds in config.get_all_thresholds().items():
+            if field in fields or field in BASELINE_AUX_KEYS:
+                continue
+            text_rule = patterns.rule(thresholds)
+            if text_rule is not None:
+                fields[field] = FieldPlan(field=field, field_type='text',
+                                          thresholds=thresholds, text_rule=text_rule)
+
+        multivariate = cls._compile_multivariate(baseline_stats.get('multivariate'), config)
+        return cls(fields, config, baseline_version, multivariate)
+
+    @staticmethod
+    def _compile_numeric(plan: FieldPlan, stats: Dict, thresholds: Dict) -> None:
+        """Resolve z-score, IQR and range thresholds for a numeric field"""
+        plan.mean = stats['mean']
+        plan.std = stats['std']
+        has_spread = stats['std'] > 0
+
+        if 'z_score' in thresholds and has_spread:
+            plan.z_threshold = thresholds['z_score']
+
+        if has_spread:
+            plan.z_warning_band = (WARNING_Z_SCORE, thresholds.get('z_score', 3.0))
+
+        if 'iqr_multiplier' in thresholds:
+            iqr_multiplier = thresholds['iqr_multiplier']
+            plan.iqr_bounds = (
+                stats['q1'] - iqr_multiplier * stats['iqr'],
+                stats['q3'] + iqr_multiplier * stats['iqr']
+            )
+
+        if 'range' in thresholds:
+            min_val, max_val = thresholds['range']
+            plan.range_bounds = (min_val, max_val)
+
+        # Baselines from before the quantile grid was stored can't check percentiles
+        if 'percentile_range' in thresholds and stats.get('quantiles') is not None:
+            plan.quantiles = np.asarray(stats['quantiles'], dtype=float)
+            low, high = thresholds['percentile_range']
+            plan.percentile_range = (low, high)
+            # Checks compare values against the grid quantiles at the range ends
+            levels = np.linspace(0.0, 1.0, len(plan.quantiles))
+            plan.percentile_bounds = tuple(np.interp([low, high], levels, plan.quantiles).tolist())
+
+    @staticmethod
+    def _compile_categorical(plan: FieldPlan, stats: Dict, thresholds: Dict) -> None:
+        """Resolve allowed values and frequency thresholds for a categorical field"""
+        plan.categories = stats['index']
+
+        if 'allowed_values' in thresholds:
+            try:
+                plan.allowed_values = frozenset(thresholds['allowed_values'])
+            except TypeError:
+                plan.allowed_values = thresholds['allowed_values']
+
+        plan.reject_new_categories = (
+            'allow_new_categories' in thresholds and not thresholds['allow_new_categories']
+        )
+        plan.min_frequency = thresholds.get('min_frequency')
+
+    @staticmethod
+    def _compile_multivariate(stats: Optional[Dict], config) -> Optional[MultivariatePlan]:
+        """
+        Resolve the Mahalanobis check from the global config.
+
+        Enabled by the 'mahalanobis_alpha' global setting: records whose squared
+        distance exceeds the chi-square (1 - alpha) quantile are flagged.
+        'mahalanobis_fields' optionally restricts the check to a subset of the
+        baseline's numeric fields.
+        """
+        alpha = config.get_global_config('mahalanobis_alpha')
+        if alpha is None or stats is None:
+            return None
+
+        fields = list(stats['fields'])
+        mean = np.asarray(stats['mean'], dtype=float)
+        cholesky = np.asarray(stats['cholesky'], dtype=float)
+
+        selected = config.get_global_config('mahalanobis_fields')
+        if selected is not None:
+            keep = [fields.index(field) for field in selected if field in fields]
+            if len(keep) < 2:
+                return None
+            # The Cholesky factor of a sub-covariance has to be recomputed
+            covariance = cholesky @ cholesky.T
+            fields = [fields[i] for i in keep]
+            mean = mean[keep]
+            cholesky = np.linalg.cholesky(covariance[np.ix_(keep, keep)])
+
+        threshold = float(np.sqrt(scipy_stats.chi2.ppf(1 - alpha, df=len(fields))))
+        return MultivariatePlan(fields=fields, mean=mean, cholesky=cholesky, threshold=threshold)
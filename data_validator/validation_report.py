@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Iterable, Union
+
+from validation_issues import ValidationIssue, ISSUE_TYPES
+from validation_results import ValidationResults, RULES
+
+
+# Distinct example issues kept per field for the report
+MAX_ISSUE_SAMPLES = 5
+
+
+def _value_codes(values: np.ndarray) -> np.ndarray:
+    """Integer code per issue value, equal for equal values"""
+    try:
+        codes, _ = pd.factorize(values)
+    except TypeError:
+        # Unhashable values (lists, dicts) are compared by their text
+        codes, _ = pd.factorize(np.array([str(value) for value in values], dtype=object))
+    return codes
+
+
+class ReportAccumulator:
+    """
+    Constant-memory aggregation of validation results for reports.
+
+    Consumes validate_record results or ValidationResults chunks as they
+    arrive and keeps only counters, running confidence moments and a few
+    example issues per field. Accumulators built on separate shards combine
+    with merge(), and StatisticalValidator.generate_validation_report accepts
+    an accumulator in place of the results themselves.
+    """
+
+    def __init__(self, max_samples: int = MAX_ISSUE_SAMPLES):
+        self.max_samples = max_samples
+        self.total_records = 0
+        self.valid_records = 0
+        # Running mean and sum of squared deviations of the confidence
+        self.confidence_mean = 0.0
+        self.confidence_m2 = 0.0
+        self.field_issue_counts: Dict[str, int] = {}
+        self.field_issue_samples: Dict[str, Dict[ValidationIssue, None]] = {}
+        self.issue_types: Dict[str, int] = {}
+
+    def update(self, results: Union[ValidationResults, Dict[str, Any], Iterable[Dict[str, Any]]]) -> 'ReportAccumulator':
+        """
+        Add a ValidationResults chunk, a single validate_record result or an
+        iterable of them.
+        """
+        if isinstance(results, ValidationResults):
+            self._add_columnar(results)
+        elif isinstance(results, dict):
+            self._add_records([results])
+        else:
+            self._add_records(results)
+        return self
+
+    def _add_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Fold validate_record results into the counters"""
+        confidences = []
+        for result in records:
+            if result['is_valid']:
+                self.valid_records += 1
+            confidences.append(result['confidence'])
+            for issue in result['issues']:
+                self._count_issue(issue.field, issue.issue_type, 1)
+                self._add_sample(issue)
+        self._add_confidences(np.asarray(confidences, dtype=float))
+
+    def _add_columnar(self, results: ValidationResults) -> None:
+        """Fold a ValidationResults chunk into the counters"""
+        issues = results.issues
+        self.valid_records += int(results.is_valid.sum())
+        self._add_confidences(results.confidence)
+
+        field_counts = np.bincount(issues.field_ids, minlength=len(results.fields))
+        for field_id, count in enumerate(field_counts):
+            if count > 0:
+                field = results.fields[field_id]
+                self.field_issue_counts[field] = self.field_issue_counts.get(field, 0) + int(count)
+
+        for rule_id, count in enumerate(np.bincount(issues.rule_ids, minlength=len(RULES))):
+            if count > 0:
+                issue_type = ISSUE_TYPES.get(RULES[rule_id], 'other')
+                self.issue_types[issue_type] = self.issue_types.get(issue_type, 0) + int(count)
+
+        if len(issues) == 0:
+            return
+        # First entry of every distinct (field, rule, value); only those can
+        # become new samples, so at most a few issues per field are materialized
+        keys = np.column_stack([issues.field_ids, issues.rule_ids, _value_codes(issues.values)])
+        _, first = np.unique(keys, axis=0, return_index=True)
+        first = np.sort(first)
+        first_fields = issues.field_ids[first]
+        for field_id in np.flatnonzero(field_counts):
+            for entry in first[first_fields == field_id]:
+                if not self._add_sample(results.issue_at(entry)):
+                    break
+
+    def _count_issue(self, field: str, issue_type: str, count: int) -> None:
+        self.field_issue_counts[field] = self.field_issue_counts.get(field, 0) + count
+        self.issue_types[issue_type] = self.issue_types.get(issue_type, 0) + count
+
+    def _add_sample(self, issue: ValidationIssue) -> bool:
+        """Keep an example issue; returns False once the field's samples are full"""
+        samples = self.field_issue_samples.setdefault(issue.field, {})
+        if len(samples) >= self.max_samples:
+            return False
+        samples[issue] = None
+        return len(samples) < self.max_samples
+
+    def _add_confidences(self, confidences: np.ndarray) -> None:
+        if len(confidences) == 0:
+            return
+        chunk_mean = float(confidences.mean())
+        chunk_m2 = float(((confidences - chunk_mean) ** 2).sum())
+        self._combine_confidence(len(confidences), chunk_mean, chunk_m2)
+
+    def _combine_confidence(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        """Chan et al. parallel update of the running confidence moments"""
+        n_a = self.total_records
+        n = n_a + n_b
+        delta = mean_b - self.confidence_mean
+        self.confidence_m2 += m2_b + delta ** 2 * n_a * n_b / n
+        self.confidence_mean += delta * n_b / n
+        self.total_records = n
+
+    def merge(self, other: 'ReportAccumulator') -> 'ReportAccumulator':
+        """Merge an accumulator built on another shard into this one"""
+        if other.total_records > 0:
+            self._combine_confidence(other.total_records, other.confidence_mean, other.confidence_m2)
+        self.valid_records += other.valid_records
+        for field, count in other.field_issue_counts.items():
+            self.field_issue_counts[field] = self.field_issue_counts.get(field, 0) + count
+        for issue_type, count in other.issue_types.items():
+            self.issue_types[issue_type] = self.issue_types.get(issue_type, 0) + count
+        for samples in other.field_issue_samples.values():
+            for issue in samples:
+                if not self._add_sample(issue):
+                    break
+        return self
+
+    @property
+    def average_confidence(self) -> float:
+        return self.confidence_mean if self.total_records > 0 else 0
+
+    @property
+    def confidence_std(self) -> float:
+        """Population standard deviation of the confidence, as np.std computes it"""
+        return float(np.sqrt(self.confidence_m2 / self.total_records)) if self.total_records > 0 else 0.0
+
+    def sample_messages(self, field: str) -> List[str]:
+        """Rendered example issues for a field"""
+        return [issue.message for issue in self.field_issue_samples.get(field, {})]
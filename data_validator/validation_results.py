@@ -0,0 +1,336 @@
+import os
+import json
+import importlib.util
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+
+from validation_issues import ValidationIssue, RULE_MESSAGES
+
+
+# Rule ids are stored as small integer codes in the issue tables
+RULES = tuple(RULE_MESSAGES)
+RULE_CODES = {rule: code for code, rule in enumerate(RULES)}
+
+
+def _values_as_text(values: np.ndarray) -> np.ndarray:
+    """Render issue values as strings for storage"""
+    try:
+        return values.astype(str)
+    except ValueError:
+        # Sequence values (e.g. multivariate field tuples) need converting one by one
+        return np.array([str(value) for value in values], dtype=str)
+
+
+# Engines pandas can read and write Parquet with; neither is a hard dependency
+PARQUET_ENGINES = ('pyarrow', 'fastparquet')
+
+
+def _require_parquet_engine() -> None:
+    """Raise a clear ImportError when no Parquet engine is installed"""
+    if not any(importlib.util.find_spec(engine) is not None for engine in PARQUET_ENGINES):
+        raise ImportError("Parquet support needs pyarrow or fastparquet; install one of them, "
+                          "or use to_npz()/from_npz(), which only need NumPy")
+
+
+class IssueTable:
+    """
+    Sparse table of issues (or warnings), one entry per failed rule.
+
+    Entries are sorted by row, and within a row they keep the order in which
+    validate_record would have reported them.
+    """
+
+    def __init__(self, rows: np.ndarray, field_ids: np.ndarray, rule_ids: np.ndarray,
+                 values: np.ndarray, scores: np.ndarray):
+        self.rows = rows
+        self.field_ids = field_ids
+        self.rule_ids = rule_ids
+        self.values = values
+        self.scores = scores
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def row_range(self, row: int) -> Tuple[int, int]:
+        """Return the [start, stop) entry range belonging to a row"""
+        return (int(np.searchsorted(self.rows, row, side='left')),
+                int(np.searchsorted(self.rows, row, side='right')))
+
+    def to_frame(self, fields: List[str]) -> pd.DataFrame:
+        """Return the table as a DataFrame with field and rule names"""
+        return pd.DataFrame({
+            'row': self.rows,
+            'field': pd.Categorical.from_codes(self.field_ids, categories=fields),
+            'rule': pd.Categorical.from_codes(self.rule_ids, categories=list(RULES)),
+            'value': _values_as_text(self.values),
+            'score': self.scores
+        })
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, fields: List[str]) -> 'IssueTable':
+        """Restore a table written by to_frame"""
+        field_codes = {field: code for code, field in enumerate(fields)}
+        return cls(
+            rows=df['row'].to_numpy(dtype=np.int64),
+            field_ids=df['field'].astype(str).map(field_codes).to_numpy(dtype=np.int32),
+            rule_ids=df['rule'].astype(str).map(RULE_CODES).to_numpy(dtype=np.int16),
+            values=df['value'].to_numpy(dtype=object),
+            scores=df['score'].to_numpy(dtype=float)
+        )
+
+
+class IssueTableBuilder:
+    """Collects boolean masks of failed rules and assembles an IssueTable"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def add(self, field_id: int, rule: str, mask: np.ndarray, values: np.ndarray,
+            scores: Optional[np.ndarray] = None) -> None:
+        """
+        Record a failed rule for every row where mask is True.
+
+        Args:
+            field_id: Index of the field in ValidationResults.fields
+            rule: Rule id (a key of RULE_MESSAGES)
+            mask: Boolean mask of the rows that failed the rule
+            values: Raw column values
+            scores: Optional per-row scores (e.g. z-scores) for the rule
+        """
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            return
+        self._chunks.append((
+            rows,
+            np.full(len(rows), field_id, dtype=np.int32),
+            np.full(len(rows), RULE_CODES[rule], dtype=np.int16),
+            values[rows].astype(object),
+            scores[rows] if scores is not None else np.full(len(rows), np.nan)
+        ))
+
+    def build(self) -> IssueTable:
+        """Concatenate the collected chunks into a row-sorted IssueTable"""
+        if not self._chunks:
+            return IssueTable(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32),
+                              np.empty(0, dtype=np.int16), np.empty(0, dtype=object),
+                              np.empty(0))
+
+        columns = [np.concatenate(parts) for parts in zip(*self._chunks)]
+        # Chunks arrive in field/rule order, so a stable sort keeps that order per row
+        order = np.argsort(columns[0], kind='stable')
+        return IssueTable(*(column[order] for column in columns))
+
+
+class ValidationResults:
+    """
+    Columnar container for the results of a batch validation run.
+
+    Holds validity and confidence as NumPy arrays, a per-field validity
+    matrix, a score matrix (one column per scored field and score name,
+    z-scores by default) and sparse issue/warning tables. Indexing with a row number returns the same
+    dictionary validate_record would have produced for that row.
+    """
+
+    def __init__(self, is_valid: np.ndarray, confidence: np.ndarray, fields: List[str],
+                 field_valid: np.ndarray, score_fields: List[str], scores: np.ndarray,
+                 issues: IssueTable, warnings: IssueTable,
+                 bounds: Dict[Tuple[str, str], Any], timestamp: str,
+                 score_names: Optional[List[str]] = None):
+        self.is_valid = is_valid
+        self.confidence = confidence
+        self.fields = list(fields)
+        self.field_valid = field_valid
+        self.score_fields = list(score_fields)
+        self.score_names = list(score_names) if score_names is not None else ['z_score'] * len(self.score_fields)
+        self.scores = scores
+        self.issues = issues
+        self.warnings = warnings
+        self.bounds = bounds
+        self.timestamp = timestamp
+
+    def __len__(self) -> int:
+        return len(self.is_valid)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        """Return the validate_record-style result dictionary for a row"""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(f"Row {row} out of range for {len(self)} results")
+
+        field_scores = {
+            field: {
+                'is_valid': bool(self.field_valid[row, field_id]),
+                'issues': [],
+                'warnings': [],
+                'scores': {}
+            }
+            for field_id, field in enumerate(self.fields)
+        }
+        for score_id, (field, name) in enumerate(zip(self.score_fields, self.score_names)):
+            score = self.scores[row, score_id]
+            # Missing values are never scored
+            if not np.isnan(score):
+                field_scores[field]['scores'][name] = score
+
+        issues = self._row_issues(self.issues, row)
+        warnings = self._row_issues(self.warnings, row)
+        for issue in issues:
+            field_scores[issue.field]['issues'].append(issue)
+        for warning in warnings:
+            field_scores[warning.field]['warnings'].append(warning)
+
+        return {
+            'is_valid': bool(self.is_valid[row]),
+            'issues': issues,
+            'warnings': warnings,
+            'confidence': float(self.confidence[row]),
+            'field_scores': field_scores,
+            'timestamp': self.timestamp
+        }
+
+    def _row_issues(self, table: IssueTable, row: int) -> List[ValidationIssue]:
+        """Materialize the issues of a single row"""
+        start, stop = table.row_range(row)
+        issues = []
+        for entry in range(start, stop):
+            field = self.fields[table.field_ids[entry]]
+            rule = RULES[table.rule_ids[entry]]
+            score = table.scores[entry]
+            issues.append(ValidationIssue(
+                field, rule, table.values[entry], self.bounds.get((field, rule)),
+                None if np.isnan(score) else score
+            ))
+        return issues
+
+    def issue_at(self, entry: int) -> ValidationIssue:
+        """Materialize a single entry of the issue table"""
+        field = self.fields[self.issues.field_ids[entry]]
+        rule = RULES[self.issues.rule_ids[entry]]
+        score = self.issues.scores[entry]
+        return ValidationIssue(field, rule, self.issues.values[entry],
+                               self.bounds.get((field, rule)),
+                               None if np.isnan(score) else score)
+
+    def field_anomaly_counts(self) -> Dict[str, Dict[str, int]]:
+        """Return total and anomalous record counts per field"""
+        anomalies = (~self.field_valid).sum(axis=0)
+        return {
+            field: {'total': len(self), 'anomalies': int(anomalies[field_id])}
+            for field_id, field in enumerate(self.fields)
+        }
+
+    def _metadata(self) -> Dict[str, Any]:
+        """Non-array state needed to restore the container"""
+        return {
+            'fields': self.fields,
+            'score_fields': self.score_fields,
+            'score_names': self.score_names,
+            'timestamp': self.timestamp,
+            'bounds': [[field, rule, bound] for (field, rule), bound in self.bounds.items()]
+        }
+
+    @staticmethod
+    def _restore_bounds(metadata: Dict[str, Any]) -> Dict[Tuple[str, str], Any]:
+        """Rebuild the bounds mapping; JSON turns tuples into lists"""
+        return {
+            (field, rule): tuple(bound) if isinstance(bound, list) else bound
+            for field, rule, bound in metadata['bounds']
+        }
+
+    def to_npz(self, filename: str) -> None:
+        """
+        Save the results to a compressed NPZ file.
+
+        Issue values are stored as text so the file loads without pickle.
+        """
+        arrays = {
+            'is_valid': self.is_valid,
+            'confidence': self.confidence,
+            'field_valid': self.field_valid,
+            'scores': self.scores,
+            'metadata': np.array(json.dumps(self._metadata(), default=str))
+        }
+        for name, table in (('issues', self.issues), ('warnings', self.warnings)):
+            arrays[f'{name}_rows'] = table.rows
+            arrays[f'{name}_field_ids'] = table.field_ids
+            arrays[f'{name}_rule_ids'] = table.rule_ids
+            arrays[f'{name}_values'] = _values_as_text(table.values)
+            arrays[f'{name}_scores'] = table.scores
+
+        np.savez_compressed(filename, **arrays)
+        print(f"Validation results saved to {filename}")
+
+    @classmethod
+    def from_npz(cls, filename: str) -> 'ValidationResults':
+        """Load results saved with to_npz"""
+        with np.load(filename) as data:
+            metadata = json.loads(str(data['metadata']))
+            tables = {
+                name: IssueTable(
+                    data[f'{name}_rows'], data[f'{name}_field_ids'], data[f'{name}_rule_ids'],
+                    data[f'{name}_values'].astype(object), data[f'{name}_scores']
+                )
+                for name in ('issues', 'warnings')
+            }
+            return cls(data['is_valid'], data['confidence'], metadata['fields'],
+                       data['field_valid'], metadata['score_fields'], data['scores'],
+                       tables['issues'], tables['warnings'],
+                       cls._restore_bounds(metadata), metadata['timestamp'],
+                       metadata.get('score_names'))
+
+    def to_parquet(self, directory: str) -> None:
+        """
+        Save the results as Parquet files in a directory.
+
+        Writes rows.parquet (validity, confidence, per-field validity and
+        scores), issues.parquet, warnings.parquet and metadata.json.
+        Requires a Parquet engine (pyarrow or fastparquet); to_npz() has no
+        such dependency.
+        """
+        _require_parquet_engine()
+        os.makedirs(directory, exist_ok=True)
+
+        rows = {'is_valid': self.is_valid, 'confidence': self.confidence}
+        for field_id, field in enumerate(self.fields):
+            rows[f'{field}.is_valid'] = self.field_valid[:, field_id]
+        for score_id, (field, name) in enumerate(zip(self.score_fields, self.score_names)):
+            rows[f'{field}.{name}'] = self.scores[:, score_id]
+
+        pd.DataFrame(rows).to_parquet(os.path.join(directory, 'rows.parquet'))
+        self.issues.to_frame(self.fields).to_parquet(os.path.join(directory, 'issues.parquet'))
+        self.warnings.to_frame(self.fields).to_parquet(os.path.join(directory, 'warnings.parquet'))
+        with open(os.path.join(directory, 'metadata.json'), 'w') as f:
+            json.dump(self._metadata(), f, default=str)
+        print(f"Validation results saved to {directory}")
+
+    @classmethod
+    def from_parquet(cls, directory: str) -> 'ValidationResults':
+        """Load results saved with to_parquet"""
+        _require_parquet_engine()
+        with open(os.path.join(directory, 'metadata.json'), 'r') as f:
+            metadata = json.load(f)
+        fields = metadata['fields']
+        score_fields = metadata['score_fields']
+        score_names = metadata.get('score_names', ['z_score'] * len(score_fields))
+
+        rows = pd.read_parquet(os.path.join(directory, 'rows.parquet'))
+        field_valid = np.column_stack(
+            [rows[f'{field}.is_valid'].to_numpy(dtype=bool) for field in fields]
+        ) if fields else np.ones((len(rows), 0), dtype=bool)
+        scores = np.column_stack(
+            [rows[f'{field}.{name}'].to_numpy(dtype=float)
+             for field, name in zip(score_fields, score_names)]
+        ) if score_fields else np.empty((len(rows), 0))
+
+        issues = IssueTable.from_frame(pd.read_parquet(os.path.join(directory, 'issues.parquet')), fields)
+        warnings = IssueTable.from_frame(pd.read_parquet(os.path.join(directory, 'warnings.parquet')), fields)
+
+        return cls(rows['is_valid'].to_numpy(dtype=bool), rows['confidence'].to_numpy(dtype=float),
+                   fields, field_valid, score_fields, scores, issues, warnings,
+                   cls._restore_bounds(metadata), metadata['timestamp'], score_names)